@@ -0,0 +1,214 @@
+"""The JSON API: gauge, forecast and waste data routes, job status and health probes.
+
+Serve it alone with ``gunicorn api:app``; it loads neither the dashboards
+nor the forecasting stack. ``main`` adds the dashboards on the same app.
+"""
+from flask import Flask, Response, jsonify, request
+from flask_cors import CORS
+from app.routes.dash_forecast import bin_forecasts
+from app.routes.fill_level import fill_level_bp
+from app.engine import db, forecast_jobs, jobs
+from app.engine.metrics import render_metrics
+from app.routes.forecast import forecasts, refresh_forecasts
+import asyncio
+from datetime import timezone
+import os
+from check_bin_fill_levels import check_bin_fill_levels
+app = Flask(__name__)
+
+# Set to 1 to also hold readiness until both forecast caches hold a result (needs a monitor or train.py)
+READYZ_REQUIRE_FORECASTS = os.getenv('READYZ_REQUIRE_FORECASTS', '0') == '1'
+
+
+CORS(app, resources={
+    r"/*": {"origins": {"https://ebasura.online", "https://www.ebasura.online", "http://localhost"}}})
+
+app.register_blueprint(fill_level_bp)
+
+
+@app.route('/')
+def hello_world():  
+    return 'Hello World!'
+
+
+@app.route('/healthz')
+def healthz():
+    # Liveness only: the process is up and serving requests
+    return jsonify({"status": "ok"})
+
+
+@app.route('/readyz')
+def readyz():
+    """Ready once the database answers; forecast caches are reported, and required with READYZ_REQUIRE_FORECASTS."""
+    checks = {
+        'database': db.fetch_one('SELECT 1') is not None,  # fetch_one logs errors and returns None
+        'forecast': forecasts.get() is not None,
+        'dashboard_forecast': bin_forecasts.get() is not None,
+    }
+    required = checks if READYZ_REQUIRE_FORECASTS else {'database': checks['database']}
+    ready = all(required.values())
+    response = jsonify({"status": "ready" if ready else "starting", "checks": checks})
+    response.status_code = 200 if ready else 503
+    return response
+
+
+@app.route('/metrics')
+def metrics():
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/forecast-data')
+def forecast_data():
+    # Served from the store; a missing or stale forecast is recomputed on the job runner, never per request
+    entry = forecasts.get()
+    if entry is None or forecasts.is_stale():
+        forecast_jobs.submit('forecast', refresh_forecasts)
+    if entry is None:
+        response = jsonify({"error": "Forecast is being computed"})
+        response.status_code = 503
+        response.headers['Retry-After'] = '30'
+        return response
+    response = Response(entry['body'], mimetype='application/json')
+    response.set_etag(entry['etag'])
+    response.last_modified = entry['computed_at'].astimezone(timezone.utc)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+@app.route('/api/getWasteData', methods=['GET'])
+def get_waste_data():
+    year = request.args.get('year')
+    bin_id = request.args.get('binId')
+
+    query = """
+        SELECT 
+            YEAR(waste_data.timestamp) AS year,
+            MONTH(waste_data.timestamp) AS month, 
+            waste_bins.bin_id AS bin_name, 
+            waste_type.name AS waste_type_name, 
+            COUNT(*) AS count 
+        FROM waste_data 
+        INNER JOIN waste_bins ON waste_bins.bin_id = waste_data.bin_id 
+        INNER JOIN waste_type ON waste_type.waste_type_id = waste_data.waste_type_id 
+        WHERE 
+            YEAR(waste_data.timestamp) = %s AND
+            waste_bins.bin_id = %s
+        GROUP BY 
+            YEAR(waste_data.timestamp), 
+            MONTH(waste_data.timestamp), 
+            waste_bins.bin_id, 
+            waste_type.name 
+        ORDER BY 
+            YEAR(waste_data.timestamp), 
+            MONTH(waste_data.timestamp);
+    """
+
+    result = db.fetch(query, (year, bin_id), ttl=30)
+    
+    monthly_waste_data = {
+        'Recyclable': [0] * 12,   
+        'Non-Recyclable': [0] * 12 
+    }
+
+    if result:
+        for row in result:
+            month_index = row['month'] - 1 
+            waste_type_name = row['waste_type_name']
+            count = row['count']
+            
+            if waste_type_name == 'Recyclable':
+                monthly_waste_data['Recyclable'][month_index] += count
+            elif waste_type_name == 'Non-Recyclable':
+                monthly_waste_data['Non-Recyclable'][month_index] += count
+
+        # Prepare the response
+        response = {
+            'series': [
+                {
+                    'name': 'Recyclable',
+                    'data': monthly_waste_data['Recyclable']
+                },
+                {
+                    'name': 'Non-Recyclable',
+                    'data': monthly_waste_data['Non-Recyclable']
+                }
+            ],
+            'chart': {
+                'height': 350,
+                'type': 'line',
+                'dropShadow': {
+                    'enabled': True,
+                    'color': '#000',
+                    'top': 18,
+                    'left': 7,
+                    'blur': 10,
+                    'opacity': 0.2
+                },
+                'zoom': {
+                    'enabled': False
+                },
+                'toolbar': {
+                    'show': False
+                }
+            },
+            'colors': ['#77B6EA', '#545454'],
+            'dataLabels': {
+                'enabled': True,
+            },
+            'stroke': {
+                'curve': 'smooth'
+            },
+            'title': {
+                'text': 'Amount of Waste Segregated',
+                'align': 'left'
+            },
+            'grid': {
+                'borderColor': '#e7e7e7',
+                'row': {
+                    'colors': ['#f3f3f3', 'transparent'], 
+                    'opacity': 0.5
+                },
+            },
+            'markers': {
+                'size': 1
+            },
+            'xaxis': {
+                'categories': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+                'title': {
+                    'text': 'Month'
+                }
+            },
+            'yaxis': {
+                'title': {
+                    'text': 'Trash Data'
+                },
+                'min': 5,
+                'max': 100
+            },
+            'legend': {
+                'position': 'top',
+                'horizontalAlign': 'right',
+                'floating': True,
+                'offsetY': -25,
+                'offsetX': -5
+            }
+        }
+
+        return jsonify(response)
+    else:
+        return jsonify({
+            'error': 'No data found'
+        })
+
+@app.route("/run_check", methods=["GET"])
+def run_check():
+    job, created = jobs.submit('run_check', lambda: asyncio.run(check_bin_fill_levels()))
+    status = "Single check started" if created else "Check already running"
+    return jsonify({"status": status, "job_id": job['id']}), 202
+
+
+@app.route("/run_check/<job_id>", methods=["GET"])
+def run_check_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
@@ -1,32 +1,70 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+
+class SMSDeliveryError(Exception):
+    """Raised when the SMS gateway rejects or fails to accept a message."""
+
+    def __init__(self, message, retriable=False):
+        super().__init__(message)
+        self.retriable = retriable
+
 
 class PhilSMSClient:
-    def __init__(self, token, sender_id):
+    def __init__(self, token, sender_id, url="https://app.philsms.com/api/v3/sms/send", timeout=10, pool_size=4):
         self.token = token
         self.sender_id = sender_id
-        self.url = "https://app.philsms.com/api/v3/sms/send"
+        self.url = url
+        self.timeout = timeout
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.token}"
         }
+        # One keep-alive session shared by every send
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def send_sms(self, recipient, message):
+    def deliver(self, recipient, message):
+        """Send a message and return the gateway's ``data`` payload.
+
+        Raises ``SMSDeliveryError``; ``retriable`` is set for connection
+        errors and connect timeouts, HTTP 429 and 5xx responses. A read
+        timeout is final: the gateway may already have sent the message.
+        """
         send_data = {
             'sender_id': self.sender_id,
             'recipient': recipient,
             'message': message
         }
-        response = requests.post(self.url, headers=self.headers, data=json.dumps(send_data))
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            if response_data.get("status") == "success":
-                print("Message was successfully delivered.")
-                print(f"Message UID: {response_data['data']['uid']}")
-                print(f"Cost: {response_data['data']['cost']}")
-            else:
-                print(f"Failed to send message: {response_data.get('message')}")
-        else:
-            print(f"HTTP Error: {response.status_code}")
-            print(response.text)
+        try:
+            response = self.session.post(self.url, data=json.dumps(send_data), timeout=self.timeout)
+        except requests.ConnectionError as e:
+            # Includes ConnectTimeout; the request never reached the gateway
+            raise SMSDeliveryError(f"Request failed: {e}", retriable=True) from e
+        except requests.Timeout as e:
+            raise SMSDeliveryError(f"Request timed out: {e}") from e
+
+        if response.status_code != 200:
+            retriable = response.status_code == 429 or response.status_code >= 500
+            raise SMSDeliveryError(f"HTTP Error: {response.status_code} {response.text}", retriable=retriable)
+
+        response_data = response.json()
+        if response_data.get("status") != "success":
+            raise SMSDeliveryError(f"Failed to send message: {response_data.get('message')}")
+        return response_data.get('data', {})
+
+    def send_sms(self, recipient, message):
+        try:
+            data = self.deliver(recipient, message)
+        except SMSDeliveryError as e:
+            print(str(e))
+            return False
+
+        print("Message was successfully delivered.")
+        print(f"Message UID: {data.get('uid')}")
+        print(f"Cost: {data.get('cost')}")
+        return True
@@ -1,25 +1,43 @@
+import os
+
+from . import metrics
+from .cache import QueryCache
 from .database import Database
+from .jobs import JobRunner
+from .rolling import FillLevelWindows
+from .settings import SettingsProvider
+
+# Cached reads are never older than this many seconds, whatever TTL they ask for.
+QUERY_CACHE_MAX_STALENESS = float(os.getenv('QUERY_CACHE_MAX_STALENESS', 30))
+# How often (seconds) cached system settings are checked for changes.
+SETTINGS_CHECK_INTERVAL = float(os.getenv('SETTINGS_CHECK_INTERVAL', 10))
+# Database calls at least this slow (seconds) are logged with their EXPLAIN plan.
+SLOW_QUERY_THRESHOLD = float(os.getenv('SLOW_QUERY_THRESHOLD', 1.0))
 
 db = Database(
     '139.99.97.250',
     'ebasura',
     'kWeGKUsHM1nNIf-P',
-    'monitoring_system'
+    'monitoring_system',
+    cache=QueryCache(max_entries=256, max_staleness=QUERY_CACHE_MAX_STALENESS),
+    slow_query_threshold=SLOW_QUERY_THRESHOLD
 )
 
+# Cached system_settings, shared by the monitor, forecasts and routes
+settings = SettingsProvider(db, check_interval=SETTINGS_CHECK_INTERVAL)
+
+# Latest readings per bin, shared by the monitor and the gauge endpoint
+fill_level_windows = FillLevelWindows(db, size=10)
+
+# Manual checks run here so they never hold up a WSGI worker
+jobs = JobRunner(max_workers=2)
+
+# Forecast refreshes queue up on their own worker, so a slow refresh never delays a manual check
+forecast_jobs = JobRunner(max_workers=1)
 
-def fetch_waste_bin_levels(bin_id):
-    global db
-    sql = """
-    SELECT * 
-    FROM waste_level
-    INNER JOIN waste_type ON waste_type.waste_type_id = waste_level.waste_type_id
-    WHERE waste_level.bin_id = %s
-    """
-    args = (bin_id,)
-    rows = db.fetch(sql, args)
-
-    if rows:
-        return rows
-    else:
-        return []
\ No newline at end of file
+metrics.callback_gauge(
+    'db_query_cache', 'Query cache size and event counts.',
+    lambda: {(name,): value for name, value in db.cache.stats().items()}, ('stat',))
+metrics.callback_gauge(
+    'db_pool_connections', 'Open database connections by state.',
+    lambda: {(state,): count for state, count in db.pool_stats().items()}, ('state',))
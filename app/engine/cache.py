@@ -0,0 +1,110 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r'\s+')
+_READ_TABLES = re.compile(r'\b(?:from|join)\s+`?(\w+)`?', re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    r'^\s*(?:insert\s+(?:ignore\s+)?into|replace\s+into|update|delete\s+from|truncate(?:\s+table)?)\s+`?(\w+)`?',
+    re.IGNORECASE)
+
+
+def normalize_sql(query):
+    """Collapse whitespace and drop a trailing semicolon so equivalent queries share a key."""
+    return _WHITESPACE.sub(' ', query).strip().rstrip(';').rstrip()
+
+
+def read_tables(query):
+    """Return the lower-cased names of the tables a SELECT query reads from."""
+    return frozenset(table.lower() for table in _READ_TABLES.findall(query))
+
+
+def written_table(query):
+    """Return the lower-cased name of the table a write statement modifies, if any."""
+    match = _WRITE_TABLE.match(query)
+    return match.group(1).lower() if match else None
+
+
+class QueryCache:
+    """A bounded, thread-safe LRU cache of query results with per-entry TTLs.
+
+    Entries are keyed by normalized SQL plus arguments and remember the
+    tables they read from, so a write to a table can invalidate every
+    result that depends on it. No entry lives longer than ``max_staleness``
+    seconds, whatever TTL the caller asks for.
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries=256, default_ttl=10.0, max_staleness=60.0):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.max_staleness = max_staleness
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # key -> (expires_at, tables, value)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kind, query, args):
+        return kind, normalize_sql(query), repr(args)
+
+    def get(self, key):
+        """Return ``(True, value)`` for a fresh entry, otherwise ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[2]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, ttl=None):
+        """Store a result for ``ttl`` seconds, capped at ``max_staleness``."""
+        ttl = self.default_ttl if ttl is None else ttl
+        if self.max_staleness is not None:
+            ttl = min(ttl, self.max_staleness)
+        if ttl <= 0:
+            return
+        tables = read_tables(key[1])
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, tables, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, tables):
+        """Drop every entry that reads from any of ``tables``."""
+        tables = {table.lower() for table in tables}
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def invalidate_for(self, query):
+        """Invalidate the entries affected by a write statement."""
+        table = written_table(query)
+        if table:
+            self.invalidate([table])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
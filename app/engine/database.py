@@ -1,13 +1,85 @@
+import contextlib
+import logging
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
 import pymysql  # type: ignore
 
+from . import metrics
+from .cache import normalize_sql
+from .pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+QUERY_DURATION = metrics.histogram(
+    'db_query_duration_seconds', 'Wall-clock time of database calls.',
+    metrics.DURATION_BUCKETS, ('operation', 'caller'))
+QUERY_ROWS = metrics.histogram(
+    'db_query_rows', 'Rows returned or affected per database call.',
+    metrics.ROW_BUCKETS, ('operation', 'caller'))
+QUERY_ROW_RATE = metrics.histogram(
+    'db_query_rows_per_second', 'Rows returned or affected per second of database time.',
+    metrics.RATE_BUCKETS, ('operation', 'caller'))
+QUERY_ERRORS = metrics.counter(
+    'db_query_errors_total', 'Database calls that raised an error.', ('operation', 'caller'))
+SLOW_QUERIES = metrics.counter(
+    'db_slow_queries_total', 'Database calls slower than the slow-query threshold.', ('operation', 'caller'))
+
+_INTERNAL_FILES = {__file__, contextlib.__file__}
+_IDENTIFIER = re.compile(r'^\w+$')
+
+# Room left in each packet for the statement header and protocol framing.
+PACKET_HEADROOM = 1024
+
+
+def _caller():
+    """Return ``module:function`` of the first frame outside the database layer."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename in _INTERNAL_FILES:
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
 
 class Database:
-    def __init__(self, host, user, password, db):
-        """Initialize the Database connection."""
+    def __init__(self, host, user, password, db, pooled=True, pool_min_size=1, pool_max_size=10,
+                 pool_max_lifetime=3600, pool_timeout=10.0, pool_ping_after=5.0, cache=None,
+                 slow_query_threshold=1.0, explain_interval=300.0):
+        """Initialize the Database connection.
+
+        With ``pooled`` enabled, connections are checked out of a bounded
+        ``ConnectionPool`` (created on first use) instead of being opened and
+        closed for every call. ``cache`` is an optional ``QueryCache`` used by
+        reads that pass a ``ttl``.
+
+        Every call is timed into the ``db_query_*`` histograms. Calls slower
+        than ``slow_query_threshold`` seconds are logged together with their
+        EXPLAIN plan, explaining each statement at most once per
+        ``explain_interval`` seconds.
+        """
         self.host = host
         self.user = user
         self.password = password
         self.db = db
+        self.pooled = pooled
+        self.pool_options = {
+            'min_size': pool_min_size,
+            'max_size': pool_max_size,
+            'max_lifetime': pool_max_lifetime,
+            'timeout': pool_timeout,
+            'ping_after': pool_ping_after,
+        }
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.cache = cache
+        self.slow_query_threshold = slow_query_threshold
+        self.explain_interval = explain_interval
+        self._explained_at = {}
+        self._packet_limit = None
 
     def connect(self):
         """Create a new database connection."""
@@ -16,50 +88,371 @@ class Database:
             user=self.user,
             password=self.password,
             db=self.db,
-            cursorclass=pymysql.cursors.DictCursor
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=True
         )
 
+    @property
+    def pool(self):
+        """The connection pool, created and warmed up to its minimum size on first access."""
+        pool = self._pool
+        if pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(self.connect, **self.pool_options)
+                    created = True
+                else:
+                    created = False
+                pool = self._pool
+            if created:
+                pool.warm()
+        return pool
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of the ``with`` block.
+
+        Connections that fail with an operational or interface error, or that
+        were closed inside the block, are discarded instead of being returned
+        to the pool.
+        """
+        if not self.pooled:
+            connection = self.connect()
+            try:
+                yield connection
+            finally:
+                if connection.open:
+                    connection.close()
+            return
+
+        pool = self.pool
+        connection = pool.acquire()
+        try:
+            yield connection
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            pool.release(connection, discard=True)
+            raise
+        except BaseException:
+            pool.release(connection, discard=not connection.open)
+            raise
+        else:
+            pool.release(connection, discard=not connection.open)
+
+    def pool_stats(self):
+        """Return open and idle connection counts without creating the pool."""
+        pool = self._pool
+        if pool is None:
+            return {'open': 0, 'idle': 0}
+        return {'open': pool.size, 'idle': pool.idle}
+
+    def close(self):
+        """Close all pooled connections."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    @contextmanager
+    def _observe(self, operation, query, args):
+        """Time a database call; the block sets ``call['rows']`` to the rows it saw."""
+        call = {'rows': 0, 'failed': False}
+        caller = _caller()
+        started = time.perf_counter()
+        try:
+            yield call
+        except Exception:
+            call['failed'] = True
+            QUERY_ERRORS.inc(operation=operation, caller=caller)
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            rows = call['rows']
+            QUERY_DURATION.observe(duration, operation=operation, caller=caller)
+            QUERY_ROWS.observe(rows, operation=operation, caller=caller)
+            if duration > 0:
+                QUERY_ROW_RATE.observe(rows / duration, operation=operation, caller=caller)
+            if self.slow_query_threshold is not None and duration >= self.slow_query_threshold:
+                SLOW_QUERIES.inc(operation=operation, caller=caller)
+                self._log_slow_query(query, args, duration, rows, caller, explain=not call['failed'])
+
+    def _log_slow_query(self, query, args, duration, rows, caller, explain=True):
+        statement = normalize_sql(query)
+        plan = ''
+        now = time.monotonic()
+        last_explained = self._explained_at.get(statement)
+        if explain and statement[:6].upper() == 'SELECT' and (last_explained is None or now - last_explained >= self.explain_interval):
+            self._explained_at[statement] = now
+            plan = self._explain(query, args)
+        logger.warning("Slow query (%.3fs, %d rows) from %s: %s args=%r%s",
+                       duration, rows, caller, statement, args, plan)
+
+    def _explain(self, query, args):
+        try:
+            with self.connection() as connection:
+                with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                    cursor.execute('EXPLAIN ' + query, args)
+                    plan = cursor.fetchall()
+        except Exception as e:
+            return f"\n  EXPLAIN failed: {e}"
+        return ''.join(
+            '\n  ' + ' '.join(f'{key}={value}' for key, value in row.items() if value is not None)
+            for row in plan)
+
     def execute(self, query, args=None):
         """Execute a query that does not return results (INSERT, UPDATE, DELETE)."""
         try:
-            connection = self.connect()
-            with connection.cursor() as cursor:
-                cursor.execute(query, args)
-            connection.commit()
+            with self._observe('execute', query, args) as call:
+                with self.connection() as connection:
+                    with connection.cursor() as cursor:
+                        call['rows'] = cursor.execute(query, args)
+                    connection.commit()
+            if self.cache is not None:
+                self.cache.invalidate_for(query)
             return True
         except Exception as e:
-            print(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             return False
-        finally:
-            connection.close()
 
-    def fetch(self, query, args=None):
-        """Execute a SELECT query and fetch the results."""
+    def execute_many(self, query, args_seq):
+        """Execute a statement once per item of ``args_seq`` in a single transaction.
+
+        PyMySQL rewrites ``INSERT ... VALUES`` statements into multi-row
+        inserts; other statements run once per item. Nothing is committed
+        unless every item succeeds.
+        """
+        args_seq = list(args_seq)
         try:
-            connection = self.connect()
-            with connection.cursor() as cursor:
-                cursor.execute(query, args)
-                result = cursor.fetchall()
+            with self._observe('execute_many', query, None) as call:
+                with self.connection() as connection:
+                    connection.begin()
+                    try:
+                        with connection.cursor() as cursor:
+                            call['rows'] = cursor.executemany(query, args_seq) or 0
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+            if self.cache is not None:
+                self.cache.invalidate_for(query)
+            return True
+        except Exception as e:
+            logger.error("Error: %s", e)
+            return False
+
+    def bulk_insert(self, table, columns, rows, batch_size=1000):
+        """Insert ``rows`` into ``table`` with multi-row INSERT statements in one transaction.
+
+        Rows are grouped into statements of at most ``batch_size`` rows, and
+        a statement is flushed early if it would exceed the server's
+        ``max_allowed_packet``. Nothing is committed unless every batch
+        succeeds.
+        """
+        for identifier in (table, *columns):
+            if not _IDENTIFIER.match(identifier):
+                raise ValueError(f"Invalid SQL identifier: {identifier!r}")
+        header = f"INSERT INTO `{table}` ({', '.join(f'`{column}`' for column in columns)}) VALUES "
+        placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+
+        try:
+            with self._observe('bulk_insert', header, None) as call:
+                with self.connection() as connection:
+                    max_statement = self._max_allowed_packet(connection) - PACKET_HEADROOM - len(header)
+                    connection.begin()
+                    try:
+                        with connection.cursor() as cursor:
+                            values, size = [], 0
+                            for row in rows:
+                                value = cursor.mogrify(placeholders, tuple(row))
+                                if values and (len(values) >= batch_size or size + len(value.encode()) + 1 > max_statement):
+                                    call['rows'] += cursor.execute(header + ','.join(values))
+                                    values, size = [], 0
+                                values.append(value)
+                                size += len(value.encode()) + 1
+                            if values:
+                                call['rows'] += cursor.execute(header + ','.join(values))
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+            if self.cache is not None:
+                self.cache.invalidate([table])
+            return True
+        except Exception as e:
+            logger.error("Error: %s", e)
+            return False
+
+    def _max_allowed_packet(self, connection):
+        if self._packet_limit is None:
+            with connection.cursor(pymysql.cursors.Cursor) as cursor:
+                cursor.execute("SELECT @@max_allowed_packet")
+                self._packet_limit = int(cursor.fetchone()[0])
+        return self._packet_limit
+
+    def _cached(self, kind, query, args, ttl, load):
+        """Serve a read from the query cache when ``ttl`` is given, loading it on a miss."""
+        if ttl is None or self.cache is None:
+            return load(query, args)
+        key = self.cache.key(kind, query, args)
+        hit, result = self.cache.get(key)
+        if hit:
+            return result
+        result = load(query, args)
+        if result is not None:
+            self.cache.put(key, result, ttl)
+        return result
+
+    def fetch(self, query, args=None, ttl=None):
+        """Execute a SELECT query and fetch the results.
+
+        Pass ``ttl`` (seconds) to serve repeated calls from the query cache.
+        """
+        return self._cached('fetch', query, args, ttl, self._fetch_all)
+
+    def _fetch_all(self, query, args):
+        try:
+            with self._observe('fetch', query, args) as call:
+                with self.connection() as connection:
+                    with connection.cursor() as cursor:
+                        cursor.execute(query, args)
+                        result = cursor.fetchall()
+                call['rows'] = len(result)
             return result
         except Exception as e:
-            print(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             return None
-        finally:
-            connection.close()
 
-    def fetch_one(self, query, args=None):
-        """Execute a SELECT query and fetch a single result."""
+    def fetch_one(self, query, args=None, ttl=None):
+        """Execute a SELECT query and fetch a single result.
+
+        Pass ``ttl`` (seconds) to serve repeated calls from the query cache.
+        """
+        return self._cached('fetch_one', query, args, ttl, self._fetch_first)
+
+    def _fetch_first(self, query, args):
         try:
-            connection = self.connect()
-            with connection.cursor() as cursor:
-                cursor.execute(query, args)
-                result = cursor.fetchone()
+            with self._observe('fetch_one', query, args) as call:
+                with self.connection() as connection:
+                    with connection.cursor() as cursor:
+                        cursor.execute(query, args)
+                        result = cursor.fetchone()
+                call['rows'] = 0 if result is None else 1
             return result
         except Exception as e:
-            print(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             return None
-        finally:
-            connection.close()
+
+    def _stream(self, query, args, chunk_size, cursorclass, operation):
+        """Yield ``(description, rows)`` chunks from an unbuffered server-side cursor.
+
+        The connection stays checked out until the generator is exhausted or
+        closed; a generator abandoned mid-stream closes its connection rather
+        than draining the rest of the result.
+        """
+        with self._observe(operation, query, args) as call:
+            with self.connection() as connection:
+                cursor = connection.cursor(cursorclass)
+                finished = False
+                try:
+                    cursor.execute(query, args)
+                    while True:
+                        rows = cursor.fetchmany(chunk_size)
+                        if not rows:
+                            break
+                        call['rows'] += len(rows)
+                        yield cursor.description, rows
+                    finished = True
+                finally:
+                    if finished:
+                        cursor.close()
+                    else:
+                        try:
+                            connection.close()
+                        except Exception:
+                            pass
+
+    def fetch_chunks(self, query, args=None, chunk_size=1000):
+        """Stream a SELECT query in lists of up to ``chunk_size`` rows.
+
+        Rows are read through an unbuffered server-side cursor, so only one
+        chunk is held in memory at a time. Unlike ``fetch``, errors are
+        raised: once chunks were yielded, returning quietly would pass a
+        truncated result off as a complete one.
+        """
+        try:
+            for _, rows in self._stream(query, args, chunk_size, pymysql.cursors.SSDictCursor, 'fetch_chunks'):
+                yield rows
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            logger.error("Error: %s", e)
+            raise
+
+    def fetch_columns(self, query, args=None, dtypes=None, chunk_size=10000, ttl=None):
+        """Execute a SELECT query and return its result column-wise as typed NumPy arrays.
+
+        Rows are streamed as tuples and written chunk by chunk into one array
+        per column, keyed by column name. ``dtypes`` maps column names to a
+        NumPy dtype (e.g. ``'int32'``, ``'float32'``, ``'datetime64[s]'``) or
+        to ``'category'``, which returns a ``pandas.Categorical``. Columns
+        without a dtype are left for NumPy to infer. Pass ``ttl`` (seconds) to
+        serve repeated calls from the query cache.
+        """
+        dtypes = dtypes or {}
+        kind = ('fetch_columns', tuple(sorted(dtypes.items())))
+        return self._cached(kind, query, args, ttl,
+                            lambda query, args: self._fetch_columns(query, args, dtypes, chunk_size))
+
+    def _fetch_columns(self, query, args, dtypes, chunk_size):
+        import numpy as np
+
+        names = None
+        parts = {}
+        categories = {}
+        try:
+            for description, rows in self._stream(query, args, chunk_size, pymysql.cursors.SSCursor, 'fetch_columns'):
+                if names is None:
+                    names = [column[0] for column in description]
+                    parts = {name: [] for name in names}
+                    categories = {name: {} for name in names if dtypes.get(name) == 'category'}
+                for name, values in zip(names, zip(*rows)):
+                    if name in categories:
+                        codes = categories[name]
+                        parts[name].append(np.fromiter(
+                            (-1 if value is None else codes.setdefault(value, len(codes)) for value in values),
+                            dtype=np.int32, count=len(values)))
+                    else:
+                        parts[name].append(np.asarray(values, dtype=dtypes.get(name)))
+        except Exception as e:
+            logger.error("Error: %s", e)
+            return None
+
+        if names is None:
+            # No rows: fall back to the requested dtypes for the known columns.
+            return {name: self._empty_column(dtype) for name, dtype in dtypes.items()}
+
+        columns = {}
+        for name in names:
+            if name in categories:
+                # pandas is only needed when a categorical column was requested.
+                import pandas as pd
+                codes = np.concatenate(parts[name])
+                columns[name] = pd.Categorical.from_codes(codes, categories=list(categories[name]))
+            else:
+                columns[name] = np.concatenate(parts[name])
+        return columns
+
+    @staticmethod
+    def _empty_column(dtype):
+        import numpy as np
+
+        if dtype == 'category':
+            import pandas as pd
+            return pd.Categorical([])
+        return np.array([], dtype=dtype)
+
+    def fetch_iter(self, query, args=None, chunk_size=1000):
+        """Stream a SELECT query one row at a time (see ``fetch_chunks``)."""
+        for rows in self.fetch_chunks(query, args, chunk_size):
+            yield from rows
 
     def update(self, query, args=None):
         """Execute an UPDATE query."""
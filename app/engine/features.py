@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+
+import numpy as np
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+FEATURE_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[s]'),
+    ('hour', 'int8'),
+    ('day_of_week', 'int8'),
+    ('day_of_month', 'int8'),
+    ('month', 'int8'),
+    ('lag_1', 'float32'),
+    ('fill_level', 'float32'),
+])
+
+NEW_READINGS_DTYPES = {
+    'record_id': 'int64',
+    'bin_id': 'int32',
+    'waste_type': 'int32',
+    'timestamp': 'datetime64[s]',
+    'fill_level': 'float32',
+}
+
+
+class FeatureStore:
+    """Featurized fill level history kept on disk, one append-only file per series.
+
+    Every ``(bin_id, waste_type)`` series is a raw array of ``FEATURE_DTYPE``
+    records read back through ``numpy.memmap``. A JSON manifest holds the
+    highest ``record_id`` already stored (the watermark) and, per series,
+    its row count, names and last fill level. ``sync`` only fetches and
+    featurizes readings above the watermark, continuing each series'
+    ``lag_1`` from its stored last value.
+
+    Syncs are serialized across processes with a file lock. Data is appended
+    before the manifest is replaced, and readers only map the rows the
+    manifest counts, so an interrupted sync never exposes partial rows.
+    """
+
+    NEW_READINGS_QUERY = """
+        SELECT bin_fill_levels.record_id, bin_fill_levels.bin_id, bin_fill_levels.waste_type,
+               bin_fill_levels.timestamp, bin_fill_levels.fill_level,
+               waste_bins.bin_name, waste_type.name AS waste_type_name
+        FROM bin_fill_levels
+        INNER JOIN waste_bins ON bin_fill_levels.bin_id = waste_bins.bin_id
+        INNER JOIN waste_type ON waste_type.waste_type_id = bin_fill_levels.waste_type
+        WHERE bin_fill_levels.record_id > %s
+        ORDER BY bin_fill_levels.record_id;
+    """
+
+    def __init__(self, db, root):
+        self.db = db
+        self.root = root
+        self._manifest_path = os.path.join(root, 'manifest.json')
+        self._file_lock = FileLock(os.path.join(root, '.sync.lock'))
+        self._lock = threading.Lock()
+
+    @property
+    def watermark(self):
+        return self._read_manifest()['watermark']
+
+    def sync(self, chunk_size=10000):
+        """Append readings added since the watermark. Returns the number of new rows stored."""
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, self._file_lock:
+            manifest = self._read_manifest()
+            columns = self.db.fetch_columns(self.NEW_READINGS_QUERY, (manifest['watermark'],),
+                                            dtypes=NEW_READINGS_DTYPES, chunk_size=chunk_size)
+            if not columns or not len(columns['record_id']):
+                return 0
+
+            stored = self._append(manifest, columns)
+            manifest['watermark'] = int(columns['record_id'][-1])
+            self._write_manifest(manifest)
+            logger.info("Feature store: stored %d new readings (watermark %d)", stored, manifest['watermark'])
+            return stored
+
+    def series(self):
+        """Yield ``(bin_id, waste_type_name, bin_name, records)`` for every stored series.
+
+        ``records`` is a read-only memory map of ``FEATURE_DTYPE`` rows in
+        ``record_id`` order.
+        """
+        for name, entry in self._read_manifest()['series'].items():
+            if not entry['rows']:
+                continue
+            records = np.memmap(os.path.join(self.root, name), dtype=FEATURE_DTYPE, mode='r',
+                                shape=(entry['rows'],))
+            yield entry['bin_id'], entry['waste_type_name'], entry['bin_name'], records
+
+    def _append(self, manifest, columns):
+        import pandas as pd
+
+        valid = ~np.isnat(columns['timestamp']) & ~np.isnan(columns['fill_level'])
+        timestamps = pd.DatetimeIndex(columns['timestamp'][valid])
+        features = {
+            'timestamp': columns['timestamp'][valid],
+            'hour': timestamps.hour.to_numpy(),
+            'day_of_week': timestamps.dayofweek.to_numpy(),
+            'day_of_month': timestamps.day.to_numpy(),
+            'month': timestamps.month.to_numpy(),
+            'fill_level': columns['fill_level'][valid],
+        }
+        bin_ids = columns['bin_id'][valid]
+        waste_types = columns['waste_type'][valid]
+        bin_names = np.asarray(columns['bin_name'], dtype=object)[valid]
+        waste_type_names = np.asarray(columns['waste_type_name'], dtype=object)[valid]
+
+        keys = bin_ids.astype(np.int64) << 32 | waste_types.astype(np.int64)
+        stored = 0
+        for key in np.unique(keys):
+            # Rows stay in record_id order within each series
+            rows = np.flatnonzero(keys == key)
+            name = f'bin_{bin_ids[rows[0]]}_waste_{waste_types[rows[0]]}.bin'
+            entry = manifest['series'].setdefault(name, {
+                'bin_id': int(bin_ids[rows[0]]),
+                'waste_type': int(waste_types[rows[0]]),
+                'rows': 0,
+                'last_fill_level': 0.0,
+            })
+            entry['bin_name'] = bin_names[rows[-1]]
+            entry['waste_type_name'] = waste_type_names[rows[-1]]
+
+            records = np.empty(len(rows), dtype=FEATURE_DTYPE)
+            for field, values in features.items():
+                records[field] = values[rows]
+            records['lag_1'][0] = entry['last_fill_level']
+            records['lag_1'][1:] = records['fill_level'][:-1]
+
+            with open(os.path.join(self.root, name), 'ab') as file:
+                # Drop rows written by an interrupted sync that the manifest never counted
+                file.truncate(entry['rows'] * FEATURE_DTYPE.itemsize)
+                records.tofile(file)
+            entry['rows'] += len(rows)
+            entry['last_fill_level'] = float(records['fill_level'][-1])
+            stored += len(rows)
+        return stored
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {'watermark': 0, 'series': {}}
+
+    def _write_manifest(self, manifest):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.manifest-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(manifest, file)
+            os.replace(tmp_path, self._manifest_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastStore:
+    """The latest precomputed forecast, shared between worker processes through a JSON file.
+
+    ``put`` serializes a result once and writes it next to the model cache
+    with an atomic rename; ``get`` returns the ready-to-send body together
+    with its ETag and computed-at time, reloading the file only when its
+    modification time changes. A result older than ``max_age`` seconds is
+    still served but reported as stale so the refresher recomputes it.
+
+    A result that is a dict can also be patched key by key with ``update``;
+    writers are serialized through a lock file so patches and full
+    refreshes from different processes never lose each other's changes.
+    """
+
+    def __init__(self, path, max_age=3600):
+        self.path = path
+        self.max_age = max_age
+        self._entry = None
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f'{path}.lock')
+
+    def put(self, data, computed_at=None):
+        computed_at = computed_at or datetime.now().replace(microsecond=0)
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with self._file_lock:
+            return self._write(data, computed_at)
+
+    def update(self, changes):
+        """Merge ``changes`` into the stored dict, keeping its other keys and computed-at time."""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with self._file_lock:
+            entry = self.get()
+            data = dict(entry['data']) if entry else {}
+            data.update(changes)
+            # A partial result with nothing before it stays stale until a full refresh
+            computed_at = entry['computed_at'] if entry else datetime.fromtimestamp(0)
+            return self._write(data, computed_at)
+
+    def _write(self, data, computed_at):
+        document = json.dumps({'computed_at': computed_at.isoformat(), 'data': data}, default=str)
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.forecast-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                file.write(document)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self._entry = self._build_entry(data, computed_at)
+            self._mtime = os.stat(self.path).st_mtime_ns
+        return self._entry
+
+    def get(self):
+        """Return ``{'data', 'body', 'etag', 'computed_at'}`` for the latest forecast, or None if none exists."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return self._entry
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    with open(self.path) as file:
+                        document = json.load(file)
+                    self._entry = self._build_entry(
+                        document['data'], datetime.fromisoformat(document['computed_at']))
+                    self._mtime = mtime
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error("Could not read forecast store %s: %s", self.path, e)
+            return self._entry
+
+    def is_stale(self):
+        entry = self.get()
+        if entry is None:
+            return True
+        return (datetime.now() - entry['computed_at']).total_seconds() > self.max_age
+
+    @staticmethod
+    def _build_entry(data, computed_at):
+        body = json.dumps(data, default=str).encode()
+        return {
+            'data': data,
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest(),
+            'computed_at': computed_at,
+        }
+
+
+def refresh(store, compute):
+    """Run ``compute()`` and save its result in ``store``; empty results keep the previous forecast."""
+    started = time.perf_counter()
+    data = compute()
+    if not data:
+        logger.warning("Forecast came back empty, keeping the previous result")
+        return {'series': 0, 'stored': False}
+    entry = store.put(data)
+    logger.info("Stored forecast for %d series in %.1fs", len(data), time.perf_counter() - started)
+    return {'series': len(data), 'stored': True, 'computed_at': entry['computed_at'].isoformat()}
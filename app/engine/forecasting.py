@@ -0,0 +1,428 @@
+import logging
+import os
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .singleflight import SINGLE_FLIGHT
+from .training import FEATURES, continue_training, model_registry, train_many, training_claims
+
+logger = logging.getLogger(__name__)
+
+# 'per_series' trains one model per (bin_id, waste_type); 'global' trains one model over every series
+FORECAST_MODEL = os.getenv('FORECAST_MODEL', 'per_series')
+# Retrain once this many readings arrived since the model was trained (per series on average for 'global')
+FORECAST_RETRAIN_MIN_ROWS = int(os.getenv('FORECAST_RETRAIN_MIN_ROWS', 48))
+# Retrain when the MAE on readings newer than the model exceeds its holdout MAE by this factor...
+FORECAST_DRIFT_RATIO = float(os.getenv('FORECAST_DRIFT_RATIO', 1.5))
+# ...measured over at least this many new readings
+FORECAST_DRIFT_MIN_ROWS = int(os.getenv('FORECAST_DRIFT_MIN_ROWS', 6))
+# Seconds after which a model is rebuilt from scratch even if nothing triggered it
+MODEL_MAX_AGE = float(os.getenv('FORECAST_MODEL_MAX_AGE', 7 * 86400))
+# Trees boosted onto a model when new readings arrive; 0 always rebuilds from scratch
+FORECAST_INCREMENTAL_TREES = int(os.getenv('FORECAST_INCREMENTAL_TREES', 20))
+# Incremental updates a model may receive before the next full rebuild
+FORECAST_FULL_REBUILD_EVERY = int(os.getenv('FORECAST_FULL_REBUILD_EVERY', 7))
+# Seconds to wait for another caller's training when there is no previous model to serve
+FORECAST_TRAINING_WAIT = float(os.getenv('FORECAST_TRAINING_WAIT', 600))
+
+RETRAINS = metrics.counter('forecast_retrains_total', 'Forecast model retrains by trigger.', ('reason',))
+RETRAINS_SKIPPED = metrics.counter(
+    'forecast_retrains_skipped_total', 'Forecast model checks that kept the existing model.')
+INCREMENTAL_UPDATES = metrics.counter(
+    'forecast_incremental_updates_total', 'Forecast models updated by boosting on new readings only.')
+
+GLOBAL_MODEL_KEY = 'global'
+SERIES_FEATURES = ['bin_id', 'waste_type']
+
+
+def future_times(hours, days, now=None):
+    """Timestamps at ``hours`` of each of the next ``days`` days."""
+    now = now or datetime.now()
+    return [datetime.combine((now + timedelta(days=day)).date(), datetime.min.time()) + timedelta(hours=hour)
+            for day in range(1, days + 1) for hour in hours]
+
+
+def future_features(times, last_level):
+    return pd.DataFrame({
+        'hour': [time.hour for time in times],
+        'day_of_week': [time.weekday() for time in times],
+        'day_of_month': [time.day for time in times],
+        'month': [time.month for time in times],
+        'lag_1': last_level,
+    })[FEATURES]
+
+
+def evaluate(y_true, y_pred):
+    from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error, mean_squared_error
+
+    return {
+        'mae': float(mean_absolute_error(y_true, y_pred)),
+        'mse': float(mean_squared_error(y_true, y_pred)),
+        'mape': float(mean_absolute_percentage_error(y_true, y_pred)),
+    }
+
+
+def retrain_reason(model, info, new_rows, fresh_mae=None, series_count=1):
+    """Why ``model`` should be retrained, or None to keep it.
+
+    A model is kept until enough new readings arrived since it was trained,
+    its error on those readings drifts past its holdout error, or it
+    reaches ``MODEL_MAX_AGE``.
+    """
+    if model is None:
+        return 'missing'
+    built_at = info.get('full_trained_at', info['trained_at'])
+    if (datetime.now() - datetime.fromisoformat(built_at)).total_seconds() > MODEL_MAX_AGE:
+        return 'max_age'
+    if new_rows >= FORECAST_RETRAIN_MIN_ROWS * series_count:
+        return 'new_rows'
+    baseline = info.get('metrics', {}).get('mae')
+    if fresh_mae is not None and baseline is not None and fresh_mae > FORECAST_DRIFT_RATIO * max(baseline, 1e-6):
+        return 'drift'
+    return None
+
+
+def _fresh_mae(model, X, y):
+    """MAE of ``model`` on readings it has not seen, if there are enough of them."""
+    if model is None or len(X) < FORECAST_DRIFT_MIN_ROWS:
+        return None
+    try:
+        return float(np.mean(np.abs(model.predict(X) - y.to_numpy())))
+    except Exception as e:
+        logger.error("Could not score new readings: %s", e)
+        return None
+
+
+def _incremental(reason, info):
+    """Whether new readings alone justify boosting the existing model instead of rebuilding it."""
+    return (reason == 'new_rows' and FORECAST_INCREMENTAL_TREES > 0
+            and info.get('incremental_updates', 0) < FORECAST_FULL_REBUILD_EVERY)
+
+
+def _training_metadata(info=None, incremental=False):
+    now = datetime.now().isoformat(timespec='seconds')
+    if not incremental:
+        return {'trained_at': now, 'full_trained_at': now, 'incremental_updates': 0}
+    return {
+        'trained_at': now,
+        'full_trained_at': info.get('full_trained_at', info['trained_at']),
+        'incremental_updates': info.get('incremental_updates', 0) + 1,
+    }
+
+
+def _update(key, model, X_new, y_new):
+    """Boost ``model`` on new readings; returns ``(model, metrics on those readings beforehand)``."""
+    # Scored before the update, so the saved error stays out-of-sample for drift checks
+    scores = evaluate(y_new, model.predict(X_new))
+    updated = continue_training(model, X_new, y_new, FORECAST_INCREMENTAL_TREES)
+    INCREMENTAL_UPDATES.inc()
+    logger.info("Boosted %s on %d new readings", key, len(X_new))
+    return updated, scores
+
+
+def _record_retrain(key, reason):
+    if reason is None:
+        RETRAINS_SKIPPED.inc()
+    else:
+        RETRAINS.inc(reason=reason)
+        logger.info("Retraining %s (%s)", key, reason)
+
+
+def forecast_series(history, hours, days, model=None, only_bin=None):
+    """Forecast every series at ``hours`` over the next ``days`` days.
+
+    ``history`` is the ``(bin_id, waste_type, bin_name, frame)`` list from
+    ``load_fill_level_series``. Each series is split 80/20 in time; models
+    are (re)trained on the first part when ``retrain_reason`` says so and
+    scored on the rest. Returns one dict per series with its ``times``,
+    raw predicted fill levels under ``forecast`` and holdout ``metrics``;
+    series without a usable model are left out. The evaluation of every
+    series is saved next to its model in the registry.
+
+    With ``only_bin`` (a bin_id) only that bin's series are returned. Per-series models
+    of other bins are not touched; the global model still sees every
+    series, so it is never retrained on one bin alone.
+    """
+    times = future_times(hours, days)
+    prepared = []
+    for bin_id, waste_type, bin_name, records in history:
+        frame = records.sort_values(by='timestamp')
+        split = len(frame) - int(np.ceil(len(frame) * 0.2))
+        if split < 1:
+            continue
+        prepared.append({
+            'bin_id': int(bin_id),
+            'waste_type': waste_type,
+            'bin_name': bin_name,
+            'timestamp': frame['timestamp'].iloc[:split],
+            'X_train': frame[FEATURES].iloc[:split],
+            'y_train': frame['fill_level'].iloc[:split],
+            'X_test': frame[FEATURES].iloc[split:],
+            'y_test': frame['fill_level'].iloc[split:],
+            'X_future': future_features(times, frame['fill_level'].iloc[-1]),
+            'records': records,  # record_id order, so rows past a model's watermark are the new ones
+            'rows': len(frame),
+        })
+
+    if (model or FORECAST_MODEL) == 'global':
+        predictions = _predict_global(prepared)
+    else:
+        if only_bin is not None:
+            prepared = [series for series in prepared if series['bin_id'] == only_bin]
+        predictions = _predict_per_series(prepared)
+
+    results = []
+    for series, (test_pred, future_pred) in zip(prepared, predictions):
+        if future_pred is None or (only_bin is not None and series['bin_id'] != only_bin):
+            continue
+        holdout = evaluate(series['y_test'], test_pred) if len(test_pred) else {}
+        model_registry.record_evaluation(_series_key(series), {
+            'evaluated_at': datetime.now().isoformat(timespec='seconds'),
+            'rows': series['rows'],
+            'holdout': holdout,
+            'fresh_mae': series.get('fresh_mae'),
+        })
+        if holdout:
+            logger.info("Bin %s, waste type %s: MAE %.2f, MSE %.2f, MAPE %.2f%%", series['bin_name'],
+                        series['waste_type'], holdout['mae'], holdout['mse'], holdout['mape'] * 100)
+        results.append({
+            'bin_id': series['bin_id'],
+            'bin_name': series['bin_name'],
+            'waste_type': series['waste_type'],
+            'times': times,
+            'forecast': future_pred,
+            'metrics': holdout,
+        })
+    return results
+
+
+def _series_key(series):
+    return model_registry.key('bin', series['bin_id'], 'waste', series['waste_type'])
+
+
+def _new_readings(series, known_rows):
+    new = series['records'].iloc[known_rows:]
+    return new[FEATURES], new['fill_level']
+
+
+def _claim(key, info):
+    """Claim the right to retrain ``key``; returns the held lock, or None if another caller has it.
+
+    After claiming, the registry is re-read: if another caller saved a
+    newer version since ``info`` was loaded, the claim is dropped too.
+    """
+    lock = training_claims.try_claim(key)
+    if lock is None:
+        return None
+    _, latest = model_registry.load(key, refresh=True)
+    if (latest or {}).get('version') != (info or {}).get('version'):
+        lock.release()
+        return None
+    return lock
+
+
+def _predict_one(key, model, series):
+    try:
+        return model.predict(series['X_test']), model.predict(series['X_future'])
+    except Exception as e:
+        logger.error("Error during forecasting for %s: %s", key, e)
+        return None, None
+
+
+def _predict_per_series(prepared):
+    """``(test_predictions, future_predictions)`` per series from one model each.
+
+    Each series due for training is claimed first, so only one caller
+    across threads and worker processes trains it. Callers that lose the
+    claim serve the previous model, or wait for the winner when there is
+    no previous model.
+    """
+    keys = [_series_key(series) for series in prepared]
+    models = {}
+    infos = {}
+    to_train = {}
+    to_update = {}
+    waiting = []
+    with ExitStack() as claims:
+        for key, series in zip(keys, prepared):
+            model, info = model_registry.load(key)
+            known_rows = info.get('rows', 0) if info else 0
+            new_rows = series['rows'] - known_rows
+            if model is not None and new_rows < FORECAST_RETRAIN_MIN_ROWS:
+                series['fresh_mae'] = _fresh_mae(model, *_new_readings(series, known_rows))
+            reason = retrain_reason(model, info, new_rows, series.get('fresh_mae'))
+            models[key] = model
+            infos[key] = info
+            if reason is None:
+                _record_retrain(key, reason)
+                continue
+
+            lock = _claim(key, info)
+            if lock is None:
+                # Another caller is training this series, or has just saved a newer version
+                models[key], infos[key] = model_registry.load(key, refresh=True)
+                if models[key] is None:
+                    SINGLE_FLIGHT.inc(result='waited')
+                    waiting.append(key)
+                else:
+                    SINGLE_FLIGHT.inc(result='served_previous')
+                continue
+            claims.callback(lock.release)
+            SINGLE_FLIGHT.inc(result='trained')
+            _record_retrain(key, reason)
+            if _incremental(reason, info):
+                to_update[key] = known_rows
+            else:
+                # The last model's hyperparameters warm-start the tuning
+                previous = info['hyperparameters'] if info else None
+                to_train[key] = (series['X_train'], series['y_train'], previous)
+
+        # Stale series are trained together on a process pool sized by FORECAST_CPU_BUDGET
+        trained = train_many(to_train)
+        models.update(trained)
+
+        updated = {}
+        for key, series in zip(keys, prepared):
+            if key in to_update:
+                try:
+                    models[key], updated[key] = _update(key, models[key], *_new_readings(series, to_update[key]))
+                except Exception as e:
+                    logger.error("Error during incremental update for %s: %s", key, e)
+
+        predictions = []
+        for key, series in zip(keys, prepared):
+            model = models[key]
+            if model is None:
+                predictions.append((None, None))
+                continue
+            test_pred, future_pred = _predict_one(key, model, series)
+            # Rows in the feature store are append-only, so the row count marks what the model has seen
+            if test_pred is not None and key in trained:
+                model_registry.save(key, model, **_training_metadata(), rows=series['rows'],
+                                    metrics=evaluate(series['y_test'], test_pred))
+            elif test_pred is not None and key in updated:
+                model_registry.save(key, model, **_training_metadata(infos[key], incremental=True),
+                                    rows=series['rows'], metrics=updated[key])
+            predictions.append((test_pred, future_pred))
+
+    # Claims are released; series with no model yet wait for the caller training them
+    for key in waiting:
+        index = keys.index(key)
+        if training_claims.wait(key, FORECAST_TRAINING_WAIT):
+            model, _ = model_registry.load(key, refresh=True)
+            if model is not None:
+                predictions[index] = _predict_one(key, model, prepared[index])
+    return predictions
+
+
+def _with_series(X, series, categories):
+    X = X.assign(bin_id=series['bin_id'], waste_type=series['waste_type'])
+    for name in SERIES_FEATURES:
+        X[name] = pd.Categorical(X[name], categories=categories[name])
+    return X
+
+
+def _predict_global(prepared):
+    """``(test_predictions, future_predictions)`` per series from a single model.
+
+    Bin and waste type are categorical features, so one model covers every
+    series, and series it was not trained on (new bins) still get a
+    forecast. All holdout and future rows are scored in one ``predict``.
+    """
+    model, info = model_registry.load(GLOBAL_MODEL_KEY)
+    known_rows = info.get('series_rows', {}) if info else {}
+    new_rows = sum(series['rows'] - known_rows.get(_series_key(series), 0) for series in prepared)
+    fresh_X = fresh_y = fresh_mae = None
+    if model is not None:
+        fresh = [_new_readings(series, known_rows.get(_series_key(series), 0)) for series in prepared]
+        if any(len(X) for X, _ in fresh):
+            fresh_X = pd.concat([_with_series(X, series, info['categories'])
+                                 for (X, _), series in zip(fresh, prepared) if len(X)], ignore_index=True)
+            fresh_y = pd.concat([y for _, y in fresh if len(y)], ignore_index=True)
+        if fresh_X is not None and new_rows < FORECAST_RETRAIN_MIN_ROWS * len(prepared):
+            fresh_mae = _fresh_mae(model, fresh_X, fresh_y)
+    reason = retrain_reason(model, info, new_rows, fresh_mae, series_count=len(prepared))
+    with ExitStack() as claims:
+        lock = _claim(GLOBAL_MODEL_KEY, info) if reason is not None else None
+        if reason is None or lock is not None:
+            _record_retrain(GLOBAL_MODEL_KEY, reason)
+        if lock is not None:
+            claims.callback(lock.release)
+            SINGLE_FLIGHT.inc(result='trained')
+        elif reason is not None:
+            # Another caller is training the model, or has just saved a newer version
+            reason = None
+            model, info = model_registry.load(GLOBAL_MODEL_KEY, refresh=True)
+            if model is None:
+                SINGLE_FLIGHT.inc(result='waited')
+                if training_claims.wait(GLOBAL_MODEL_KEY, FORECAST_TRAINING_WAIT):
+                    model, info = model_registry.load(GLOBAL_MODEL_KEY, refresh=True)
+            else:
+                SINGLE_FLIGHT.inc(result='served_previous')
+        return _predict_with_global(prepared, model, info, reason, fresh_X, fresh_y)
+
+
+def _predict_with_global(prepared, model, info, reason, fresh_X, fresh_y):
+    """Update or retrain the global model as ``reason`` asks, then score every series in one batch."""
+    saved = None
+    # Bins the model has no category for need a rebuild; otherwise new readings can be boosted on
+    known_series = info is not None and all(
+        series['bin_id'] in info['categories']['bin_id'] and series['waste_type'] in info['categories']['waste_type']
+        for series in prepared)
+    if reason is not None and _incremental(reason, info) and known_series and fresh_X is not None:
+        try:
+            model, scores = _update(GLOBAL_MODEL_KEY, model, fresh_X, fresh_y)
+            saved = dict(_training_metadata(info, incremental=True), categories=info['categories'], metrics=scores)
+        except Exception as e:
+            logger.error("Error during incremental update for %s: %s", GLOBAL_MODEL_KEY, e)
+    elif reason is not None:
+        categories = {
+            'bin_id': sorted({series['bin_id'] for series in prepared}),
+            'waste_type': sorted({series['waste_type'] for series in prepared}),
+        }
+        X_train = pd.concat([_with_series(series['X_train'], series, categories) for series in prepared],
+                            ignore_index=True)
+        y_train = pd.concat([series['y_train'] for series in prepared], ignore_index=True)
+        # Time order keeps halving's validation rows the newest across all series
+        order = np.argsort(np.concatenate([series['timestamp'].to_numpy() for series in prepared]), kind='stable')
+        previous = info['hyperparameters'] if info else None
+        trained = train_many({GLOBAL_MODEL_KEY: (X_train.iloc[order], y_train.iloc[order], previous)},
+                             enable_categorical=True, tree_method='hist')
+        if GLOBAL_MODEL_KEY in trained:
+            model = trained[GLOBAL_MODEL_KEY]
+            info = {'categories': categories}
+            saved = dict(_training_metadata(), categories=categories)
+    if model is None:
+        return [(None, None)] * len(prepared)
+
+    categories = info['categories']
+    parts = []
+    for series in prepared:
+        parts.append(_with_series(series['X_test'], series, categories))
+        parts.append(_with_series(series['X_future'], series, categories))
+    try:
+        values = model.predict(pd.concat(parts, ignore_index=True))
+    except Exception as e:
+        logger.error("Error during global forecasting: %s", e)
+        return [(None, None)] * len(prepared)
+
+    predictions = []
+    offset = 0
+    for series in prepared:
+        test_rows, future_rows = len(series['X_test']), len(series['X_future'])
+        predictions.append((values[offset:offset + test_rows],
+                            values[offset + test_rows:offset + test_rows + future_rows]))
+        offset += test_rows + future_rows
+
+    if saved is not None:
+        if 'metrics' not in saved:
+            y_test = np.concatenate([series['y_test'].to_numpy() for series in prepared])
+            test_pred = np.concatenate([test for test, _ in predictions])
+            saved['metrics'] = evaluate(y_test, test_pred) if len(y_test) else {}
+        model_registry.save(GLOBAL_MODEL_KEY, model, **saved, rows=sum(series['rows'] for series in prepared),
+                            series_rows={_series_key(series): series['rows'] for series in prepared})
+    return predictions
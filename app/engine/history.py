@@ -0,0 +1,23 @@
+import os
+
+import pandas as pd
+
+from . import db
+from .features import FeatureStore
+
+# Featurized history on disk; forecast runs only fetch readings added since the previous run
+fill_level_features = FeatureStore(db, os.path.join('model_cache', 'features'))
+
+
+def load_fill_level_series(only_bin=None):
+    """Sync the feature store and return ``(bin_id, waste_type_name, bin_name, DataFrame)`` per series.
+
+    Each frame holds the stored timestamp, feature and fill level columns in
+    ``record_id`` order; only readings newer than the store's watermark are
+    read from the database. With ``only_bin``, frames are built for that
+    bin's series only.
+    """
+    fill_level_features.sync()
+    return [(bin_id, waste_type, bin_name, pd.DataFrame(records))
+            for bin_id, waste_type, bin_name, records in fill_level_features.series()
+            if only_bin is None or bin_id == only_bin]
@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """Runs jobs on a background thread pool and keeps their status for polling.
+
+    Jobs are submitted under a key; while a job with the same key is queued
+    or running, further submissions return that job instead of starting a
+    new one. The last ``history`` jobs are kept for status lookups.
+    """
+
+    def __init__(self, max_workers=1, history=100):
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args):
+        """Queue ``fn(*args)``; returns ``(job, created)``."""
+        with self._lock:
+            active = self._jobs.get(self._active.get(key))
+            if active is not None:
+                return dict(active), False
+
+            job = {
+                'id': uuid.uuid4().hex,
+                'key': key,
+                'status': 'queued',
+                'submitted_at': datetime.now().isoformat(timespec='seconds'),
+                'started_at': None,
+                'finished_at': None,
+                'duration': None,
+                'result': None,
+                'error': None,
+            }
+            self._jobs[job['id']] = job
+            self._active[key] = job['id']
+            while len(self._jobs) > self.history:
+                self._jobs.popitem(last=False)
+            snapshot = dict(job)
+
+        self._executor.submit(self._run, job, fn, args)
+        return snapshot, True
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else dict(job)
+
+    def _run(self, job, fn, args):
+        with self._lock:
+            job['status'] = 'running'
+            job['started_at'] = datetime.now().isoformat(timespec='seconds')
+        started = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job['id'], job['key'])
+            status, result, error = 'failed', None, str(e)
+        else:
+            status, error = 'finished', None
+        with self._lock:
+            job['status'] = status
+            job['result'] = result
+            job['error'] = error
+            job['finished_at'] = datetime.now().isoformat(timespec='seconds')
+            job['duration'] = round(time.perf_counter() - started, 3)
+            if self._active.get(job['key']) == job['id']:
+                del self._active[job['key']]
@@ -0,0 +1,130 @@
+import logging
+import os
+import tempfile
+
+from filelock import FileLock, Timeout
+
+logger = logging.getLogger(__name__)
+
+
+class FileLeaderLock:
+    """Host-wide leadership through an exclusive lock on a file.
+
+    The operating system drops the lock when the owning process exits, so a
+    surviving process can take over on its next attempt.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(tempfile.gettempdir(), 'ebasura-monitor.lock')
+        self._lock = FileLock(self.path)
+
+    def try_acquire(self):
+        return self.acquire(timeout=0)
+
+    def acquire(self, timeout):
+        """Wait up to ``timeout`` seconds for the lock. Returns False if it stayed taken."""
+        try:
+            self._lock.acquire(timeout=timeout)
+        except Timeout:
+            return False
+        return True
+
+    def is_held(self):
+        return self._lock.is_locked
+
+    def release(self):
+        if self._lock.is_locked:
+            self._lock.release(force=True)
+
+
+class MySQLLeaderLock:
+    """Leadership through a MySQL ``GET_LOCK`` advisory lock.
+
+    The lock lives on a dedicated connection outside the pool; if that
+    connection dies the server releases the lock, and ``is_held`` reports
+    the loss so the old leader stops before a new one takes over.
+    """
+
+    def __init__(self, db, name='ebasura-monitor'):
+        self.db = db
+        self.name = name
+        self._connection = None
+
+    def try_acquire(self):
+        return self.acquire(timeout=0)
+
+    def acquire(self, timeout):
+        """Wait up to ``timeout`` seconds for the lock. Returns False if it stayed taken.
+
+        The server does the waiting, so this costs one connection and one
+        query however long it blocks.
+        """
+        try:
+            connection = self.db.connect()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (self.name, timeout))
+                acquired = cursor.fetchone()['acquired'] == 1
+        except Exception as e:
+            logger.error("Could not request leader lock %s: %s", self.name, e)
+            return False
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def is_held(self):
+        if self._connection is None:
+            return False
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT IS_USED_LOCK(%s) = CONNECTION_ID() AS held", (self.name,))
+                held = cursor.fetchone()['held'] == 1
+        except Exception as e:
+            logger.error("Lost leader lock connection: %s", e)
+            held = False
+        if not held:
+            self._close()
+        return held
+
+    def release(self):
+        if self._connection is None:
+            return
+        try:
+            with self._connection.cursor() as cursor:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (self.name,))
+        except Exception:
+            pass
+        self._close()
+
+    def _close(self):
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+
+class Leadership:
+    """Tracks whether this process currently leads, re-checking on every call to ``ensure``."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.is_leader = False
+
+    def ensure(self):
+        """Verify leadership if held, otherwise try to acquire it. Returns True while leading."""
+        if self.is_leader:
+            if self.lock.is_held():
+                return True
+            logger.warning("Lost monitor leadership")
+            self.is_leader = False
+        if self.lock.try_acquire():
+            logger.info("Acquired monitor leadership (pid %d)", os.getpid())
+            self.is_leader = True
+        return self.is_leader
+
+    def resign(self):
+        if self.is_leader:
+            self.lock.release()
+            self.is_leader = False
@@ -0,0 +1,205 @@
+import errno
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+MODEL_LOAD_SECONDS = metrics.histogram(
+    'model_load_seconds', 'Time to load a model from the registry on a cache miss.')
+MODEL_CACHE_REQUESTS = metrics.counter(
+    'model_cache_requests_total', 'Model registry lookups by in-process cache result.', ('result',))
+
+MODEL_FILE = 'model.ubj'
+METADATA_FILE = 'metadata.json'
+EVALUATION_FILE = 'evaluation.json'
+LATEST_FILE = 'LATEST'
+# Thread counts depend on the process that trained the model, not on the model; never saved or restored
+RUNTIME_PARAMS = ('n_jobs',)
+
+
+def _json_safe(value):
+    return isinstance(value, (str, int, float, bool)) and value == value  # drops NaN
+
+
+class ModelRegistry:
+    """Versioned XGBoost models on disk with an in-process LRU of loaded models.
+
+    Each key is a directory of numbered versions; a version holds the model
+    in XGBoost's native binary format plus a JSON sidecar with its
+    hyperparameters and caller-supplied metadata (training watermark,
+    metrics, ...); the latest evaluation of a key is kept in a separate,
+    unversioned file. A version is assembled in a temporary directory and
+    renamed into place, then the key's ``LATEST`` pointer is replaced, so
+    readers never see a half-written model and concurrent writers cannot
+    clobber each other's files.
+
+    Loaded models are kept in an LRU of ``max_loaded`` entries. A cached
+    model is served without touching the disk; only after
+    ``revalidate_after`` seconds is the ``LATEST`` pointer re-read to pick
+    up versions saved by other processes.
+    """
+
+    def __init__(self, root, max_loaded=128, keep_versions=3, revalidate_after=60.0):
+        self.root = root
+        self.max_loaded = max_loaded
+        self.keep_versions = keep_versions
+        self.revalidate_after = revalidate_after
+        self._loaded = OrderedDict()  # key -> (version, model, metadata, checked_at)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._loaded)
+
+    @staticmethod
+    def key(*parts):
+        """Build a filesystem-safe registry key from ``parts``."""
+        return '_'.join(re.sub(r'[^\w.-]+', '-', str(part)) for part in parts)
+
+    def save(self, key, model, **metadata):
+        """Store ``model`` as a new version of ``key`` and return its version number."""
+        directory = os.path.join(self.root, key)
+        os.makedirs(directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=directory, prefix='.staging-')
+        try:
+            model.save_model(os.path.join(staging, MODEL_FILE))
+            metadata = dict(metadata, saved_at=datetime.now().isoformat(timespec='seconds'), hyperparameters={
+                name: value for name, value in model.get_params().items()
+                if name not in RUNTIME_PARAMS and _json_safe(value)})
+            version = self._latest_version(directory) + 1
+            while True:
+                metadata['version'] = version
+                with open(os.path.join(staging, METADATA_FILE), 'w') as file:
+                    json.dump(metadata, file, default=str)
+                try:
+                    os.rename(staging, os.path.join(directory, f'v{version}'))
+                    break
+                except OSError as e:
+                    if not isinstance(e, FileExistsError) and e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                        raise
+                    # Another writer claimed this version number first
+                    version += 1
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # Point at the newest complete version, even if a concurrent writer finished after us
+        latest = self._latest_version(directory)
+        self._write_latest(directory, latest)
+        self._prune(directory, latest)
+        with self._lock:
+            self._remember(key, (version, model, metadata, time.monotonic()))
+        return version
+
+    def load(self, key, refresh=False):
+        """Return ``(model, metadata)`` for the latest version of ``key``, or ``(None, None)``.
+
+        With ``refresh`` the ``LATEST`` pointer is always re-read, to see a
+        version another process has just saved.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._loaded.get(key)
+            if cached is not None and not refresh and now - cached[3] < self.revalidate_after:
+                self._loaded.move_to_end(key)
+                MODEL_CACHE_REQUESTS.inc(result='hit')
+                return cached[1], cached[2]
+
+        directory = os.path.join(self.root, key)
+        version = self._read_latest(directory)
+        if version is None:
+            MODEL_CACHE_REQUESTS.inc(result='miss')
+            return None, None
+        if cached is not None and cached[0] == version:
+            with self._lock:
+                self._remember(key, cached[:3] + (now,))
+            MODEL_CACHE_REQUESTS.inc(result='hit')
+            return cached[1], cached[2]
+
+        MODEL_CACHE_REQUESTS.inc(result='miss')
+        started = time.perf_counter()
+        try:
+            from xgboost import XGBRegressor
+
+            path = os.path.join(directory, f'v{version}')
+            with open(os.path.join(path, METADATA_FILE)) as file:
+                metadata = json.load(file)
+            # load_model restores the booster only; the sklearn parameters (enable_categorical,
+            # max_depth, learning_rate, ...) come back from the sidecar
+            model = XGBRegressor(**{name: value for name, value in metadata.get('hyperparameters', {}).items()
+                                    if name not in RUNTIME_PARAMS})
+            model.load_model(os.path.join(path, MODEL_FILE))
+        except Exception as e:
+            logger.error("Could not load model %s v%d: %s", key, version, e)
+            return None, None
+        MODEL_LOAD_SECONDS.observe(time.perf_counter() - started)
+
+        with self._lock:
+            self._remember(key, (version, model, metadata, now))
+        return model, metadata
+
+    def metadata(self, key):
+        return self.load(key)[1]
+
+    def record_evaluation(self, key, evaluation):
+        """Save the latest evaluation of ``key`` (metrics on fresh data) beside its versions."""
+        directory = os.path.join(self.root, key)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.evaluation-')
+        with os.fdopen(fd, 'w') as file:
+            json.dump(evaluation, file, default=str)
+        os.replace(tmp_path, os.path.join(directory, EVALUATION_FILE))
+
+    def evaluation(self, key):
+        try:
+            with open(os.path.join(self.root, key, EVALUATION_FILE)) as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _remember(self, key, entry):
+        self._loaded[key] = entry
+        self._loaded.move_to_end(key)
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+
+    @staticmethod
+    def _versions(directory):
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(name[1:]) for name in names if re.fullmatch(r'v\d+', name))
+
+    def _latest_version(self, directory):
+        versions = self._versions(directory)
+        return versions[-1] if versions else 0
+
+    @staticmethod
+    def _read_latest(directory):
+        try:
+            with open(os.path.join(directory, LATEST_FILE)) as file:
+                return int(file.read().strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_latest(directory, version):
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.latest-')
+        with os.fdopen(fd, 'w') as file:
+            file.write(str(version))
+        os.replace(tmp_path, os.path.join(directory, LATEST_FILE))
+
+    def _prune(self, directory, latest):
+        for version in self._versions(directory):
+            if version <= latest - self.keep_versions:
+                shutil.rmtree(os.path.join(directory, f'v{version}'), ignore_errors=True)
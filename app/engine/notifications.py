@@ -0,0 +1,128 @@
+import logging
+import queue
+import random
+import threading
+import time
+
+from . import metrics
+from .PhilSMSClient import SMSDeliveryError
+
+logger = logging.getLogger(__name__)
+
+SMS_DELIVERY_SECONDS = metrics.histogram(
+    'sms_delivery_seconds', 'Time from enqueueing an SMS to the gateway accepting it.',
+    (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+SMS_MESSAGES = metrics.counter(
+    'sms_messages_total', 'Outbound SMS messages by outcome.', ('status',))
+
+
+class RateLimiter:
+    """A token bucket allowing ``rate`` acquisitions per second with bursts of ``burst``."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SMSDispatcher:
+    """An outbound SMS queue drained by a bounded pool of worker threads.
+
+    ``submit`` only enqueues, so callers never wait on the gateway. Workers
+    share the client's keep-alive session, respect a provider rate limit of
+    ``rate_per_minute`` and retry retriable failures with exponential
+    backoff (plus jitter) up to ``max_retries`` times.
+    """
+
+    def __init__(self, client, workers=2, max_queue=1000, max_retries=4, backoff=1.0, max_backoff=60.0,
+                 rate_per_minute=60):
+        self.client = client
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limiter = RateLimiter(rate_per_minute / 60.0, burst=max(1, workers))
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._threads = []
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self):
+        return self._queue.qsize()
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'sms-dispatcher-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, recipient, message):
+        """Queue a message for delivery. Returns False if the queue is full."""
+        self.start()
+        try:
+            self._queue.put_nowait((recipient, message, time.monotonic()))
+        except queue.Full:
+            SMS_MESSAGES.inc(status='dropped')
+            logger.error("SMS queue is full, dropping message to %s", recipient)
+            return False
+        return True
+
+    def stop(self, timeout=None):
+        """Wait for queued messages to be sent, then stop the workers."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._deliver(*item)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, recipient, message, enqueued_at):
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                data = self.client.deliver(recipient, message)
+            except SMSDeliveryError as e:
+                if not e.retriable or attempt == self.max_retries:
+                    SMS_MESSAGES.inc(status='failed')
+                    logger.error("SMS to %s failed after %d attempt(s): %s", recipient, attempt + 1, e)
+                    return
+                SMS_MESSAGES.inc(status='retried')
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+                time.sleep(delay * random.uniform(0.5, 1.0))
+            except Exception as e:
+                SMS_MESSAGES.inc(status='failed')
+                logger.error("SMS to %s failed: %s", recipient, e)
+                return
+            else:
+                latency = time.monotonic() - enqueued_at
+                SMS_DELIVERY_SECONDS.observe(latency)
+                SMS_MESSAGES.inc(status='delivered')
+                logger.info("SMS delivered to %s in %.2fs (uid %s)", recipient, latency, data.get('uid'))
+                return
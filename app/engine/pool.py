@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the wait timeout."""
+
+
+class ConnectionPool:
+    """A thread-safe, bounded pool of database connections.
+
+    Connections are created lazily by ``creator`` up to ``max_size``. Idle
+    connections older than ``max_lifetime`` seconds are closed on checkout,
+    and connections that sat idle longer than ``ping_after`` seconds are
+    pinged before being handed out. When the pool is exhausted, callers wait
+    up to ``timeout`` seconds before ``PoolTimeout`` is raised.
+
+    The pool only relies on ``threading`` primitives, so it cooperates with
+    gevent as long as ``gevent.monkey.patch_all()`` runs before the pool is
+    created (``Database`` creates its pool on first use).
+    """
+
+    def __init__(self, creator, min_size=1, max_size=10, max_lifetime=3600, timeout=10.0, ping_after=5.0):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.creator = creator
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.ping_after = ping_after
+
+        self._idle = deque()  # (connection, created_at, last_used_at)
+        self._created_at = {}
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def size(self):
+        """Number of connections currently open (idle and checked out)."""
+        return self._size
+
+    @property
+    def idle(self):
+        """Number of idle connections ready for checkout."""
+        return len(self._idle)
+
+    def warm(self):
+        """Open connections until at least ``min_size`` exist."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            connection = self._create()
+            with self._cond:
+                self._idle.append((connection, self._created_at[id(connection)], time.monotonic()))
+                self._cond.notify()
+
+    def acquire(self):
+        """Check out a healthy connection, waiting up to ``timeout`` seconds."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolTimeout("Connection pool is closed")
+                    if self._idle:
+                        connection, created_at, last_used_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        connection = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(f"No connection available within {self.timeout} seconds")
+                    self._cond.wait(remaining)
+
+            if connection is None:
+                return self._create()
+            if self._is_usable(connection, created_at, last_used_at):
+                return connection
+            self._discard(connection)
+
+    def release(self, connection, discard=False):
+        """Return a connection to the pool, or close it if ``discard`` is set."""
+        created_at = self._created_at.get(id(connection))
+        if discard or self._closed or created_at is None or self._expired(created_at):
+            self._discard(connection)
+            return
+        with self._cond:
+            self._idle.append((connection, created_at, time.monotonic()))
+            self._cond.notify()
+
+    def close(self):
+        """Close all idle connections and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for connection, _, _ in idle:
+            self._discard(connection)
+
+    def _create(self):
+        try:
+            connection = self.creator()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        self._created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _discard(self, connection):
+        self._created_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _expired(self, created_at):
+        return self.max_lifetime is not None and time.monotonic() - created_at > self.max_lifetime
+
+    def _is_usable(self, connection, created_at, last_used_at):
+        if self._expired(created_at):
+            return False
+        if self.ping_after is not None and time.monotonic() - last_used_at >= self.ping_after:
+            try:
+                connection.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
@@ -0,0 +1,139 @@
+import threading
+import time
+from bisect import bisect_left, insort
+
+
+class RollingMedian:
+    """A fixed-size ring buffer of ``(timestamp, value)`` readings with a streaming median.
+
+    A sorted copy of the buffered values is kept alongside the ring, so each
+    push costs one binary-search removal and one insertion instead of
+    re-sorting the window.
+    """
+
+    __slots__ = ('size', '_ring', '_next', '_count', '_sorted')
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.size = size
+        self._ring = [None] * size
+        self._next = 0
+        self._count = 0
+        self._sorted = []
+
+    def __len__(self):
+        return self._count
+
+    def push(self, value, timestamp=None):
+        """Add a reading, evicting the oldest one once the window is full."""
+        if self._count == self.size:
+            _, evicted = self._ring[self._next]
+            del self._sorted[bisect_left(self._sorted, evicted)]
+        else:
+            self._count += 1
+        self._ring[self._next] = (timestamp, value)
+        self._next = (self._next + 1) % self.size
+        insort(self._sorted, value)
+
+    @property
+    def median(self):
+        """Median of the buffered values, or ``None`` for an empty window."""
+        count = self._count
+        if not count:
+            return None
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    def readings(self):
+        """Buffered ``(timestamp, value)`` readings, oldest first."""
+        if self._count < self.size:
+            return self._ring[:self._count]
+        return self._ring[self._next:] + self._ring[:self._next]
+
+
+class FillLevelWindows:
+    """In-process rolling windows of the latest fill levels per ``(bin_id, waste_type)``.
+
+    On cold start the latest ``size`` readings of every bin are loaded with a
+    single windowed query. Afterwards ``sync`` only reads rows whose
+    ``record_id`` is above the highest one already seen.
+    """
+
+    LATEST_QUERY = """
+        SELECT latest.record_id, latest.bin_id, latest.waste_type, latest.timestamp, latest.fill_level,
+               waste_bins.bin_name, waste_type.name AS waste_type_name
+        FROM (
+            SELECT record_id, bin_id, waste_type, timestamp, fill_level,
+                   ROW_NUMBER() OVER (PARTITION BY bin_id, waste_type ORDER BY record_id DESC) AS row_num
+            FROM bin_fill_levels
+        ) AS latest
+        LEFT JOIN waste_bins ON waste_bins.bin_id = latest.bin_id
+        LEFT JOIN waste_type ON waste_type.waste_type_id = latest.waste_type
+        WHERE latest.row_num <= %s
+        ORDER BY latest.record_id;
+    """
+
+    NEW_READINGS_QUERY = """
+        SELECT bin_fill_levels.record_id, bin_fill_levels.bin_id, bin_fill_levels.waste_type,
+               bin_fill_levels.timestamp, bin_fill_levels.fill_level,
+               waste_bins.bin_name, waste_type.name AS waste_type_name
+        FROM bin_fill_levels
+        LEFT JOIN waste_bins ON waste_bins.bin_id = bin_fill_levels.bin_id
+        LEFT JOIN waste_type ON waste_type.waste_type_id = bin_fill_levels.waste_type
+        WHERE bin_fill_levels.record_id > %s
+        ORDER BY bin_fill_levels.record_id;
+    """
+
+    def __init__(self, db, size=10):
+        self.db = db
+        self.size = size
+        self.watermark = None
+        self.synced_at = None
+        self._windows = {}
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def sync(self, max_age=0):
+        """Fold new readings into the windows.
+
+        Skips the database entirely if the last sync is younger than
+        ``max_age`` seconds. Returns False if the database could not be read.
+        """
+        with self._lock:
+            if self.synced_at is not None and time.monotonic() - self.synced_at < max_age:
+                return True
+            if self.watermark is None:
+                rows = self.db.fetch(self.LATEST_QUERY, (self.size,))
+            else:
+                rows = self.db.fetch(self.NEW_READINGS_QUERY, (self.watermark,))
+            if rows is None:
+                return False
+
+            for row in rows:
+                key = (row['bin_id'], row['waste_type'])
+                window = self._windows.get(key)
+                if window is None:
+                    window = self._windows[key] = RollingMedian(self.size)
+                window.push(float(row['fill_level']), row['timestamp'])
+                self._names[key] = (row['bin_name'], row['waste_type_name'])
+                self.watermark = max(self.watermark or 0, row['record_id'])
+            if self.watermark is None:
+                self.watermark = 0
+            self.synced_at = time.monotonic()
+            return True
+
+    def median(self, bin_id, waste_type):
+        with self._lock:
+            window = self._windows.get((bin_id, waste_type))
+            return None if window is None else window.median
+
+    def snapshot(self):
+        """Return ``{(bin_id, waste_type): (bin_name, waste_type_name, median, readings)}``."""
+        with self._lock:
+            return {
+                key: (*self._names[key], window.median, window.readings())
+                for key, window in sorted(self._windows.items())
+            }
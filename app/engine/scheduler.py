@@ -0,0 +1,90 @@
+import heapq
+import threading
+import time
+from datetime import datetime
+
+
+def fill_rate_per_hour(readings, initial_depth):
+    """Percentage points of fill gained per hour across ``(timestamp, depth)`` readings.
+
+    Readings are oldest first. Emptying (a falling fill level) counts as no
+    growth, and so do windows without usable timestamps.
+    """
+    if len(readings) < 2 or not initial_depth:
+        return 0.0
+    (first_at, first_depth), (last_at, last_depth) = readings[0], readings[-1]
+    if first_at is None or last_at is None:
+        return 0.0
+    hours = (last_at - first_at).total_seconds() / 3600
+    if hours <= 0:
+        return 0.0
+    gained = (first_depth - last_depth) / initial_depth * 100
+    return max(gained / hours, 0.0)
+
+
+class BinScheduler:
+    """Per-bin next-check times kept in a priority queue.
+
+    Each bin is rescheduled after a check based on how long it would take
+    to reach the alert threshold at its recent fill rate: bins close to
+    full (or filling fast) come back after ``min_interval`` seconds, idle
+    ones after up to ``max_interval``. During school hours intervals are
+    scaled by ``school_hours_factor``. Bins the scheduler has not seen yet
+    are always due.
+    """
+
+    def __init__(self, min_interval=10, max_interval=600, school_hours=(7, 17), school_hours_factor=0.5,
+                 safety_factor=0.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.school_hours = school_hours
+        self.school_hours_factor = school_hours_factor
+        self.safety_factor = safety_factor
+        self._heap = []  # (due_at, key); stale entries are skipped lazily
+        self._due_at = {}
+        self._lock = threading.Lock()
+
+    def in_school_hours(self, now=None):
+        now = now or datetime.now()
+        start, end = self.school_hours
+        return now.weekday() < 5 and start <= now.hour < end
+
+    def interval(self, percentage_full, rate_per_hour, alert_threshold, now=None):
+        """Seconds until a bin with this fill level and fill rate should be checked again."""
+        headroom = alert_threshold - percentage_full
+        if headroom <= 0:
+            interval = self.min_interval
+        elif rate_per_hour > 0:
+            interval = headroom / rate_per_hour * 3600 * self.safety_factor
+        else:
+            interval = self.max_interval
+        if self.in_school_hours(now):
+            interval *= self.school_hours_factor
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def is_due(self, key, at=None):
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            due_at = self._due_at.get(key)
+        return due_at is None or due_at <= at
+
+    def reschedule(self, key, percentage_full, rate_per_hour, alert_threshold):
+        """Schedule the next check of ``key`` and return the chosen interval."""
+        interval = self.interval(percentage_full, rate_per_hour, alert_threshold)
+        due_at = time.monotonic() + interval
+        with self._lock:
+            self._due_at[key] = due_at
+            heapq.heappush(self._heap, (due_at, key))
+        return interval
+
+    def seconds_until_next(self):
+        """Seconds until the earliest scheduled check, capped at ``max_interval``.
+
+        With nothing scheduled yet, waits ``min_interval`` before looking again.
+        """
+        with self._lock:
+            while self._heap and self._due_at.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return self.min_interval
+            return min(max(self._heap[0][0] - time.monotonic(), 0.0), self.max_interval)
@@ -0,0 +1,90 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsProvider:
+    """A shared, cached view of the ``system_settings`` table.
+
+    All settings are loaded with one query and kept in memory. At most once
+    every ``check_interval`` seconds a reader triggers a cheap version query
+    (row count plus a CRC32 sum over every name/value pair); the full table
+    is only reloaded when that version changes. Subscribers are called with
+    ``{name: new_value}`` for every setting that changed.
+    """
+
+    LOAD_QUERY = "SELECT setting_name, setting_value FROM system_settings;"
+    VERSION_QUERY = """
+        SELECT COUNT(*) AS setting_count,
+               COALESCE(SUM(CRC32(CONCAT(setting_name, '=', COALESCE(setting_value, '')))), 0) AS checksum
+        FROM system_settings;
+    """
+
+    def __init__(self, db, check_interval=10.0):
+        self.db = db
+        self.check_interval = check_interval
+        self.version = None
+        self.checked_at = None
+        self._values = {}
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def get(self, name, default=None, cast=None):
+        """Return a setting, converted with ``cast`` when given, or ``default`` if it is missing."""
+        self.refresh()
+        value = self._values.get(name)
+        if value is None:
+            return default
+        return cast(value) if cast else value
+
+    def all(self):
+        self.refresh()
+        return dict(self._values)
+
+    def subscribe(self, callback):
+        """Call ``callback(changes)`` whenever settings change. Usable as a decorator."""
+        self._subscribers.append(callback)
+        return callback
+
+    def refresh(self, force=False):
+        """Reload the settings if the version check is due and reports a change.
+
+        Once settings are loaded, readers never wait on another thread's
+        refresh; they keep using the cached values instead.
+        """
+        if not self._lock.acquire(blocking=force or self.version is None):
+            return
+        try:
+            now = time.monotonic()
+            if not force and self.checked_at is not None and now - self.checked_at < self.check_interval:
+                return
+            self.checked_at = now
+
+            row = self.db.fetch_one(self.VERSION_QUERY)
+            if row is None:
+                return
+            version = (row['setting_count'], int(row['checksum']))
+            if version == self.version:
+                return
+
+            rows = self.db.fetch(self.LOAD_QUERY)
+            if rows is None:
+                return
+            values = {row['setting_name']: row['setting_value'] for row in rows}
+            changes = {name: values.get(name) for name in values.keys() | self._values.keys()
+                       if values.get(name) != self._values.get(name)}
+            first_load = self.version is None
+            self._values = values
+            self.version = version
+        finally:
+            self._lock.release()
+
+        if changes and not first_load:
+            logger.info("System settings changed: %s", ', '.join(sorted(changes)))
+            for callback in list(self._subscribers):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    logger.error("Settings subscriber failed: %s", e)
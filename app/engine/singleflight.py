@@ -0,0 +1,50 @@
+import logging
+import os
+
+from filelock import FileLock, Timeout
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT = metrics.counter(
+    'training_single_flight_total', 'Training claims by outcome: trained here, served the previous model '
+    'while another caller trained, or waited for it.', ('result',))
+
+
+class SingleFlight:
+    """Lets exactly one caller at a time, across threads and processes, work on a key.
+
+    Each key maps to a lock file under ``root``. ``try_claim`` never blocks:
+    the caller that gets the lock does the work, and everyone else either
+    carries on with what they have or calls ``wait`` to block until the
+    owner is done. Locks are released by the operating system if the owner
+    dies, so a crashed trainer never wedges a key.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _lock(self, key):
+        os.makedirs(self.root, exist_ok=True)
+        return FileLock(os.path.join(self.root, f'{key}.lock'))
+
+    def try_claim(self, key):
+        """Return the held lock for ``key``, or None if another caller owns it."""
+        lock = self._lock(key)
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            return None
+        return lock
+
+    def wait(self, key, timeout):
+        """Block until the current owner of ``key`` releases it. Returns False on timeout."""
+        lock = self._lock(key)
+        try:
+            lock.acquire(timeout=timeout)
+        except Timeout:
+            logger.warning("Gave up waiting %ss for %s", timeout, key)
+            return False
+        lock.release()
+        return True
@@ -0,0 +1,206 @@
+import logging
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import metrics
+from .model_registry import ModelRegistry
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+FEATURES = ['hour', 'day_of_week', 'day_of_month', 'month', 'lag_1']
+
+PARAM_GRID = {
+    'n_estimators': [100, 200],
+    'max_depth': [3, 5, 7],
+    'learning_rate': [0.01, 0.1, 0.2]
+}
+
+# Trained forecast models, one registry key per (bin_id, waste_type) series
+model_registry = ModelRegistry(os.path.join('model_cache', 'models'),
+                               max_loaded=int(os.getenv('MODEL_CACHE_SIZE', 256)))
+metrics.callback_gauge('model_cache_entries', 'Models held in the in-process registry cache.',
+                       lambda: len(model_registry))
+# One trainer per series across threads and worker processes
+training_claims = SingleFlight(os.path.join('model_cache', 'locks'))
+
+# Cores forecasting may use in total, split between pool workers and XGBoost threads.
+FORECAST_CPU_BUDGET = int(os.getenv('FORECAST_CPU_BUDGET', 0)) or os.cpu_count() or 1
+
+# 'halving' (successive halving with early stopping) or 'grid' (exhaustive GridSearchCV)
+FORECAST_TUNING = os.getenv('FORECAST_TUNING', 'halving')
+# Per-series limits for halving: fits started and seconds spent before the best so far is taken
+FORECAST_TUNING_MAX_FITS = int(os.getenv('FORECAST_TUNING_MAX_FITS', 20))
+FORECAST_TUNING_TIME_BUDGET = float(os.getenv('FORECAST_TUNING_TIME_BUDGET', 60))
+
+# Halving searches depth and learning rate; early stopping picks the tree count up to this cap
+MAX_ESTIMATORS = 2 * max(PARAM_GRID['n_estimators'])
+EARLY_STOPPING_ROUNDS = 20
+HALVING_FACTOR = 3
+# Smallest training slice a halving rung uses (two days of hourly readings)
+MIN_RUNG_ROWS = 48
+
+
+def split_budget(budget, tasks):
+    """Split ``budget`` cores into ``(workers, threads_per_worker)`` for ``tasks`` independent fits.
+
+    Whole series are the unit of parallelism, so cores go to pool workers
+    first; only cores left over once every series has a worker are handed
+    to XGBoost as extra threads.
+    """
+    budget = max(1, budget)
+    workers = max(1, min(budget, tasks))
+    return workers, max(1, budget // workers)
+
+
+def fit_series(X_train, y_train, n_jobs=1, previous=None, tuning=None, **params):
+    """Tune and fit an XGBoost regressor for one series and return it.
+
+    ``previous`` holds the hyperparameters of the series' last model and
+    warm-starts halving; the grid search ignores it. Extra ``params`` are
+    passed to every ``XGBRegressor`` (e.g. ``enable_categorical``).
+    """
+    if (tuning or FORECAST_TUNING) == 'grid':
+        return grid_search_series(X_train, y_train, n_jobs, **params)
+    return halving_search_series(X_train, y_train, n_jobs, previous, **params)
+
+
+def grid_search_series(X_train, y_train, n_jobs=1, **params):
+    """Grid-search an XGBoost regressor with 3-fold CV and return the best estimator."""
+    from sklearn.model_selection import GridSearchCV
+    from xgboost import XGBRegressor
+
+    model = XGBRegressor(objective='reg:squarederror', n_jobs=n_jobs, **params)
+    grid_search = GridSearchCV(model, PARAM_GRID, cv=3, scoring='neg_mean_squared_error', n_jobs=1)
+    grid_search.fit(X_train, y_train)
+    return grid_search.best_estimator_
+
+
+def halving_candidates(previous=None):
+    """``(max_depth, learning_rate)`` pairs to search, nearest to ``previous`` first.
+
+    Without usable previous parameters this is the whole grid; with them,
+    only the previous pair and its direct grid neighbours.
+    """
+    depths, rates = PARAM_GRID['max_depth'], PARAM_GRID['learning_rate']
+    grid = [(depth, rate) for depth in depths for rate in rates]
+    if not previous or previous.get('max_depth') not in depths or previous.get('learning_rate') not in rates:
+        return grid
+    d, r = depths.index(previous['max_depth']), rates.index(previous['learning_rate'])
+    steps = [(d, r), (d - 1, r), (d + 1, r), (d, r - 1), (d, r + 1)]
+    return [(depths[i], rates[j]) for i, j in steps if 0 <= i < len(depths) and 0 <= j < len(rates)]
+
+
+def halving_search_series(X_train, y_train, n_jobs=1, previous=None, max_fits=None, time_budget=None, **params):
+    """Tune by successive halving with early stopping, then refit the winner on all of ``X_train``.
+
+    The newest 20% of the training rows are held out for validation. Every
+    candidate is first fitted on the most recent slice of the rest; only
+    the best third advances to a slice ``HALVING_FACTOR`` times larger,
+    until one candidate is fitted on all of it. Early stopping on the
+    validation rows replaces the search over ``n_estimators``. Tuning stops
+    early once ``max_fits`` fits were started or ``time_budget`` seconds
+    have passed, keeping the best candidate so far.
+    """
+    from xgboost import XGBRegressor
+
+    max_fits = max_fits or FORECAST_TUNING_MAX_FITS
+    time_budget = time_budget or FORECAST_TUNING_TIME_BUDGET
+    split = int(len(X_train) * 0.8)
+    if split < MIN_RUNG_ROWS or split == len(X_train):
+        return grid_search_series(X_train, y_train, n_jobs, **params)
+    X_fit, y_fit = X_train.iloc[:split], y_train.iloc[:split]
+    X_val, y_val = X_train.iloc[split:], y_train.iloc[split:]
+
+    candidates = halving_candidates(previous)
+    rungs = math.ceil(math.log(len(candidates), HALVING_FACTOR)) + 1
+    started = time.monotonic()
+    fits = 0
+    best = None
+    for rung in range(rungs):
+        rows = max(MIN_RUNG_ROWS, split // HALVING_FACTOR ** (rungs - 1 - rung))
+        scored = []
+        for depth, rate in candidates:
+            if fits >= max_fits or time.monotonic() - started > time_budget:
+                break
+            model = XGBRegressor(objective='reg:squarederror', n_estimators=MAX_ESTIMATORS, max_depth=depth,
+                                 learning_rate=rate, early_stopping_rounds=EARLY_STOPPING_ROUNDS, n_jobs=n_jobs,
+                                 **params)
+            model.fit(X_fit.iloc[-rows:], y_fit.iloc[-rows:], eval_set=[(X_val, y_val)], verbose=False)
+            fits += 1
+            scored.append((model.best_score, depth, rate, model.best_iteration + 1))
+        if not scored:
+            break
+        scored.sort()
+        best = scored[0]
+        candidates = [(depth, rate) for _, depth, rate, _ in scored[:max(1, len(scored) // HALVING_FACTOR)]]
+
+    _, depth, rate, n_estimators = best
+    model = XGBRegressor(objective='reg:squarederror', n_estimators=n_estimators, max_depth=depth,
+                         learning_rate=rate, n_jobs=n_jobs, **params)
+    model.fit(X_train, y_train)
+    logger.debug("Halving picked max_depth=%d learning_rate=%s n_estimators=%d after %d fits",
+                 depth, rate, n_estimators, fits)
+    return model
+
+
+def continue_training(model, X, y, extra_trees, n_jobs=None):
+    """Boost up to ``extra_trees`` more trees onto ``model`` using only ``X``/``y``; returns a new model.
+
+    The new trees use ``model``'s tuned parameters (depth, learning rate,
+    categorical support), so ``model`` must carry them; models from the
+    registry do.
+    """
+    from xgboost import XGBRegressor
+
+    params = model.get_params()
+    updated = XGBRegressor(**dict(params, n_estimators=extra_trees, early_stopping_rounds=None,
+                                  n_jobs=n_jobs or FORECAST_CPU_BUDGET))
+    updated.fit(X, y, xgb_model=model.get_booster())
+    # The saved hyperparameters warm-start the next tuning, so keep the tuned tree count, not the extra trees
+    updated.set_params(n_estimators=params['n_estimators'])
+    return updated
+
+
+def train_many(series, budget=None, **params):
+    """Fit every ``{key: (X_train, y_train, previous_params)}`` series and return ``{key: model}``.
+
+    Series are trained one per task on a process pool sized from the CPU
+    budget, with XGBoost limited to its share of the cores so workers never
+    oversubscribe them. Series that fail to train are logged and left out
+    of the result. Extra ``params`` go to every ``XGBRegressor``.
+    """
+    if not series:
+        return {}
+    workers, n_jobs = split_budget(budget or FORECAST_CPU_BUDGET, len(series))
+    started = time.perf_counter()
+    models = {}
+
+    if workers == 1:
+        for key, (X_train, y_train, previous) in series.items():
+            try:
+                models[key] = fit_series(X_train, y_train, n_jobs, previous, **params)
+            except Exception as e:
+                logger.error("Error during model training for %s: %s", key, e)
+    else:
+        # Spawned workers start clean instead of inheriting the server's threads and open connections
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {executor.submit(fit_series, X_train, y_train, n_jobs, previous, FORECAST_TUNING, **params): key
+                       for key, (X_train, y_train, previous) in series.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    models[key] = future.result()
+                except Exception as e:
+                    logger.error("Error during model training for %s: %s", key, e)
+
+    # n_jobs was this run's share of the budget; predictions and later fits get the whole machine again
+    for model in models.values():
+        model.set_params(n_jobs=None)
+    logger.info("Trained %d/%d series in %.1fs (%d workers x %d threads)",
+                len(models), len(series), time.perf_counter() - started, workers, n_jobs)
+    return models
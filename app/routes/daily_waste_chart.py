@@ -4,6 +4,13 @@ import pandas as pd
 from app.engine import db
 from datetime import datetime, timedelta
 
+DAILY_WASTE_DTYPES = {
+    'date': 'datetime64[D]',
+    'bin_name': 'category',
+    'waste_type': 'category',
+    'count': 'int32',
+}
+
 def create_dash_app(server, pathname, bin_id):
     dash_app = Dash(__name__, server=server, url_base_pathname=pathname)
 
@@ -33,12 +40,12 @@ def create_dash_app(server, pathname, bin_id):
         ORDER BY DATE(waste_data.timestamp);
         """
         try:
-            rows = db.fetch(sql, (bin_id,))
+            columns = db.fetch_columns(sql, (bin_id,), dtypes=DAILY_WASTE_DTYPES, ttl=10)
 
-            if not rows:
+            if not columns or len(columns['date']) == 0:
                 return go.Figure(), "No data available for the selected waste type."
 
-            df = pd.DataFrame(rows, columns=['date', 'bin_name', 'waste_type', 'count'])
+            df = pd.DataFrame(columns, columns=['date', 'bin_name', 'waste_type', 'count'])
 
             fig = go.Figure()
 
@@ -1,189 +1,134 @@
 import os
-import pickle
 import time
-from datetime import timedelta, datetime
-import pandas as pd
-import numpy as np
-from xgboost import XGBRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_absolute_error, mean_squared_error, mean_absolute_percentage_error
-from app.engine import db
-from sklearn.model_selection import GridSearchCV
-import plotly.graph_objects as go
-import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output
+from datetime import datetime
+from app.engine import forecast_jobs, settings
+from app.engine import forecast_store
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
-initial_depth = float(db.fetch_one("SELECT setting_value FROM system_settings WHERE setting_name = 'initial_depth';")['setting_value'])
-
-def cache_model(model, model_filename, last_trained_time):
-    with open(model_filename, 'wb') as file:
-        pickle.dump({'model': model, 'last_trained_time': last_trained_time}, file, protocol=pickle.HIGHEST_PROTOCOL)
-
-def load_cached_model(model_filename):
-    if os.path.exists(model_filename):
-        with open(model_filename, 'rb') as file:
-            cached_data = pickle.load(file)
-            return cached_data['model'], cached_data['last_trained_time']
-    return None, None
-
-def two_day_school_hours():
-    query = """
-        SELECT bin_fill_levels.*, waste_bins.bin_name, waste_type.name AS waste_type_name 
-        FROM bin_fill_levels 
-        INNER JOIN waste_bins ON bin_fill_levels.bin_id = waste_bins.bin_id 
-        INNER JOIN waste_type ON waste_type.waste_type_id = bin_fill_levels.waste_type 
-    """
+# Per-bin results of two_day_school_hours() keyed by str(bin_id), read by the graph callback
+bin_forecasts = forecast_store.ForecastStore(
+    os.path.join('model_cache', 'dash_forecast.json'),
+    max_age=float(os.getenv('FORECAST_REFRESH_INTERVAL', 3600)))
+
+def two_day_school_hours(bin_id=None):
+    # The forecasting stack (pandas, xgboost) is only loaded by the process that computes forecasts
+    from app.engine.forecasting import FORECAST_MODEL, forecast_series
+    from app.engine.history import load_fill_level_series
+
+    initial_depth = settings.get('initial_depth', cast=float)
+    if initial_depth is None:
+        logging.error("The initial_depth setting is unavailable.")
+        return {}
+
     try:
-        data = db.fetch(query) 
+        # Per-series models need only the bin's own history; the global model is scored on every series
+        history = load_fill_level_series(None if FORECAST_MODEL == 'global' else bin_id)
     except Exception as e:
         logging.error(f"Error fetching data from database: {e}")
         return {}
 
-    df = pd.DataFrame(data, columns=['bin_id', 'bin_name', 'waste_type_name', 'timestamp', 'fill_level'])
-
-    if df.empty:
+    if not history:
         logging.warning("The fetched data is empty. Please check the database query.")
         return {}
 
-    df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-    df['fill_level'] = pd.to_numeric(df['fill_level'], errors='coerce')
-    df.dropna(subset=['timestamp', 'fill_level'], inplace=True)
-
-    df['hour'] = df['timestamp'].dt.hour
-    df['day_of_week'] = df['timestamp'].dt.dayofweek
-    df['day_of_month'] = df['timestamp'].dt.day
-    df['month'] = df['timestamp'].dt.month
-    df['lag_1'] = df['fill_level'].shift(1).fillna(0)
-
     forecast_results = {}
     days_to_forecast = 5
     all_hours = list(range(24)) 
+    computed_at = datetime.now().isoformat(timespec='seconds')
 
-    cache_dir = 'model_cache'
-    os.makedirs(cache_dir, exist_ok=True)
-
-    for (bin_id, waste_type), bin_data in df.groupby(['bin_id', 'waste_type_name']):
-        bin_name = bin_data['bin_name'].iloc[0]
-        bin_data = bin_data.sort_values(by='timestamp')
-
-        X = bin_data[['hour', 'day_of_week', 'day_of_month', 'month', 'lag_1']]
-        y = bin_data['fill_level']
-
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, shuffle=False)
-
-        model_filename = f'{cache_dir}/xgboost_model_bin_{bin_id}_waste_{waste_type}.pkl'
-        model_fit, last_trained_time = load_cached_model(model_filename)
-
-        if model_fit is None or (datetime.now() - last_trained_time).total_seconds() > 86400:
-            param_grid = {
-                'n_estimators': [100, 200],
-                'max_depth': [3, 5, 7],
-                'learning_rate': [0.01, 0.1, 0.2]
-            }
-            model = XGBRegressor(objective='reg:squarederror')
-            grid_search = GridSearchCV(model, param_grid, cv=3, scoring='neg_mean_squared_error')
-            try:
-                grid_search.fit(X_train, y_train)
-                model_fit = grid_search.best_estimator_
-                cache_model(model_fit, model_filename, datetime.now())
-            except Exception as e:
-                logging.error(f"Error during model training: {e}")
-                continue
-
-        try:
-            y_pred = model_fit.predict(X_test)
-
-            mae = mean_absolute_error(y_test, y_pred)
-            mse = mean_squared_error(y_test, y_pred)
-            mape = mean_absolute_percentage_error(y_test, y_pred)
-            accuracy_score = 100 - mape * 100
-            logging.info(f"Accuracy Score for Bin {bin_name}, Waste Type {waste_type}: {accuracy_score:.2f}%")
-
-        except Exception as e:
-            logging.error(f"Error during model evaluation: {e}")
-            continue
-
-        future_dates = []
-        current_date = datetime.now()
-
-        for day_offset in range(1, days_to_forecast + 1):
-            for hour in all_hours:  # Predict for every hour (0 to 23)
-                future_time = datetime.combine(
-                    (current_date + timedelta(days=day_offset)).date(),
-                    datetime.min.time()
-                ) + timedelta(hours=hour)
-                future_dates.append({
-                    'timestamp': future_time,
-                    'hour': future_time.hour,
-                    'day_of_week': future_time.weekday(),
-                    'day_of_month': future_time.day,
-                    'month': future_time.month,
-                    'lag_1': y.iloc[-1] 
-                })
-
-        future_df = pd.DataFrame(future_dates)
-        future_X = future_df[['hour', 'day_of_week', 'day_of_month', 'month', 'lag_1']]
-
-        try:
-            forecast_values = model_fit.predict(future_X)
-        except Exception as e:
-            logging.error(f"Error during forecasting: {e}")
-            continue
-
+    for series in forecast_series(history, all_hours, days_to_forecast, only_bin=bin_id):
         bin_forecast = []
-        for i, future in enumerate(future_dates):
-            future_fill_level = min(max(forecast_values[i], 0), 100)
+        for future_time, future_fill_level in zip(series['times'], series['forecast']):
+            future_fill_level = min(max(future_fill_level, 0), 100)
             filled_height = initial_depth - future_fill_level
             percentage_full = (filled_height / initial_depth) * 100
 
             bin_forecast.append({
-                'datetime': future['timestamp'].strftime('%Y-%m-%d %H:%M'),
-                'date': future['timestamp'].strftime('%Y-%m-%d'),
-                'time': future['timestamp'].strftime('%H:%M'),
+                'datetime': future_time.strftime('%Y-%m-%d %H:%M'),
+                'date': future_time.strftime('%Y-%m-%d'),
+                'time': future_time.strftime('%H:%M'),
                 'predicted_level': float("{:.2f}".format(percentage_full))
             })
 
-        if bin_id not in forecast_results:
-            forecast_results[bin_id] = {
-                'bin_name': bin_name,
+        key = str(series['bin_id'])
+        if key not in forecast_results:
+            forecast_results[key] = {
+                'bin_name': series['bin_name'],
+                'computed_at': computed_at,
                 'waste_types': {}
             }
 
-        forecast_results[bin_id]['waste_types'][waste_type] = bin_forecast
+        forecast_results[key]['waste_types'][series['waste_type']] = bin_forecast
 
     return forecast_results
 
 
-def create_dash_forecast(server, pathname): 
-    forecast_results = two_day_school_hours()
+def refresh_bin_forecasts(bin_id=None):
+    """Recompute the forecast of ``bin_id``, or of every bin, into the Dash forecast cache."""
+    if bin_id is None:
+        return forecast_store.refresh(bin_forecasts, two_day_school_hours)
+    started = time.perf_counter()
+    forecast_results = two_day_school_hours(int(bin_id))
+    if not forecast_results:
+        logging.warning(f"Forecast for bin {bin_id} came back empty, keeping the previous result")
+        return {'series': 0, 'stored': False}
+    bin_forecasts.update(forecast_results)
+    logging.info(f"Stored forecast for bin {bin_id} in {time.perf_counter() - started:.1f}s")
+    return {'series': len(forecast_results), 'stored': True}
+
+
+@settings.subscribe
+def refresh_on_depth_change(changes):
+    # Stored percentages were computed with the old initial_depth
+    if 'initial_depth' in changes:
+        forecast_jobs.submit('dash-forecast', refresh_bin_forecasts)
+
+
+def create_dash_forecast(server, pathname, jobs):
+    """Mount the forecast dashboard at ``pathname``.
+
+    Callbacks only read ``bin_forecasts``; computing forecasts is left to
+    ``jobs``, where "Force Update Model" queues a refresh of the selected
+    bin and the page picks the result up on its next interval tick.
+    Dash and plotly are imported here, so processes that only read or
+    refresh ``bin_forecasts`` never load them.
+    """
+    import plotly.graph_objects as go
+    import dash
+    from dash import dcc, html
+    from dash.dependencies import Input, Output
 
     app = dash.Dash(__name__, server=server, url_base_pathname=pathname)
 
-    app.layout = html.Div([
-        dcc.Dropdown(
-            id='bin-selector',
-            options=[{'label': res['bin_name'], 'value': bin_id} for bin_id, res in forecast_results.items()],
-            value=list(forecast_results.keys())[0] if forecast_results else None,
-            placeholder="Select a Bin to View Forecast",
-        ),
-        dcc.Interval(
-            id='interval-component',
-            interval=24*60*60*1000,
-            n_intervals=0
-        ),
-        dcc.Graph(id='forecast-graph'),
-        dcc.Checklist(
-            id='force-update',
-            options=[{'label': 'Force Update Model', 'value': 'update'}],
-            value=[],
-            style={'margin': '20px'}
-        ),
-        html.Div(id='debug-output') 
-    ])
+    def serve_layout():
+        entry = bin_forecasts.get()
+        forecast_results = entry['data'] if entry else {}
+        return html.Div([
+            dcc.Dropdown(
+                id='bin-selector',
+                options=[{'label': res['bin_name'], 'value': bin_id} for bin_id, res in forecast_results.items()],
+                value=next(iter(forecast_results), None),
+                placeholder="Select a Bin to View Forecast",
+            ),
+            dcc.Interval(
+                id='interval-component',
+                interval=60*1000,
+                n_intervals=0
+            ),
+            dcc.Graph(id='forecast-graph'),
+            dcc.Checklist(
+                id='force-update',
+                options=[{'label': 'Force Update Model', 'value': 'update'}],
+                value=[],
+                style={'margin': '20px'}
+            ),
+            html.Div(id='debug-output') 
+        ])
+
+    # Built per page load, so the bin list follows the cache instead of the state at startup
+    app.layout = serve_layout
 
     @app.callback(
         [Output('forecast-graph', 'figure'),
@@ -193,13 +138,22 @@ def create_dash_forecast(server, pathname):
          Input('force-update', 'value')]
     )
     def update_graph(selected_bin_id, n_intervals, force_update):
-        forecast_results = two_day_school_hours()
+        cached = bin_forecasts.get()
+        # A stale entry is still served while the refresh runs
+        if cached is None or bin_forecasts.is_stale():
+            jobs.submit('dash-forecast', refresh_bin_forecasts)
+        if cached is None:
+            return go.Figure(), "Forecasts are being computed, please check back shortly."
+        forecast_results = cached['data']
 
         if selected_bin_id is None or selected_bin_id not in forecast_results:
             return go.Figure(), "Please select a valid bin from the dropdown."
 
-        if 'update' in force_update:
-            forecast_results = two_day_school_hours()
+        status = f"Forecast computed at {forecast_results[selected_bin_id]['computed_at']}."
+        triggered = [trigger['prop_id'] for trigger in dash.callback_context.triggered]
+        if 'update' in force_update and 'force-update.value' in triggered:
+            _, created = jobs.submit(f'forecast-bin-{selected_bin_id}', refresh_bin_forecasts, selected_bin_id)
+            status += " Update started." if created else " Update already running."
 
         selected_bin = forecast_results[selected_bin_id]
         fig = go.Figure()
@@ -233,6 +187,6 @@ def create_dash_forecast(server, pathname):
             paper_bgcolor="#f4f4f4"
         )
 
-        return fig, "Forecast updated successfully."
+        return fig, status
 
     return app
@@ -0,0 +1,11 @@
+from app.engine import forecast_jobs
+from app.routes.daily_waste_chart import cas_dash, cbme_dash, cte_dash
+from app.routes.dash_forecast import create_dash_forecast
+
+
+def mount_dashboards(server):
+    """Mount the daily waste and forecast Dash apps on the Flask ``server``."""
+    cas_dash(server)
+    cte_dash(server)
+    cbme_dash(server)
+    create_dash_forecast(server, '/api/forecast/', forecast_jobs)
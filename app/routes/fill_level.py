@@ -1,22 +1,36 @@
 from flask import Blueprint, jsonify
-from ..engine import fetch_waste_bin_levels
-import numpy as np
+from ..engine import fill_level_windows, settings
 fill_level_bp = Blueprint('fill_level', __name__)
 
+# Gauge requests reuse the in-memory windows if they were synced this recently (seconds)
+GAUGE_SYNC_INTERVAL = 5
+
+
 @fill_level_bp.route('/gauge', methods=['GET'])
 @fill_level_bp.route('/gauge/<waste_type>', methods=['GET'])
 def gauge(waste_type=None):
     if waste_type:
-        data = fetch_waste_bin_levels(waste_type)
+        fill_level_windows.sync(max_age=GAUGE_SYNC_INTERVAL)
+        initial_depth = settings.get('initial_depth', cast=float)
+        if not initial_depth:
+            response = jsonify({"error": "The initial_depth setting is unavailable"})
+            response.status_code = 503
+            return response
 
-        recyclable_levels = [item['current_fill_level'] for item in data if item['name'] == 'Recyclable']
-        non_recyclable_levels = [item['current_fill_level'] for item in data if item['name'] == 'Non-Recyclable']
+        # The route parameter is the bin id; medians come from the rolling windows
+        medians = {
+            waste_type_name: measured_depth
+            for (bin_id, _), (_, waste_type_name, measured_depth, _) in fill_level_windows.snapshot().items()
+            if str(bin_id) == waste_type
+        }
 
-        recyclable_median = int(np.median(recyclable_levels)) if recyclable_levels else 0
-        non_recyclable_median = int(np.median(non_recyclable_levels)) if non_recyclable_levels else 0
+        def percentage_full(name):
+            if medians.get(name) is None:
+                return 0
+            return int((initial_depth - medians[name]) / initial_depth * 100)
 
         gauge_values = {
-            "recyclable_bin": recyclable_median,
-            "non_recyclable_bin": non_recyclable_median
+            "recyclable_bin": percentage_full('Recyclable'),
+            "non_recyclable_bin": percentage_full('Non-Recyclable')
         }
-        return jsonify(gauge_values)
\ No newline at end of file
+        return jsonify(gauge_values)
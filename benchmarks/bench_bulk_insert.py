@@ -0,0 +1,75 @@
+"""Compare write throughput of single-row ``Database.execute`` calls,
+``Database.execute_many`` and ``Database.bulk_insert`` when loading a
+90-day hourly fill level history.
+
+Runs against a scratch table on a local MySQL-compatible server, for example:
+
+    docker run -d -p 3306:3306 -e MARIADB_ROOT_PASSWORD=bench -e MARIADB_DATABASE=bench mariadb:11
+
+    BENCH_DB_PASSWORD=bench BENCH_BINS=300 python benchmarks/bench_bulk_insert.py
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engine.database import Database  # noqa: E402
+
+HOST = os.getenv('BENCH_DB_HOST', '127.0.0.1')
+USER = os.getenv('BENCH_DB_USER', 'root')
+PASSWORD = os.getenv('BENCH_DB_PASSWORD', '')
+NAME = os.getenv('BENCH_DB_NAME', 'bench')
+BINS = int(os.getenv('BENCH_BINS', 100))
+DAYS = int(os.getenv('BENCH_DAYS', 90))
+# Single-row inserts are timed on a sample and extrapolated; the full load takes too long.
+SINGLE_ROW_SAMPLE = int(os.getenv('BENCH_SINGLE_ROW_SAMPLE', 2000))
+
+INSERT = "INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES (%s, %s, %s, %s)"
+COLUMNS = ['bin_id', 'waste_type', 'timestamp', 'fill_level']
+
+
+def history(bins, days):
+    start = datetime.now() - timedelta(days=days)
+    for bin_id in range(1, bins + 1):
+        for waste_type in (1, 2):
+            for hour in range(days * 24):
+                yield bin_id, waste_type, start + timedelta(hours=hour), round(10 + (hour * 7 + bin_id) % 55, 2)
+
+
+def reset(db):
+    db.execute("DROP TABLE IF EXISTS bin_fill_levels;")
+    db.execute("""
+        CREATE TABLE bin_fill_levels (
+            record_id INT AUTO_INCREMENT PRIMARY KEY, bin_id INT, waste_type INT,
+            timestamp DATETIME, fill_level DECIMAL(5, 2));
+    """)
+
+
+def report(label, rows, elapsed, extrapolated=False):
+    note = ' (extrapolated)' if extrapolated else ''
+    print(f"{label:<14} rows={rows:<9} time={elapsed:9.2f}s throughput={rows / elapsed:11.0f} rows/s{note}")
+
+
+if __name__ == '__main__':
+    db = Database(HOST, USER, PASSWORD, NAME, slow_query_threshold=None)
+    total = BINS * 2 * DAYS * 24
+
+    reset(db)
+    sample = list(history(BINS, DAYS))[:SINGLE_ROW_SAMPLE]
+    started = time.perf_counter()
+    for row in sample:
+        db.execute(INSERT, row)
+    elapsed = time.perf_counter() - started
+    report('execute', total, elapsed * total / len(sample), extrapolated=True)
+
+    reset(db)
+    started = time.perf_counter()
+    db.execute_many(INSERT, history(BINS, DAYS))
+    report('execute_many', total, time.perf_counter() - started)
+
+    reset(db)
+    started = time.perf_counter()
+    db.bulk_insert('bin_fill_levels', COLUMNS, history(BINS, DAYS), batch_size=5000)
+    report('bulk_insert', total, time.perf_counter() - started)
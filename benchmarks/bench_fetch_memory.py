@@ -0,0 +1,103 @@
+"""Compare peak Python memory of loading the fill level history with
+``Database.fetch`` versus the streamed, typed ``Database.fetch_columns``.
+
+Creates its own ``bin_fill_levels``/``waste_bins``/``waste_type`` tables in
+a scratch database on a local MySQL-compatible server and grows the history
+between runs, for example:
+
+    docker run -d -p 3306:3306 -e MARIADB_ROOT_PASSWORD=bench -e MARIADB_DATABASE=bench mariadb:11
+
+    BENCH_DB_PASSWORD=bench python benchmarks/bench_fetch_memory.py
+"""
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+import app.engine as engine  # noqa: E402
+from app.engine.database import Database  # noqa: E402
+
+HOST = os.getenv('BENCH_DB_HOST', '127.0.0.1')
+USER = os.getenv('BENCH_DB_USER', 'root')
+PASSWORD = os.getenv('BENCH_DB_PASSWORD', '')
+NAME = os.getenv('BENCH_DB_NAME', 'bench')
+SIZES = [int(size) for size in os.getenv('BENCH_SIZES', '50000,200000,800000').split(',')]
+
+HISTORY_QUERY = """
+    SELECT bin_fill_levels.bin_id, waste_bins.bin_name, waste_type.name AS waste_type_name,
+           bin_fill_levels.timestamp, bin_fill_levels.fill_level
+    FROM bin_fill_levels
+    INNER JOIN waste_bins ON bin_fill_levels.bin_id = waste_bins.bin_id
+    INNER JOIN waste_type ON waste_type.waste_type_id = bin_fill_levels.waste_type
+"""
+HISTORY_COLUMNS = ['bin_id', 'bin_name', 'waste_type_name', 'timestamp', 'fill_level']
+HISTORY_DTYPES = {
+    'bin_id': 'int32',
+    'bin_name': 'category',
+    'waste_type_name': 'category',
+    'timestamp': 'datetime64[s]',
+    'fill_level': 'float32',
+}
+
+SCHEMA = [
+    "DROP TABLE IF EXISTS bin_fill_levels, waste_bins, waste_type;",
+    "CREATE TABLE waste_bins (bin_id INT PRIMARY KEY, bin_name VARCHAR(64));",
+    "CREATE TABLE waste_type (waste_type_id INT PRIMARY KEY, name VARCHAR(64));",
+    """CREATE TABLE bin_fill_levels (
+        record_id INT AUTO_INCREMENT PRIMARY KEY, bin_id INT, waste_type INT,
+        timestamp DATETIME, fill_level DECIMAL(5, 2));""",
+    "INSERT INTO waste_bins VALUES (1, 'CAS'), (2, 'CTE'), (3, 'CBME');",
+    "INSERT INTO waste_type VALUES (1, 'Recyclable'), (2, 'Non-Recyclable');",
+]
+
+
+def grow_history(db, total, target):
+    start = datetime(2024, 1, 1)
+    with db.connection() as connection:
+        with connection.cursor() as cursor:
+            for offset in range(total, target, 10000):
+                rows = [
+                    (i % 3 + 1, i % 2 + 1, start + timedelta(hours=i), 10 + i % 55)
+                    for i in range(offset, min(offset + 10000, target))
+                ]
+                cursor.executemany(
+                    "INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES (%s, %s, %s, %s)",
+                    rows)
+
+
+def measure(load):
+    tracemalloc.start()
+    df = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(df), peak / 2 ** 20
+
+
+def load_buffered():
+    df = pd.DataFrame(engine.db.fetch(HISTORY_QUERY), columns=HISTORY_COLUMNS)
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    df['fill_level'] = pd.to_numeric(df['fill_level'])
+    return df
+
+
+def load_streamed():
+    columns = engine.db.fetch_columns(HISTORY_QUERY, dtypes=HISTORY_DTYPES, chunk_size=10000)
+    return pd.DataFrame(columns, columns=HISTORY_COLUMNS, copy=False)
+
+
+if __name__ == '__main__':
+    engine.db = Database(HOST, USER, PASSWORD, NAME)
+    for statement in SCHEMA:
+        engine.db.execute(statement)
+
+    total = 0
+    for size in SIZES:
+        grow_history(engine.db, total, size)
+        total = size
+        rows, buffered_peak = measure(load_buffered)
+        _, streamed_peak = measure(load_streamed)
+        print(f"rows={rows:<9} fetch peak={buffered_peak:8.1f} MiB   fetch_columns peak={streamed_peak:8.1f} MiB")
@@ -0,0 +1,67 @@
+"""Import-time and memory report for each entry point, from ``python -X importtime``.
+
+Every entry point is imported in a fresh interpreter. The report lists
+wall-clock import time, peak RSS, which heavy libraries got loaded and
+the slowest imports by cumulative time, so a module-level import of
+pandas, plotly or xgboost creeping back into a light process shows up:
+
+    BENCH_ENTRY_POINTS=api,monitor,dashboard,train,main BENCH_TOP=10 python benchmarks/bench_imports.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = os.getenv('BENCH_ENTRY_POINTS', 'api,monitor,dashboard,train,main').split(',')
+TOP = int(os.getenv('BENCH_TOP', 10))
+HEAVY = ('numpy', 'pandas', 'plotly', 'dash', 'sklearn', 'xgboost')
+
+# Runs in the child process; prints one JSON line on stdout, importtime goes to stderr
+CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+import {module}
+print(json.dumps({{
+    'seconds': time.perf_counter() - started,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def parse_importtime(stderr):
+    """``[(cumulative_us, module)]`` for every line of ``-X importtime`` output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), name.strip()))
+    return imports
+
+
+def measure(module):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             CHILD.format(root=ROOT, module=module, heavy=HEAVY)],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report['imports'] = parse_importtime(result.stderr)
+    return report
+
+
+def main():
+    reports = {module: measure(module) for module in ENTRY_POINTS}
+    print(f"{'entry point':<12} {'import':>8} {'peak RSS':>9}  heavy libraries loaded")
+    for module, report in reports.items():
+        print(f"{module:<12} {report['seconds']:7.2f}s {report['rss_mb']:7.0f}MB  "
+              f"{', '.join(report['heavy']) or '-'}")
+    for module, report in reports.items():
+        print(f"\n{module}: slowest imports (cumulative)")
+        for cumulative, name in sorted(report['imports'], reverse=True)[:TOP]:
+            print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compare per-call latency of Database with and without connection pooling.
+
+Runs against a local MySQL-compatible server, for example:
+
+    docker run -d -p 3306:3306 -e MARIADB_ROOT_PASSWORD=bench -e MARIADB_DATABASE=bench mariadb:11
+
+    BENCH_DB_PASSWORD=bench python benchmarks/bench_pool.py
+"""
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engine.database import Database  # noqa: E402
+
+HOST = os.getenv('BENCH_DB_HOST', '127.0.0.1')
+USER = os.getenv('BENCH_DB_USER', 'root')
+PASSWORD = os.getenv('BENCH_DB_PASSWORD', '')
+NAME = os.getenv('BENCH_DB_NAME', 'bench')
+CALLS = int(os.getenv('BENCH_CALLS', 500))
+THREADS = int(os.getenv('BENCH_THREADS', 8))
+
+
+def timed_calls(db, calls):
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        db.fetch_one("SELECT 1 AS one;")
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<28} calls={len(latencies):<6} mean={statistics.mean(latencies) * 1000:7.3f}ms "
+          f"p95={p95 * 1000:7.3f}ms throughput={len(latencies) / elapsed:9.1f}/s")
+
+
+def run(pooled, threads):
+    db = Database(HOST, USER, PASSWORD, NAME, pooled=pooled, pool_max_size=threads)
+    timed_calls(db, 5)  # warm up
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = executor.map(timed_calls, [db] * threads, [CALLS // threads] * threads)
+        latencies = [latency for result in results for latency in result]
+    elapsed = time.perf_counter() - started
+    db.close()
+    return latencies, elapsed
+
+
+if __name__ == '__main__':
+    for threads in (1, THREADS):
+        for pooled in (False, True):
+            label = f"{'pooled' if pooled else 'unpooled'} x{threads} threads"
+            report(label, *run(pooled, threads))
@@ -0,0 +1,70 @@
+"""Time how long a fresh process takes to import ``main`` and answer ``/healthz``.
+
+Each run starts a new interpreter in an empty working directory (no
+cached models or forecasts) with every MySQL connection refused, so it
+measures a cold start with the database down. Import must not try the
+database, and ``/readyz`` is expected to report 503 while the database
+is unreachable:
+
+    BENCH_RUNS=5 python benchmarks/bench_startup.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(os.getenv('BENCH_RUNS', 5))
+
+# Runs in the child process; prints one JSON line of timings
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import pymysql
+
+attempts = []
+
+def refuse(*args, **kwargs):
+    attempts.append(1)
+    raise pymysql.err.OperationalError(2003, "benchmark: database disabled")
+
+pymysql.connect = refuse
+import main
+imported = time.perf_counter()
+import_attempts = len(attempts)
+client = main.app.test_client()
+health = client.get('/healthz').status_code
+healthy = time.perf_counter()
+ready = client.get('/readyz').status_code
+print(json.dumps({{
+    'import': imported - started,
+    'healthz': healthy - started,
+    'healthz_status': health,
+    'readyz_status': ready,
+    'import_db_attempts': import_attempts,
+}}))
+"""
+
+
+def run_once():
+    with tempfile.TemporaryDirectory() as workdir:
+        output = subprocess.run([sys.executable, '-c', CHILD.format(root=ROOT)], cwd=workdir,
+                                capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = [run_once() for _ in range(RUNS)]
+    for name in ('import', 'healthz'):
+        values = [run[name] for run in runs]
+        print(f"{name:>8}: median {statistics.median(values):6.2f}s  max {max(values):6.2f}s")
+    last = runs[-1]
+    print(f"/healthz {last['healthz_status']}, /readyz {last['readyz_status']}, "
+          f"database connections tried during import: {max(run['import_db_attempts'] for run in runs)}")
+
+
+if __name__ == '__main__':
+    main()
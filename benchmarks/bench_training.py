@@ -0,0 +1,64 @@
+"""Time a full retrain of synthetic bins with ``train_many`` under
+increasing CPU budgets, to check that wall-clock time drops roughly
+linearly with cores.
+
+Needs no database; each synthetic series is an hourly fill level history
+with a school-day cycle and noise, featurized like the forecast routes do:
+
+    BENCH_BINS=16 BENCH_DAYS=60 BENCH_BUDGETS=1,2,4,8 python benchmarks/bench_training.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engine.training import FEATURES, split_budget, train_many  # noqa: E402
+
+BINS = int(os.getenv('BENCH_BINS', 16))
+DAYS = int(os.getenv('BENCH_DAYS', 60))
+BUDGETS = [int(budget) for budget in os.getenv(
+    'BENCH_BUDGETS', ','.join(str(2 ** i) for i in range(8) if 2 ** i <= (os.cpu_count() or 1))).split(',')]
+
+
+def synthetic_series(seed):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range('2024-01-01', periods=DAYS * 24, freq='h')
+    school_hours = (timestamps.dayofweek < 5) & (timestamps.hour >= 7) & (timestamps.hour < 17)
+    fill_level = np.clip(60 - np.cumsum(np.where(school_hours, rng.uniform(0.5, 3.0), 0.1)) % 60
+                         + rng.normal(0, 2, len(timestamps)), 0, 65)
+    frame = pd.DataFrame({
+        'hour': timestamps.hour,
+        'day_of_week': timestamps.dayofweek,
+        'day_of_month': timestamps.day,
+        'month': timestamps.month,
+        'lag_1': np.roll(fill_level, 1),
+    })
+    return frame[FEATURES], pd.Series(fill_level)
+
+
+def main():
+    series = {}
+    for bin_id in range(BINS):
+        for waste_type in (0, 1):
+            X, y = synthetic_series(bin_id * 2 + waste_type)
+            train_rows = int(len(X) * 0.8)
+            series[(bin_id, waste_type)] = X.iloc[:train_rows], y.iloc[:train_rows], None
+    print(f"{len(series)} series x {DAYS * 24} hourly readings, {os.cpu_count()} cores available")
+
+    baseline = None
+    for budget in BUDGETS:
+        workers, n_jobs = split_budget(budget, len(series))
+        started = time.perf_counter()
+        models = train_many(series, budget=budget)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"budget {budget:>3}: {workers:>3} workers x {n_jobs} threads  "
+              f"{elapsed:8.1f}s  speedup {baseline / elapsed:4.1f}x  ({len(models)} models)")
+
+
+if __name__ == '__main__':
+    main()
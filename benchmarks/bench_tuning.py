@@ -0,0 +1,52 @@
+"""Compare the exhaustive ``GridSearchCV`` retrain with successive-halving
+tuning, cold and warm-started from the grid's choice, on synthetic bins.
+
+Reports the mean tuning time per series and the mean absolute error on the
+newest 20% of each series, which no tuning method sees:
+
+    BENCH_BINS=8 BENCH_DAYS=60 python benchmarks/bench_tuning.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.engine.training import grid_search_series, halving_search_series  # noqa: E402
+from bench_training import synthetic_series  # noqa: E402
+
+BINS = int(os.getenv('BENCH_BINS', 8))
+
+
+def run(name, fit, series):
+    elapsed, errors, models = [], [], []
+    for X_train, y_train, X_test, y_test, previous in series:
+        started = time.perf_counter()
+        model = fit(X_train, y_train, previous)
+        elapsed.append(time.perf_counter() - started)
+        errors.append(float(np.mean(np.abs(model.predict(X_test) - y_test.to_numpy()))))
+        models.append(model)
+    print(f"{name:<16} {np.mean(elapsed):8.2f}s/series  MAE {np.mean(errors):6.2f}")
+    return np.mean(elapsed), models
+
+
+def main():
+    series = []
+    for index in range(BINS * 2):
+        X, y = synthetic_series(index)
+        train_rows = int(len(X) * 0.8)
+        series.append([X.iloc[:train_rows], y.iloc[:train_rows], X.iloc[train_rows:], y.iloc[train_rows:], None])
+    print(f"{len(series)} series x {len(series[0][0]) + len(series[0][2])} hourly readings")
+
+    grid_time, grid_models = run('grid (3-fold)', lambda X, y, previous: grid_search_series(X, y), series)
+    cold_time, _ = run('halving (cold)', lambda X, y, previous: halving_search_series(X, y), series)
+    for entry, model in zip(series, grid_models):
+        entry[4] = model.get_params()
+    warm_time, _ = run('halving (warm)', lambda X, y, previous: halving_search_series(X, y, previous=previous), series)
+    print(f"speedup vs grid: cold {grid_time / cold_time:.1f}x, warm {grid_time / warm_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
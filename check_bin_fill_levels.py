@@ -1,69 +1,127 @@
 from app.engine.PhilSMSClient import PhilSMSClient
-from app.engine import db  
-import statistics
+from app.engine import db, fill_level_windows, metrics, settings
+from app.engine.leader import FileLeaderLock, MySQLLeaderLock
+from app.engine.notifications import SMSDispatcher
+from app.engine.scheduler import fill_rate_per_hour
 import os
 from dotenv import load_dotenv
 import asyncio
+import tempfile
+import threading
 from datetime import datetime, timedelta
 
 # Load environment variables from .env file
 load_dotenv()
 
-async def check_bin_fill_levels():
-    api_token = os.getenv('API_TOKEN')
-    sender_id = os.getenv('SENDER_ID')
-    sms_client = PhilSMSClient(token=api_token, sender_id=sender_id)
-
-    # Retrieve alert threshold and recipient number from system_settings
-    alert_threshold = int(db.fetch_one("SELECT setting_value FROM system_settings WHERE setting_name = 'alert_threshold';")['setting_value'])
-    recipient_number = db.fetch_one("SELECT setting_value FROM system_settings WHERE setting_name = 'sms_receiver';")['setting_value']
-    initial_depth = float(db.fetch_one("SELECT setting_value FROM system_settings WHERE setting_name = 'initial_depth';")['setting_value'])
-
-    # Get unique bin and waste type combinations
-    unique_bins_query = "SELECT DISTINCT bin_id, waste_type FROM bin_fill_levels;"
-    unique_bins = db.fetch(unique_bins_query)
-
-    for bin in unique_bins:
-        bin_id = bin['bin_id']
-        waste_type = bin['waste_type']
-
-        # Query the last 50 fill levels for the specific bin_id and waste_type
-        query = f"SELECT fill_level FROM bin_fill_levels WHERE bin_id = {bin_id} AND waste_type = {waste_type} ORDER BY record_id DESC LIMIT 10;"
-        results = db.fetch(query)
-
-        if not results:
+# Alerts are queued here and sent by background workers, so a slow gateway never stalls the check
+sms_dispatcher = SMSDispatcher(
+    PhilSMSClient(token=os.getenv('API_TOKEN'), sender_id=os.getenv('SENDER_ID')),
+    workers=int(os.getenv('SMS_WORKERS', 2)),
+    rate_per_minute=int(os.getenv('SMS_RATE_PER_MINUTE', 60))
+)
+metrics.callback_gauge('sms_queue_depth', 'SMS messages waiting to be sent.', lambda: sms_dispatcher.pending)
+
+# Serializes the background monitor and manual checks within this process
+_check_lock = threading.Lock()
+
+# Serializes the alert section across processes (and hosts, with the MySQL backend), so a manual check
+# in any worker cannot race the monitor leader between reading recent alerts and logging a new one
+if os.getenv('MONITOR_LEADER_LOCK', 'file') == 'mysql':
+    _alert_lock = MySQLLeaderLock(db, name='ebasura-alerts')
+else:
+    _alert_lock = FileLeaderLock(
+        os.getenv('ALERT_LOCK_FILE') or os.path.join(tempfile.gettempdir(), 'ebasura-alerts.lock'))
+# Seconds a check waits for another process's alert section before skipping its own alerts
+ALERT_LOCK_TIMEOUT = float(os.getenv('ALERT_LOCK_TIMEOUT', 30))
+
+RECENT_ALERTS_QUERY = "SELECT DISTINCT bin_id, waste_type_id FROM waste_alerts WHERE timestamp >= %s;"
+
+
+async def check_bin_fill_levels(scheduler=None):
+    """Check bin fill levels, queue alerts for full bins and return per-bin results.
+
+    With a ``BinScheduler``, only bins that are due are checked, and each
+    checked bin is rescheduled from its fill level and fill rate.
+    """
+    with _check_lock:
+        return _check_bin_fill_levels(scheduler)
+
+
+def _check_bin_fill_levels(scheduler):
+    # Retrieve alert threshold and recipient number from the cached system_settings
+    alert_threshold = settings.get('alert_threshold', cast=int)
+    recipient_number = settings.get('sms_receiver')
+    initial_depth = settings.get('initial_depth', cast=float)
+    if alert_threshold is None or recipient_number is None or initial_depth is None:
+        print("System settings are unavailable, skipping bin check.")
+        return []
+
+    # Fold readings that arrived since the last tick into the in-memory windows
+    if not fill_level_windows.sync():
+        return []
+
+    results = []
+    for (bin_id, waste_type), (bin_name, waste_type_name, measured_depth, readings) in fill_level_windows.snapshot().items():
+        if scheduler is not None and not scheduler.is_due((bin_id, waste_type)):
             continue
 
-        fill_levels = [record['fill_level'] for record in results]
-        measured_depth = statistics.median(fill_levels)
-        measured_depth = float(measured_depth)
-
-
         filled_height = initial_depth - measured_depth
         percentage_full = round((filled_height / initial_depth) * 100, 2)
-
-        # Check for recent alerts (within the last hour) in waste_alerts
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        recent_alert_query = """
-            SELECT * FROM waste_alerts 
-            WHERE bin_id = %s AND waste_type_id = %s AND timestamp >= %s
-            ORDER BY timestamp DESC LIMIT 1;
-        """
-        recent_alert = db.fetch_one(recent_alert_query, (bin_id, waste_type, one_hour_ago))
+        result = {
+            'bin_id': bin_id,
+            'bin_name': bin_name,
+            'waste_type': waste_type,
+            'waste_type_name': waste_type_name,
+            'percentage_full': percentage_full,
+            'fill_rate_per_hour': round(fill_rate_per_hour(readings, initial_depth), 2),
+            'alert_sent': False
+        }
+        results.append(result)
+        if scheduler is not None:
+            result['next_check_in'] = round(scheduler.reschedule(
+                (bin_id, waste_type), percentage_full, result['fill_rate_per_hour'], alert_threshold), 1)
+
+    candidates = [result for result in results if result['percentage_full'] > alert_threshold]
+    if not candidates:
+        _log_no_alerts(results)
+        return results
+    if not _alert_lock.acquire(ALERT_LOCK_TIMEOUT):
+        print("Another check is sending alerts, skipping alerts for this check.")
+        return results
+    try:
+        _send_alerts(results, alert_threshold, recipient_number)
+    finally:
+        _alert_lock.release()
+    return results
+
+
+def _log_no_alerts(results):
+    for result in results:
+        print(f"Bin {result['bin_id']} (Waste Type {result['waste_type']}): No alert sent, "
+              f"fill level at {result['percentage_full']:.2f}% or recent alert found.")
+
+
+def _send_alerts(results, alert_threshold, recipient_number):
+    # Bins that already had an alert within the last hour; read under the alert lock, so no other check
+    # can log an alert between this read and our inserts
+    one_hour_ago = datetime.now() - timedelta(hours=1)
+    recent_alerts = db.fetch(RECENT_ALERTS_QUERY, (one_hour_ago,)) or []
+    alerted = {(alert['bin_id'], alert['waste_type_id']) for alert in recent_alerts}
+
+    for result in results:
+        bin_id, waste_type = result['bin_id'], result['waste_type']
+        bin_name, waste_type_name = result['bin_name'], result['waste_type_name']
+        percentage_full = result['percentage_full']
 
         # Only proceed if no recent alert has been sent in the past hour
-        if percentage_full > alert_threshold and not recent_alert:
-            # Dynamically fetch bin and waste type names from the database
-            bin_name_query = "SELECT bin_name FROM waste_bins WHERE bin_id = %s;"
-            bin_name = db.fetch_one(bin_name_query, (bin_id,))['bin_name']
-
-            waste_type_name_query = "SELECT name FROM waste_type WHERE waste_type_id = %s;"
-            waste_type_name = db.fetch_one(waste_type_name_query, (waste_type,))['name']
-
+        if percentage_full > alert_threshold and (bin_id, waste_type) not in alerted:
             if bin_name and waste_type_name:
                 message_content = f'{bin_name} Bin, {waste_type_name} Bin is {percentage_full}% full'
 
-                sms_client.send_sms(recipient=recipient_number, message=message_content)
+                if not sms_dispatcher.submit(recipient=recipient_number, message=message_content):
+                    # Not logged, so the next check tries this bin again
+                    print(f"Alert for Bin {bin_name} ({waste_type_name}) was dropped, SMS queue is full.")
+                    continue
 
                 # Log the alert in the waste_alerts table
                 insert_query = """
@@ -71,7 +129,8 @@ async def check_bin_fill_levels():
                     VALUES (%s, %s, %s, NOW());
                 """
                 db.execute(insert_query, (bin_id, waste_type, message_content))
+                result['alert_sent'] = True
 
-                print(f"Alert sent for Bin {bin_name} ({waste_type_name}).")
+                print(f"Alert queued for Bin {bin_name} ({waste_type_name}).")
         else:
             print(f"Bin {bin_id} (Waste Type {waste_type}): No alert sent, fill level at {percentage_full:.2f}% or recent alert found.")
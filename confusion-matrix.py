@@ -1,5 +1,3 @@
-import os
-import pickle
 import time
 from datetime import timedelta, datetime
 import pandas as pd
@@ -10,20 +8,6 @@ from sklearn.ensemble import RandomForestRegressor
 import xgboost as xgb
 
 
-# Caching Functions
-def cache_model(model, model_filename, last_trained_time):
-    with open(model_filename, 'wb') as file:
-        pickle.dump({'model': model, 'last_trained_time': last_trained_time}, file)
-
-
-def load_cached_model(model_filename):
-    if os.path.exists(model_filename):
-        with open(model_filename, 'rb') as file:
-            cached_data = pickle.load(file)
-            return cached_data['model'], cached_data['last_trained_time']
-    return None, None
-
-
 # SQL Data Fetching and Forecasting Function
 def two_day_school_hours(algorithm="prophet"):
     query = """
@@ -43,32 +27,18 @@ def two_day_school_hours(algorithm="prophet"):
     hours_to_forecast = 48
     working_hours = list(range(8, 17, 4))  # 8 AM to 4 PM
 
-    cache_dir = 'model_cache'
-    os.makedirs(cache_dir, exist_ok=True)
-
     for (bin_id, waste_type), bin_data in df.groupby(['bin_id', 'waste_type_name']):
         bin_name = bin_data['bin_name'].iloc[0]
         bin_data = bin_data.sort_values(by='timestamp')
         time_series_data = bin_data.set_index('timestamp')['fill_level']
 
-        model_filename = f'{cache_dir}/model_bin_{bin_id}_waste_{waste_type}.pkl'
-        model_fit, last_trained_time = load_cached_model(model_filename)
-
-        # If no cached model exists or the model needs to be retrained, train the model and generate forecast values
-        if model_fit is None or (datetime.now() - last_trained_time).total_seconds() > 86400:
-
-            if algorithm == "prophet":
-                forecast_values = train_prophet_model(bin_data)  # Prophet forecast values
-            elif algorithm == "random_forest":
-                forecast_values = train_random_forest(bin_data)  # Random Forest forecast values
-            elif algorithm == "xgboost":
-                forecast_values = train_xgboost(bin_data)  # XGBoost forecast values
-
-            # Cache the trained model and forecast data for future use
-            cache_model(model_fit, model_filename, datetime.now())
-
-        else:
-            forecast_values = model_fit  # Prophet, Random Forest, and XGBoost forecast values
+        # Forecasts are recomputed on every run so the algorithms are compared on the same data
+        if algorithm == "prophet":
+            forecast_values = train_prophet_model(bin_data)  # Prophet forecast values
+        elif algorithm == "random_forest":
+            forecast_values = train_random_forest(bin_data)  # Random Forest forecast values
+        elif algorithm == "xgboost":
+            forecast_values = train_xgboost(bin_data)  # XGBoost forecast values
 
         last_timestamp = bin_data['timestamp'].max()
         bin_forecast = []
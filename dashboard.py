@@ -0,0 +1,14 @@
+"""The Dash dashboards on their own Flask app (``gunicorn dashboard:app``).
+
+Forecast graphs read the shared forecast cache; refreshes are queued on
+the job runner, so this process never trains at import.
+"""
+from flask import Flask
+from app.routes.dashboards import mount_dashboards
+import os
+
+app = Flask(__name__)
+mount_dashboards(app)
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=int(os.getenv('DASHBOARD_PORT', 5001)), use_reloader=False)
@@ -1,2028 +1,1016 @@
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-07 19:14:52', 56.89);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-07 20:14:52', 59.21);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-07 21:14:52', 61.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-07 22:14:52', 64.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-07 23:14:52', 65.92);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 00:14:52', 67.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 01:14:52', 69.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 02:14:52', 69.72);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 03:14:52', 69.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 04:14:52', 71.43);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 05:14:52', 72.42);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 06:14:52', 74.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 07:14:52', 75.83);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 08:14:52', 76.41);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 09:14:52', 79.88);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 10:14:52', 81.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 11:14:52', 83.72);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 12:14:52', 84.30);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 13:14:52', 85.75);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 14:14:52', 87.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 15:14:52', 88.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 16:14:52', 91.09);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 17:14:52', 92.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 18:14:52', 94.19);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 19:14:52', 95.59);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 20:14:52', 99.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-08 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-09 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 09:14:52', 99.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-10 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 00:14:52', 17.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 01:14:52', 18.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 02:14:52', 20.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 03:14:52', 23.10);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 04:14:52', 24.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 05:14:52', 27.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 06:14:52', 28.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 07:14:52', 29.52);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 08:14:52', 31.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 09:14:52', 31.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 10:14:52', 36.64);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 11:14:52', 37.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 12:14:52', 40.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 13:14:52', 41.80);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 14:14:52', 43.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 15:14:52', 45.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 16:14:52', 46.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 17:14:52', 47.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 18:14:52', 49.32);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 19:14:52', 50.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 20:14:52', 51.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 21:14:52', 54.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 22:14:52', 57.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-11 23:14:52', 59.30);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 00:14:52', 61.21);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 01:14:52', 64.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 02:14:52', 67.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 03:14:52', 67.21);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 04:14:52', 70.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 05:14:52', 74.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 06:14:52', 78.08);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 07:14:52', 79.87);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 08:14:52', 81.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 09:14:52', 83.91);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 10:14:52', 85.29);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 11:14:52', 87.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 12:14:52', 89.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 13:14:52', 92.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 14:14:52', 94.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 15:14:52', 96.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 16:14:52', 98.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-12 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-13 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 00:14:52', 7.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 01:14:52', 10.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 02:14:52', 10.79);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 03:14:52', 13.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 04:14:52', 17.17);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 05:14:52', 19.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 06:14:52', 20.95);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 07:14:52', 22.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 08:14:52', 23.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 09:14:52', 25.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 10:14:52', 29.10);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 11:14:52', 31.53);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 12:14:52', 34.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 13:14:52', 35.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 14:14:52', 37.75);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 15:14:52', 38.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 16:14:52', 39.61);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 17:14:52', 42.48);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 18:14:52', 44.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 1, '2024-11-14 19:14:52', 47.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-07 19:14:52', 36.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-07 20:14:52', 39.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-07 21:14:52', 43.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-07 22:14:52', 44.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-07 23:14:52', 47.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 00:14:52', 50.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 01:14:52', 53.08);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 02:14:52', 53.30);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 03:14:52', 55.06);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 04:14:52', 57.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 05:14:52', 59.89);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 06:14:52', 61.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 07:14:52', 64.10);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 08:14:52', 68.22);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 09:14:52', 71.77);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 10:14:52', 72.82);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 11:14:52', 74.22);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 12:14:52', 76.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 13:14:52', 76.36);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 14:14:52', 77.02);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 15:14:52', 77.40);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 16:14:52', 78.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 17:14:52', 81.64);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 18:14:52', 82.79);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 19:14:52', 83.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 20:14:52', 86.64);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 21:14:52', 88.19);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 22:14:52', 90.61);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-08 23:14:52', 91.88);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 00:14:52', 93.22);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 01:14:52', 93.52);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 02:14:52', 96.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 03:14:52', 96.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 04:14:52', 97.56);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-09 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-10 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-11 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 10:14:52', 99.78);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-12 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-13 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (1, 2, '2024-11-14 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-07 19:14:52', 68.15);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-07 20:14:52', 70.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-07 21:14:52', 69.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-07 22:14:52', 72.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-07 23:14:52', 72.79);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 00:14:52', 75.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 01:14:52', 78.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 02:14:52', 79.17);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 03:14:52', 80.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 04:14:52', 81.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 05:14:52', 84.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 06:14:52', 86.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 07:14:52', 88.09);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 08:14:52', 89.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 09:14:52', 91.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 10:14:52', 92.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 11:14:52', 94.91);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 12:14:52', 95.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 13:14:52', 96.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 14:14:52', 97.95);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 15:14:52', 99.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 16:14:52', 99.82);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-08 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 00:14:52', 14.27);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 01:14:52', 17.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 02:14:52', 18.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 03:14:52', 19.27);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 04:14:52', 22.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 05:14:52', 24.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 06:14:52', 27.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 07:14:52', 28.15);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 08:14:52', 29.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 09:14:52', 31.56);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 10:14:52', 33.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 11:14:52', 35.15);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 12:14:52', 37.78);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 13:14:52', 38.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 14:14:52', 40.57);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 15:14:52', 42.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 16:14:52', 45.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 17:14:52', 47.91);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 18:14:52', 48.79);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 19:14:52', 49.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 20:14:52', 52.53);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 21:14:52', 54.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 22:14:52', 56.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-09 23:14:52', 59.67);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 00:14:52', 61.78);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 01:14:52', 63.95);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 02:14:52', 67.10);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 03:14:52', 70.13);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 04:14:52', 72.30);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 05:14:52', 73.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 06:14:52', 75.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 07:14:52', 78.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 08:14:52', 81.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 09:14:52', 82.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 10:14:52', 84.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 11:14:52', 84.87);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 12:14:52', 88.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 13:14:52', 91.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 14:14:52', 93.06);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 15:14:52', 95.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 16:14:52', 95.09);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 17:14:52', 96.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 18:14:52', 99.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-10 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 00:14:52', 9.34);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 01:14:52', 10.19);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 02:14:52', 11.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 03:14:52', 11.77);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 04:14:52', 14.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 05:14:52', 14.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 06:14:52', 18.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 07:14:52', 18.77);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 08:14:52', 22.27);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 09:14:52', 23.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 10:14:52', 25.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 11:14:52', 27.17);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 12:14:52', 30.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 13:14:52', 32.89);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 14:14:52', 35.96);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 15:14:52', 38.04);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 16:14:52', 40.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 17:14:52', 43.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 18:14:52', 44.48);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 19:14:52', 45.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 20:14:52', 45.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 21:14:52', 47.95);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 22:14:52', 49.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-11 23:14:52', 49.32);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 00:14:52', 7.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 01:14:52', 11.48);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 02:14:52', 13.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 03:14:52', 14.81);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 04:14:52', 17.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 05:14:52', 18.91);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 06:14:52', 20.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 07:14:52', 23.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 08:14:52', 26.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 09:14:52', 27.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 10:14:52', 28.96);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 11:14:52', 30.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 12:14:52', 30.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 13:14:52', 30.87);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 14:14:52', 34.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 15:14:52', 37.88);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 16:14:52', 39.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 17:14:52', 42.21);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 18:14:52', 44.52);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 19:14:52', 49.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 20:14:52', 52.72);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 21:14:52', 54.59);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 22:14:52', 55.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-12 23:14:52', 56.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 00:14:52', 58.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 01:14:52', 60.04);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 02:14:52', 62.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 03:14:52', 62.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 04:14:52', 64.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 05:14:52', 65.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 06:14:52', 67.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 07:14:52', 69.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 08:14:52', 72.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 09:14:52', 75.34);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 10:14:52', 77.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 11:14:52', 79.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 12:14:52', 81.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 13:14:52', 85.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 14:14:52', 88.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 15:14:52', 90.06);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 16:14:52', 93.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 17:14:52', 95.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 18:14:52', 96.59);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 19:14:52', 99.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-13 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 1, '2024-11-14 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-07 19:14:52', 74.57);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-07 20:14:52', 76.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-07 21:14:52', 76.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-07 22:14:52', 77.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-07 23:14:52', 79.34);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 00:14:52', 81.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 01:14:52', 82.32);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 02:14:52', 84.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 03:14:52', 85.04);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 04:14:52', 86.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 05:14:52', 88.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 06:14:52', 89.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 07:14:52', 91.19);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 08:14:52', 94.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 09:14:52', 95.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 10:14:52', 98.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 11:14:52', 99.33);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 14:14:52', 99.53);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-08 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 06:14:52', 99.79);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 13:14:52', 99.77);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-09 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 00:14:52', 13.92);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 01:14:52', 17.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 02:14:52', 20.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 03:14:52', 22.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 04:14:52', 25.51);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 05:14:52', 28.52);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 06:14:52', 30.02);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 07:14:52', 32.41);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 08:14:52', 35.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 09:14:52', 36.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 10:14:52', 39.80);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 11:14:52', 41.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 12:14:52', 43.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 13:14:52', 44.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 14:14:52', 46.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 15:14:52', 45.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 16:14:52', 47.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 17:14:52', 52.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 18:14:52', 53.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 19:14:52', 58.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 20:14:52', 61.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 21:14:52', 63.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 22:14:52', 65.41);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-10 23:14:52', 67.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 00:14:52', 69.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 01:14:52', 73.56);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 02:14:52', 74.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 03:14:52', 75.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 04:14:52', 76.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 05:14:52', 77.42);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 06:14:52', 80.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 07:14:52', 82.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 08:14:52', 85.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 09:14:52', 86.33);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 10:14:52', 87.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 11:14:52', 89.66);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 12:14:52', 91.05);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 13:14:52', 94.35);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 14:14:52', 95.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 15:14:52', 97.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 16:14:52', 99.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-11 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 05:14:52', 99.22);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-12 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 03:14:52', 99.88);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 13:14:52', 98.43);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-13 23:14:52', 99.83);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (2, 2, '2024-11-14 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-07 19:14:52', 73.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-07 20:14:52', 74.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-07 21:14:52', 78.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-07 22:14:52', 78.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-07 23:14:52', 81.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 00:14:52', 81.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 01:14:52', 81.77);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 02:14:52', 85.46);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 03:14:52', 87.67);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 04:14:52', 89.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 05:14:52', 91.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 06:14:52', 93.43);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 07:14:52', 95.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 08:14:52', 98.50);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-08 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 12:14:52', 99.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-09 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 00:14:52', 10.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 01:14:52', 10.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 02:14:52', 12.82);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 03:14:52', 13.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 04:14:52', 15.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 05:14:52', 17.97);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 06:14:52', 20.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 07:14:52', 21.72);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 08:14:52', 26.02);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 09:14:52', 26.75);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 10:14:52', 27.42);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 11:14:52', 31.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 12:14:52', 32.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 13:14:52', 33.43);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 14:14:52', 37.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 15:14:52', 40.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 16:14:52', 42.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 17:14:52', 44.34);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 18:14:52', 48.28);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 19:14:52', 50.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 20:14:52', 54.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 21:14:52', 57.07);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 22:14:52', 60.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-10 23:14:52', 62.04);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 00:14:52', 18.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 01:14:52', 20.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 02:14:52', 22.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 03:14:52', 24.92);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 04:14:52', 25.64);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 05:14:52', 26.56);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 06:14:52', 29.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 07:14:52', 31.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 08:14:52', 34.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 09:14:52', 36.29);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 10:14:52', 38.32);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 11:14:52', 41.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 12:14:52', 42.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 13:14:52', 44.83);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 14:14:52', 46.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 15:14:52', 47.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 16:14:52', 49.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 17:14:52', 51.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 18:14:52', 53.37);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 19:14:52', 56.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 20:14:52', 57.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 21:14:52', 59.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 22:14:52', 61.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-11 23:14:52', 64.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 00:14:52', 66.75);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 01:14:52', 69.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 02:14:52', 71.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 03:14:52', 72.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 04:14:52', 75.14);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 05:14:52', 77.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 06:14:52', 79.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 07:14:52', 83.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 08:14:52', 84.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 09:14:52', 85.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 10:14:52', 85.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 11:14:52', 88.36);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 12:14:52', 90.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 13:14:52', 90.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 14:14:52', 91.24);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 15:14:52', 92.36);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 16:14:52', 95.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 17:14:52', 96.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 18:14:52', 98.05);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 19:14:52', 99.05);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 20:14:52', 99.99);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-12 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 00:14:52', 19.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 01:14:52', 22.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 02:14:52', 22.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 03:14:52', 25.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 04:14:52', 27.75);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 05:14:52', 29.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 06:14:52', 30.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 07:14:52', 32.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 08:14:52', 35.06);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 09:14:52', 36.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 10:14:52', 38.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 11:14:52', 40.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 12:14:52', 43.41);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 13:14:52', 44.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 14:14:52', 46.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 15:14:52', 51.24);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 16:14:52', 53.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 17:14:52', 54.01);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 18:14:52', 56.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 19:14:52', 56.35);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 20:14:52', 61.52);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 21:14:52', 65.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 22:14:52', 67.09);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-13 23:14:52', 66.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 00:14:52', 67.97);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 01:14:52', 69.36);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 02:14:52', 71.33);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 03:14:52', 73.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 04:14:52', 75.64);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 05:14:52', 76.73);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 06:14:52', 79.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 07:14:52', 81.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 08:14:52', 83.57);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 09:14:52', 86.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 10:14:52', 88.16);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 11:14:52', 90.21);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 12:14:52', 93.24);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 13:14:52', 95.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 14:14:52', 98.25);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 1, '2024-11-14 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-07 19:14:52', 65.06);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-07 20:14:52', 67.47);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-07 21:14:52', 70.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-07 22:14:52', 72.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-07 23:14:52', 75.54);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 00:14:52', 78.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 01:14:52', 81.57);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 02:14:52', 83.41);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 03:14:52', 85.55);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 04:14:52', 88.76);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 05:14:52', 89.94);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 06:14:52', 92.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 07:14:52', 93.92);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 08:14:52', 95.95);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 09:14:52', 99.23);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-08 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 13:14:52', 99.96);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-09 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-10 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 00:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 01:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 02:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 03:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 04:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 05:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 06:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 07:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 08:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 09:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 10:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 11:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 12:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 13:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 19:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 20:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 21:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 22:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-11 23:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 00:14:52', 23.40);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 01:14:52', 25.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 02:14:52', 27.90);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 03:14:52', 31.69);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 04:14:52', 32.81);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 05:14:52', 34.85);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 06:14:52', 36.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 07:14:52', 38.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 08:14:52', 40.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 09:14:52', 41.58);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 10:14:52', 43.78);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 11:14:52', 44.71);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 12:14:52', 47.70);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 13:14:52', 50.33);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 14:14:52', 51.83);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 15:14:52', 53.39);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 16:14:52', 55.66);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 17:14:52', 56.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 18:14:52', 60.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 19:14:52', 63.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 20:14:52', 65.43);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 21:14:52', 68.11);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 22:14:52', 69.53);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-12 23:14:52', 72.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 00:14:52', 13.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 01:14:52', 17.63);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 02:14:52', 20.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 03:14:52', 23.44);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 04:14:52', 24.86);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 05:14:52', 26.84);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 06:14:52', 28.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 07:14:52', 29.40);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 08:14:52', 32.05);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 09:14:52', 35.62);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 10:14:52', 37.32);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 11:14:52', 41.49);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 12:14:52', 41.93);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 13:14:52', 44.98);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 14:14:52', 48.65);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 15:14:52', 50.45);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 16:14:52', 52.26);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 17:14:52', 55.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 18:14:52', 57.81);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 19:14:52', 57.82);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 20:14:52', 58.97);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 21:14:52', 60.96);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 22:14:52', 61.59);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-13 23:14:52', 63.12);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 00:14:52', 65.60);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 01:14:52', 67.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 02:14:52', 70.31);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 03:14:52', 72.03);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 04:14:52', 75.42);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 05:14:52', 78.18);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 06:14:52', 80.20);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 07:14:52', 83.78);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 08:14:52', 86.74);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 09:14:52', 91.68);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 10:14:52', 93.27);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 11:14:52', 95.35);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 12:14:52', 98.92);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 13:14:52', 99.38);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 14:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 15:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 16:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 17:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 18:14:52', 100.00);
-INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level)
-            VALUES (3, 2, '2024-11-14 19:14:52', 99.72);
\ No newline at end of file
+INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES
+(1, 1, '2024-11-07 19:14:52', 56.89),
+(1, 1, '2024-11-07 20:14:52', 59.21),
+(1, 1, '2024-11-07 21:14:52', 61.49),
+(1, 1, '2024-11-07 22:14:52', 64.50),
+(1, 1, '2024-11-07 23:14:52', 65.92),
+(1, 1, '2024-11-08 00:14:52', 67.39),
+(1, 1, '2024-11-08 01:14:52', 69.63),
+(1, 1, '2024-11-08 02:14:52', 69.72),
+(1, 1, '2024-11-08 03:14:52', 69.99),
+(1, 1, '2024-11-08 04:14:52', 71.43),
+(1, 1, '2024-11-08 05:14:52', 72.42),
+(1, 1, '2024-11-08 06:14:52', 74.73),
+(1, 1, '2024-11-08 07:14:52', 75.83),
+(1, 1, '2024-11-08 08:14:52', 76.41),
+(1, 1, '2024-11-08 09:14:52', 79.88),
+(1, 1, '2024-11-08 10:14:52', 81.65),
+(1, 1, '2024-11-08 11:14:52', 83.72),
+(1, 1, '2024-11-08 12:14:52', 84.30),
+(1, 1, '2024-11-08 13:14:52', 85.75),
+(1, 1, '2024-11-08 14:14:52', 87.86),
+(1, 1, '2024-11-08 15:14:52', 88.71),
+(1, 1, '2024-11-08 16:14:52', 91.09),
+(1, 1, '2024-11-08 17:14:52', 92.49),
+(1, 1, '2024-11-08 18:14:52', 94.19),
+(1, 1, '2024-11-08 19:14:52', 95.59),
+(1, 1, '2024-11-08 20:14:52', 99.45),
+(1, 1, '2024-11-08 21:14:52', 100.00),
+(1, 1, '2024-11-08 22:14:52', 100.00),
+(1, 1, '2024-11-08 23:14:52', 100.00),
+(1, 1, '2024-11-09 00:14:52', 100.00),
+(1, 1, '2024-11-09 01:14:52', 100.00),
+(1, 1, '2024-11-09 02:14:52', 100.00),
+(1, 1, '2024-11-09 03:14:52', 100.00),
+(1, 1, '2024-11-09 04:14:52', 100.00),
+(1, 1, '2024-11-09 05:14:52', 100.00),
+(1, 1, '2024-11-09 06:14:52', 100.00),
+(1, 1, '2024-11-09 07:14:52', 100.00),
+(1, 1, '2024-11-09 08:14:52', 100.00),
+(1, 1, '2024-11-09 09:14:52', 100.00),
+(1, 1, '2024-11-09 10:14:52', 100.00),
+(1, 1, '2024-11-09 11:14:52', 100.00),
+(1, 1, '2024-11-09 12:14:52', 100.00),
+(1, 1, '2024-11-09 13:14:52', 100.00),
+(1, 1, '2024-11-09 14:14:52', 100.00),
+(1, 1, '2024-11-09 15:14:52', 100.00),
+(1, 1, '2024-11-09 16:14:52', 100.00),
+(1, 1, '2024-11-09 17:14:52', 100.00),
+(1, 1, '2024-11-09 18:14:52', 100.00),
+(1, 1, '2024-11-09 19:14:52', 100.00),
+(1, 1, '2024-11-09 20:14:52', 100.00),
+(1, 1, '2024-11-09 21:14:52', 100.00),
+(1, 1, '2024-11-09 22:14:52', 100.00),
+(1, 1, '2024-11-09 23:14:52', 100.00),
+(1, 1, '2024-11-10 00:14:52', 100.00),
+(1, 1, '2024-11-10 01:14:52', 100.00),
+(1, 1, '2024-11-10 02:14:52', 100.00),
+(1, 1, '2024-11-10 03:14:52', 100.00),
+(1, 1, '2024-11-10 04:14:52', 100.00),
+(1, 1, '2024-11-10 05:14:52', 100.00),
+(1, 1, '2024-11-10 06:14:52', 100.00),
+(1, 1, '2024-11-10 07:14:52', 100.00),
+(1, 1, '2024-11-10 08:14:52', 100.00),
+(1, 1, '2024-11-10 09:14:52', 99.38),
+(1, 1, '2024-11-10 10:14:52', 100.00),
+(1, 1, '2024-11-10 11:14:52', 100.00),
+(1, 1, '2024-11-10 12:14:52', 100.00),
+(1, 1, '2024-11-10 13:14:52', 100.00),
+(1, 1, '2024-11-10 14:14:52', 100.00),
+(1, 1, '2024-11-10 15:14:52', 100.00),
+(1, 1, '2024-11-10 16:14:52', 100.00),
+(1, 1, '2024-11-10 17:14:52', 100.00),
+(1, 1, '2024-11-10 18:14:52', 100.00),
+(1, 1, '2024-11-10 19:14:52', 100.00),
+(1, 1, '2024-11-10 20:14:52', 100.00),
+(1, 1, '2024-11-10 21:14:52', 100.00),
+(1, 1, '2024-11-10 22:14:52', 100.00),
+(1, 1, '2024-11-10 23:14:52', 100.00),
+(1, 1, '2024-11-11 00:14:52', 17.51),
+(1, 1, '2024-11-11 01:14:52', 18.74),
+(1, 1, '2024-11-11 02:14:52', 20.38),
+(1, 1, '2024-11-11 03:14:52', 23.10),
+(1, 1, '2024-11-11 04:14:52', 24.85),
+(1, 1, '2024-11-11 05:14:52', 27.70),
+(1, 1, '2024-11-11 06:14:52', 28.39),
+(1, 1, '2024-11-11 07:14:52', 29.52),
+(1, 1, '2024-11-11 08:14:52', 31.01),
+(1, 1, '2024-11-11 09:14:52', 31.70),
+(1, 1, '2024-11-11 10:14:52', 36.64),
+(1, 1, '2024-11-11 11:14:52', 37.55),
+(1, 1, '2024-11-11 12:14:52', 40.46),
+(1, 1, '2024-11-11 13:14:52', 41.80),
+(1, 1, '2024-11-11 14:14:52', 43.28),
+(1, 1, '2024-11-11 15:14:52', 45.58),
+(1, 1, '2024-11-11 16:14:52', 46.12),
+(1, 1, '2024-11-11 17:14:52', 47.46),
+(1, 1, '2024-11-11 18:14:52', 49.32),
+(1, 1, '2024-11-11 19:14:52', 50.47),
+(1, 1, '2024-11-11 20:14:52', 51.65),
+(1, 1, '2024-11-11 21:14:52', 54.73),
+(1, 1, '2024-11-11 22:14:52', 57.74),
+(1, 1, '2024-11-11 23:14:52', 59.30),
+(1, 1, '2024-11-12 00:14:52', 61.21),
+(1, 1, '2024-11-12 01:14:52', 64.65),
+(1, 1, '2024-11-12 02:14:52', 67.71),
+(1, 1, '2024-11-12 03:14:52', 67.21),
+(1, 1, '2024-11-12 04:14:52', 70.69),
+(1, 1, '2024-11-12 05:14:52', 74.85),
+(1, 1, '2024-11-12 06:14:52', 78.08),
+(1, 1, '2024-11-12 07:14:52', 79.87),
+(1, 1, '2024-11-12 08:14:52', 81.18),
+(1, 1, '2024-11-12 09:14:52', 83.91),
+(1, 1, '2024-11-12 10:14:52', 85.29),
+(1, 1, '2024-11-12 11:14:52', 87.65),
+(1, 1, '2024-11-12 12:14:52', 89.62),
+(1, 1, '2024-11-12 13:14:52', 92.84),
+(1, 1, '2024-11-12 14:14:52', 94.45),
+(1, 1, '2024-11-12 15:14:52', 96.01),
+(1, 1, '2024-11-12 16:14:52', 98.39),
+(1, 1, '2024-11-12 17:14:52', 100.00),
+(1, 1, '2024-11-12 18:14:52', 100.00),
+(1, 1, '2024-11-12 19:14:52', 100.00),
+(1, 1, '2024-11-12 20:14:52', 100.00),
+(1, 1, '2024-11-12 21:14:52', 100.00),
+(1, 1, '2024-11-12 22:14:52', 100.00),
+(1, 1, '2024-11-12 23:14:52', 100.00),
+(1, 1, '2024-11-13 00:14:52', 100.00),
+(1, 1, '2024-11-13 01:14:52', 100.00),
+(1, 1, '2024-11-13 02:14:52', 100.00),
+(1, 1, '2024-11-13 03:14:52', 100.00),
+(1, 1, '2024-11-13 04:14:52', 100.00),
+(1, 1, '2024-11-13 05:14:52', 100.00),
+(1, 1, '2024-11-13 06:14:52', 100.00),
+(1, 1, '2024-11-13 07:14:52', 100.00),
+(1, 1, '2024-11-13 08:14:52', 100.00),
+(1, 1, '2024-11-13 09:14:52', 100.00),
+(1, 1, '2024-11-13 10:14:52', 100.00),
+(1, 1, '2024-11-13 11:14:52', 100.00),
+(1, 1, '2024-11-13 12:14:52', 100.00),
+(1, 1, '2024-11-13 13:14:52', 100.00),
+(1, 1, '2024-11-13 14:14:52', 100.00),
+(1, 1, '2024-11-13 15:14:52', 100.00),
+(1, 1, '2024-11-13 16:14:52', 100.00),
+(1, 1, '2024-11-13 17:14:52', 100.00),
+(1, 1, '2024-11-13 18:14:52', 100.00),
+(1, 1, '2024-11-13 19:14:52', 100.00),
+(1, 1, '2024-11-13 20:14:52', 100.00),
+(1, 1, '2024-11-13 21:14:52', 100.00),
+(1, 1, '2024-11-13 22:14:52', 100.00),
+(1, 1, '2024-11-13 23:14:52', 100.00),
+(1, 1, '2024-11-14 00:14:52', 7.84),
+(1, 1, '2024-11-14 01:14:52', 10.01),
+(1, 1, '2024-11-14 02:14:52', 10.79),
+(1, 1, '2024-11-14 03:14:52', 13.84),
+(1, 1, '2024-11-14 04:14:52', 17.17),
+(1, 1, '2024-11-14 05:14:52', 19.90),
+(1, 1, '2024-11-14 06:14:52', 20.95),
+(1, 1, '2024-11-14 07:14:52', 22.20),
+(1, 1, '2024-11-14 08:14:52', 23.07),
+(1, 1, '2024-11-14 09:14:52', 25.84),
+(1, 1, '2024-11-14 10:14:52', 29.10),
+(1, 1, '2024-11-14 11:14:52', 31.53),
+(1, 1, '2024-11-14 12:14:52', 34.47),
+(1, 1, '2024-11-14 13:14:52', 35.60),
+(1, 1, '2024-11-14 14:14:52', 37.75),
+(1, 1, '2024-11-14 15:14:52', 38.38),
+(1, 1, '2024-11-14 16:14:52', 39.61),
+(1, 1, '2024-11-14 17:14:52', 42.48),
+(1, 1, '2024-11-14 18:14:52', 44.25),
+(1, 1, '2024-11-14 19:14:52', 47.45),
+(1, 2, '2024-11-07 19:14:52', 36.54),
+(1, 2, '2024-11-07 20:14:52', 39.90),
+(1, 2, '2024-11-07 21:14:52', 43.07),
+(1, 2, '2024-11-07 22:14:52', 44.70),
+(1, 2, '2024-11-07 23:14:52', 47.20),
+(1, 2, '2024-11-08 00:14:52', 50.68),
+(1, 2, '2024-11-08 01:14:52', 53.08),
+(1, 2, '2024-11-08 02:14:52', 53.30),
+(1, 2, '2024-11-08 03:14:52', 55.06),
+(1, 2, '2024-11-08 04:14:52', 57.38),
+(1, 2, '2024-11-08 05:14:52', 59.89),
+(1, 2, '2024-11-08 06:14:52', 61.76),
+(1, 2, '2024-11-08 07:14:52', 64.10),
+(1, 2, '2024-11-08 08:14:52', 68.22),
+(1, 2, '2024-11-08 09:14:52', 71.77),
+(1, 2, '2024-11-08 10:14:52', 72.82),
+(1, 2, '2024-11-08 11:14:52', 74.22),
+(1, 2, '2024-11-08 12:14:52', 76.11),
+(1, 2, '2024-11-08 13:14:52', 76.36),
+(1, 2, '2024-11-08 14:14:52', 77.02),
+(1, 2, '2024-11-08 15:14:52', 77.40),
+(1, 2, '2024-11-08 16:14:52', 78.25),
+(1, 2, '2024-11-08 17:14:52', 81.64),
+(1, 2, '2024-11-08 18:14:52', 82.79),
+(1, 2, '2024-11-08 19:14:52', 83.76),
+(1, 2, '2024-11-08 20:14:52', 86.64),
+(1, 2, '2024-11-08 21:14:52', 88.19),
+(1, 2, '2024-11-08 22:14:52', 90.61),
+(1, 2, '2024-11-08 23:14:52', 91.88),
+(1, 2, '2024-11-09 00:14:52', 93.22),
+(1, 2, '2024-11-09 01:14:52', 93.52),
+(1, 2, '2024-11-09 02:14:52', 96.18),
+(1, 2, '2024-11-09 03:14:52', 96.74),
+(1, 2, '2024-11-09 04:14:52', 97.56),
+(1, 2, '2024-11-09 05:14:52', 100.00),
+(1, 2, '2024-11-09 06:14:52', 100.00),
+(1, 2, '2024-11-09 07:14:52', 100.00),
+(1, 2, '2024-11-09 08:14:52', 100.00),
+(1, 2, '2024-11-09 09:14:52', 100.00),
+(1, 2, '2024-11-09 10:14:52', 100.00),
+(1, 2, '2024-11-09 11:14:52', 100.00),
+(1, 2, '2024-11-09 12:14:52', 100.00),
+(1, 2, '2024-11-09 13:14:52', 100.00),
+(1, 2, '2024-11-09 14:14:52', 100.00),
+(1, 2, '2024-11-09 15:14:52', 100.00),
+(1, 2, '2024-11-09 16:14:52', 100.00),
+(1, 2, '2024-11-09 17:14:52', 100.00),
+(1, 2, '2024-11-09 18:14:52', 100.00),
+(1, 2, '2024-11-09 19:14:52', 100.00),
+(1, 2, '2024-11-09 20:14:52', 100.00),
+(1, 2, '2024-11-09 21:14:52', 100.00),
+(1, 2, '2024-11-09 22:14:52', 100.00),
+(1, 2, '2024-11-09 23:14:52', 100.00),
+(1, 2, '2024-11-10 00:14:52', 100.00),
+(1, 2, '2024-11-10 01:14:52', 100.00),
+(1, 2, '2024-11-10 02:14:52', 100.00),
+(1, 2, '2024-11-10 03:14:52', 100.00),
+(1, 2, '2024-11-10 04:14:52', 100.00),
+(1, 2, '2024-11-10 05:14:52', 100.00),
+(1, 2, '2024-11-10 06:14:52', 100.00),
+(1, 2, '2024-11-10 07:14:52', 100.00),
+(1, 2, '2024-11-10 08:14:52', 100.00),
+(1, 2, '2024-11-10 09:14:52', 100.00),
+(1, 2, '2024-11-10 10:14:52', 100.00),
+(1, 2, '2024-11-10 11:14:52', 100.00),
+(1, 2, '2024-11-10 12:14:52', 100.00),
+(1, 2, '2024-11-10 13:14:52', 100.00),
+(1, 2, '2024-11-10 14:14:52', 100.00),
+(1, 2, '2024-11-10 15:14:52', 100.00),
+(1, 2, '2024-11-10 16:14:52', 100.00),
+(1, 2, '2024-11-10 17:14:52', 100.00),
+(1, 2, '2024-11-10 18:14:52', 100.00),
+(1, 2, '2024-11-10 19:14:52', 100.00),
+(1, 2, '2024-11-10 20:14:52', 100.00),
+(1, 2, '2024-11-10 21:14:52', 100.00),
+(1, 2, '2024-11-10 22:14:52', 100.00),
+(1, 2, '2024-11-10 23:14:52', 100.00),
+(1, 2, '2024-11-11 00:14:52', 100.00),
+(1, 2, '2024-11-11 01:14:52', 100.00),
+(1, 2, '2024-11-11 02:14:52', 100.00),
+(1, 2, '2024-11-11 03:14:52', 100.00),
+(1, 2, '2024-11-11 04:14:52', 100.00),
+(1, 2, '2024-11-11 05:14:52', 100.00),
+(1, 2, '2024-11-11 06:14:52', 100.00),
+(1, 2, '2024-11-11 07:14:52', 100.00),
+(1, 2, '2024-11-11 08:14:52', 100.00),
+(1, 2, '2024-11-11 09:14:52', 100.00),
+(1, 2, '2024-11-11 10:14:52', 100.00),
+(1, 2, '2024-11-11 11:14:52', 100.00),
+(1, 2, '2024-11-11 12:14:52', 100.00),
+(1, 2, '2024-11-11 13:14:52', 100.00),
+(1, 2, '2024-11-11 14:14:52', 100.00),
+(1, 2, '2024-11-11 15:14:52', 100.00),
+(1, 2, '2024-11-11 16:14:52', 100.00),
+(1, 2, '2024-11-11 17:14:52', 100.00),
+(1, 2, '2024-11-11 18:14:52', 100.00),
+(1, 2, '2024-11-11 19:14:52', 100.00),
+(1, 2, '2024-11-11 20:14:52', 100.00),
+(1, 2, '2024-11-11 21:14:52', 100.00),
+(1, 2, '2024-11-11 22:14:52', 100.00),
+(1, 2, '2024-11-11 23:14:52', 100.00),
+(1, 2, '2024-11-12 00:14:52', 100.00),
+(1, 2, '2024-11-12 01:14:52', 100.00),
+(1, 2, '2024-11-12 02:14:52', 100.00),
+(1, 2, '2024-11-12 03:14:52', 100.00),
+(1, 2, '2024-11-12 04:14:52', 100.00),
+(1, 2, '2024-11-12 05:14:52', 100.00),
+(1, 2, '2024-11-12 06:14:52', 100.00),
+(1, 2, '2024-11-12 07:14:52', 100.00),
+(1, 2, '2024-11-12 08:14:52', 100.00),
+(1, 2, '2024-11-12 09:14:52', 100.00),
+(1, 2, '2024-11-12 10:14:52', 99.78),
+(1, 2, '2024-11-12 11:14:52', 100.00),
+(1, 2, '2024-11-12 12:14:52', 100.00),
+(1, 2, '2024-11-12 13:14:52', 100.00),
+(1, 2, '2024-11-12 14:14:52', 100.00),
+(1, 2, '2024-11-12 15:14:52', 100.00),
+(1, 2, '2024-11-12 16:14:52', 100.00),
+(1, 2, '2024-11-12 17:14:52', 100.00),
+(1, 2, '2024-11-12 18:14:52', 100.00),
+(1, 2, '2024-11-12 19:14:52', 100.00),
+(1, 2, '2024-11-12 20:14:52', 100.00),
+(1, 2, '2024-11-12 21:14:52', 100.00),
+(1, 2, '2024-11-12 22:14:52', 100.00),
+(1, 2, '2024-11-12 23:14:52', 100.00),
+(1, 2, '2024-11-13 00:14:52', 100.00),
+(1, 2, '2024-11-13 01:14:52', 100.00),
+(1, 2, '2024-11-13 02:14:52', 100.00),
+(1, 2, '2024-11-13 03:14:52', 100.00),
+(1, 2, '2024-11-13 04:14:52', 100.00),
+(1, 2, '2024-11-13 05:14:52', 100.00),
+(1, 2, '2024-11-13 06:14:52', 100.00),
+(1, 2, '2024-11-13 07:14:52', 100.00),
+(1, 2, '2024-11-13 08:14:52', 100.00),
+(1, 2, '2024-11-13 09:14:52', 100.00),
+(1, 2, '2024-11-13 10:14:52', 100.00),
+(1, 2, '2024-11-13 11:14:52', 100.00),
+(1, 2, '2024-11-13 12:14:52', 100.00),
+(1, 2, '2024-11-13 13:14:52', 100.00),
+(1, 2, '2024-11-13 14:14:52', 100.00),
+(1, 2, '2024-11-13 15:14:52', 100.00),
+(1, 2, '2024-11-13 16:14:52', 100.00),
+(1, 2, '2024-11-13 17:14:52', 100.00),
+(1, 2, '2024-11-13 18:14:52', 100.00),
+(1, 2, '2024-11-13 19:14:52', 100.00),
+(1, 2, '2024-11-13 20:14:52', 100.00),
+(1, 2, '2024-11-13 21:14:52', 100.00),
+(1, 2, '2024-11-13 22:14:52', 100.00),
+(1, 2, '2024-11-13 23:14:52', 100.00),
+(1, 2, '2024-11-14 00:14:52', 100.00),
+(1, 2, '2024-11-14 01:14:52', 100.00),
+(1, 2, '2024-11-14 02:14:52', 100.00),
+(1, 2, '2024-11-14 03:14:52', 100.00),
+(1, 2, '2024-11-14 04:14:52', 100.00),
+(1, 2, '2024-11-14 05:14:52', 100.00),
+(1, 2, '2024-11-14 06:14:52', 100.00),
+(1, 2, '2024-11-14 07:14:52', 100.00),
+(1, 2, '2024-11-14 08:14:52', 100.00),
+(1, 2, '2024-11-14 09:14:52', 100.00),
+(1, 2, '2024-11-14 10:14:52', 100.00),
+(1, 2, '2024-11-14 11:14:52', 100.00),
+(1, 2, '2024-11-14 12:14:52', 100.00),
+(1, 2, '2024-11-14 13:14:52', 100.00),
+(1, 2, '2024-11-14 14:14:52', 100.00),
+(1, 2, '2024-11-14 15:14:52', 100.00),
+(1, 2, '2024-11-14 16:14:52', 100.00),
+(1, 2, '2024-11-14 17:14:52', 100.00),
+(1, 2, '2024-11-14 18:14:52', 100.00),
+(1, 2, '2024-11-14 19:14:52', 100.00),
+(2, 1, '2024-11-07 19:14:52', 68.15),
+(2, 1, '2024-11-07 20:14:52', 70.11),
+(2, 1, '2024-11-07 21:14:52', 69.54),
+(2, 1, '2024-11-07 22:14:52', 72.69),
+(2, 1, '2024-11-07 23:14:52', 72.79),
+(2, 1, '2024-11-08 00:14:52', 75.39),
+(2, 1, '2024-11-08 01:14:52', 78.23),
+(2, 1, '2024-11-08 02:14:52', 79.17),
+(2, 1, '2024-11-08 03:14:52', 80.46),
+(2, 1, '2024-11-08 04:14:52', 81.50),
+(2, 1, '2024-11-08 05:14:52', 84.93),
+(2, 1, '2024-11-08 06:14:52', 86.23),
+(2, 1, '2024-11-08 07:14:52', 88.09),
+(2, 1, '2024-11-08 08:14:52', 89.49),
+(2, 1, '2024-11-08 09:14:52', 91.18),
+(2, 1, '2024-11-08 10:14:52', 92.44),
+(2, 1, '2024-11-08 11:14:52', 94.91),
+(2, 1, '2024-11-08 12:14:52', 95.86),
+(2, 1, '2024-11-08 13:14:52', 96.51),
+(2, 1, '2024-11-08 14:14:52', 97.95),
+(2, 1, '2024-11-08 15:14:52', 99.16),
+(2, 1, '2024-11-08 16:14:52', 99.82),
+(2, 1, '2024-11-08 17:14:52', 100.00),
+(2, 1, '2024-11-08 18:14:52', 100.00),
+(2, 1, '2024-11-08 19:14:52', 100.00),
+(2, 1, '2024-11-08 20:14:52', 100.00),
+(2, 1, '2024-11-08 21:14:52', 100.00),
+(2, 1, '2024-11-08 22:14:52', 100.00),
+(2, 1, '2024-11-08 23:14:52', 100.00),
+(2, 1, '2024-11-09 00:14:52', 14.27),
+(2, 1, '2024-11-09 01:14:52', 17.45),
+(2, 1, '2024-11-09 02:14:52', 18.98),
+(2, 1, '2024-11-09 03:14:52', 19.27),
+(2, 1, '2024-11-09 04:14:52', 22.62),
+(2, 1, '2024-11-09 05:14:52', 24.51),
+(2, 1, '2024-11-09 06:14:52', 27.74),
+(2, 1, '2024-11-09 07:14:52', 28.15),
+(2, 1, '2024-11-09 08:14:52', 29.55),
+(2, 1, '2024-11-09 09:14:52', 31.56),
+(2, 1, '2024-11-09 10:14:52', 33.60),
+(2, 1, '2024-11-09 11:14:52', 35.15),
+(2, 1, '2024-11-09 12:14:52', 37.78),
+(2, 1, '2024-11-09 13:14:52', 38.71),
+(2, 1, '2024-11-09 14:14:52', 40.57),
+(2, 1, '2024-11-09 15:14:52', 42.69),
+(2, 1, '2024-11-09 16:14:52', 45.20),
+(2, 1, '2024-11-09 17:14:52', 47.91),
+(2, 1, '2024-11-09 18:14:52', 48.79),
+(2, 1, '2024-11-09 19:14:52', 49.25),
+(2, 1, '2024-11-09 20:14:52', 52.53),
+(2, 1, '2024-11-09 21:14:52', 54.86),
+(2, 1, '2024-11-09 22:14:52', 56.11),
+(2, 1, '2024-11-09 23:14:52', 59.67),
+(2, 1, '2024-11-10 00:14:52', 61.78),
+(2, 1, '2024-11-10 01:14:52', 63.95),
+(2, 1, '2024-11-10 02:14:52', 67.10),
+(2, 1, '2024-11-10 03:14:52', 70.13),
+(2, 1, '2024-11-10 04:14:52', 72.30),
+(2, 1, '2024-11-10 05:14:52', 73.28),
+(2, 1, '2024-11-10 06:14:52', 75.01),
+(2, 1, '2024-11-10 07:14:52', 78.50),
+(2, 1, '2024-11-10 08:14:52', 81.37),
+(2, 1, '2024-11-10 09:14:52', 82.94),
+(2, 1, '2024-11-10 10:14:52', 84.60),
+(2, 1, '2024-11-10 11:14:52', 84.87),
+(2, 1, '2024-11-10 12:14:52', 88.31),
+(2, 1, '2024-11-10 13:14:52', 91.20),
+(2, 1, '2024-11-10 14:14:52', 93.06),
+(2, 1, '2024-11-10 15:14:52', 95.26),
+(2, 1, '2024-11-10 16:14:52', 95.09),
+(2, 1, '2024-11-10 17:14:52', 96.60),
+(2, 1, '2024-11-10 18:14:52', 99.94),
+(2, 1, '2024-11-10 19:14:52', 100.00),
+(2, 1, '2024-11-10 20:14:52', 100.00),
+(2, 1, '2024-11-10 21:14:52', 100.00),
+(2, 1, '2024-11-10 22:14:52', 100.00),
+(2, 1, '2024-11-10 23:14:52', 100.00),
+(2, 1, '2024-11-11 00:14:52', 9.34),
+(2, 1, '2024-11-11 01:14:52', 10.19),
+(2, 1, '2024-11-11 02:14:52', 11.58),
+(2, 1, '2024-11-11 03:14:52', 11.77),
+(2, 1, '2024-11-11 04:14:52', 14.68),
+(2, 1, '2024-11-11 05:14:52', 14.51),
+(2, 1, '2024-11-11 06:14:52', 18.54),
+(2, 1, '2024-11-11 07:14:52', 18.77),
+(2, 1, '2024-11-11 08:14:52', 22.27),
+(2, 1, '2024-11-11 09:14:52', 23.37),
+(2, 1, '2024-11-11 10:14:52', 25.93),
+(2, 1, '2024-11-11 11:14:52', 27.17),
+(2, 1, '2024-11-11 12:14:52', 30.85),
+(2, 1, '2024-11-11 13:14:52', 32.89),
+(2, 1, '2024-11-11 14:14:52', 35.96),
+(2, 1, '2024-11-11 15:14:52', 38.04),
+(2, 1, '2024-11-11 16:14:52', 40.39),
+(2, 1, '2024-11-11 17:14:52', 43.01),
+(2, 1, '2024-11-11 18:14:52', 44.48),
+(2, 1, '2024-11-11 19:14:52', 45.20),
+(2, 1, '2024-11-11 20:14:52', 45.90),
+(2, 1, '2024-11-11 21:14:52', 47.95),
+(2, 1, '2024-11-11 22:14:52', 49.46),
+(2, 1, '2024-11-11 23:14:52', 49.32),
+(2, 1, '2024-11-12 00:14:52', 7.51),
+(2, 1, '2024-11-12 01:14:52', 11.48),
+(2, 1, '2024-11-12 02:14:52', 13.51),
+(2, 1, '2024-11-12 03:14:52', 14.81),
+(2, 1, '2024-11-12 04:14:52', 17.03),
+(2, 1, '2024-11-12 05:14:52', 18.91),
+(2, 1, '2024-11-12 06:14:52', 20.69),
+(2, 1, '2024-11-12 07:14:52', 23.31),
+(2, 1, '2024-11-12 08:14:52', 26.07),
+(2, 1, '2024-11-12 09:14:52', 27.54),
+(2, 1, '2024-11-12 10:14:52', 28.96),
+(2, 1, '2024-11-12 11:14:52', 30.68),
+(2, 1, '2024-11-12 12:14:52', 30.38),
+(2, 1, '2024-11-12 13:14:52', 30.87),
+(2, 1, '2024-11-12 14:14:52', 34.23),
+(2, 1, '2024-11-12 15:14:52', 37.88),
+(2, 1, '2024-11-12 16:14:52', 39.63),
+(2, 1, '2024-11-12 17:14:52', 42.21),
+(2, 1, '2024-11-12 18:14:52', 44.52),
+(2, 1, '2024-11-12 19:14:52', 49.60),
+(2, 1, '2024-11-12 20:14:52', 52.72),
+(2, 1, '2024-11-12 21:14:52', 54.59),
+(2, 1, '2024-11-12 22:14:52', 55.63),
+(2, 1, '2024-11-12 23:14:52', 56.03),
+(2, 1, '2024-11-13 00:14:52', 58.23),
+(2, 1, '2024-11-13 01:14:52', 60.04),
+(2, 1, '2024-11-13 02:14:52', 62.00),
+(2, 1, '2024-11-13 03:14:52', 62.93),
+(2, 1, '2024-11-13 04:14:52', 64.28),
+(2, 1, '2024-11-13 05:14:52', 65.51),
+(2, 1, '2024-11-13 06:14:52', 67.16),
+(2, 1, '2024-11-13 07:14:52', 69.37),
+(2, 1, '2024-11-13 08:14:52', 72.28),
+(2, 1, '2024-11-13 09:14:52', 75.34),
+(2, 1, '2024-11-13 10:14:52', 77.99),
+(2, 1, '2024-11-13 11:14:52', 79.12),
+(2, 1, '2024-11-13 12:14:52', 81.12),
+(2, 1, '2024-11-13 13:14:52', 85.49),
+(2, 1, '2024-11-13 14:14:52', 88.50),
+(2, 1, '2024-11-13 15:14:52', 90.06),
+(2, 1, '2024-11-13 16:14:52', 93.65),
+(2, 1, '2024-11-13 17:14:52', 95.26),
+(2, 1, '2024-11-13 18:14:52', 96.59),
+(2, 1, '2024-11-13 19:14:52', 99.99),
+(2, 1, '2024-11-13 20:14:52', 100.00),
+(2, 1, '2024-11-13 21:14:52', 100.00),
+(2, 1, '2024-11-13 22:14:52', 100.00),
+(2, 1, '2024-11-13 23:14:52', 100.00),
+(2, 1, '2024-11-14 00:14:52', 100.00),
+(2, 1, '2024-11-14 01:14:52', 100.00),
+(2, 1, '2024-11-14 02:14:52', 100.00),
+(2, 1, '2024-11-14 03:14:52', 100.00),
+(2, 1, '2024-11-14 04:14:52', 100.00),
+(2, 1, '2024-11-14 05:14:52', 100.00),
+(2, 1, '2024-11-14 06:14:52', 100.00),
+(2, 1, '2024-11-14 07:14:52', 100.00),
+(2, 1, '2024-11-14 08:14:52', 100.00),
+(2, 1, '2024-11-14 09:14:52', 100.00),
+(2, 1, '2024-11-14 10:14:52', 100.00),
+(2, 1, '2024-11-14 11:14:52', 100.00),
+(2, 1, '2024-11-14 12:14:52', 100.00),
+(2, 1, '2024-11-14 13:14:52', 100.00),
+(2, 1, '2024-11-14 14:14:52', 100.00),
+(2, 1, '2024-11-14 15:14:52', 100.00),
+(2, 1, '2024-11-14 16:14:52', 100.00),
+(2, 1, '2024-11-14 17:14:52', 100.00),
+(2, 1, '2024-11-14 18:14:52', 100.00),
+(2, 1, '2024-11-14 19:14:52', 100.00),
+(2, 2, '2024-11-07 19:14:52', 74.57),
+(2, 2, '2024-11-07 20:14:52', 76.85),
+(2, 2, '2024-11-07 21:14:52', 76.11),
+(2, 2, '2024-11-07 22:14:52', 77.65),
+(2, 2, '2024-11-07 23:14:52', 79.34),
+(2, 2, '2024-11-08 00:14:52', 81.98),
+(2, 2, '2024-11-08 01:14:52', 82.32),
+(2, 2, '2024-11-08 02:14:52', 84.26),
+(2, 2, '2024-11-08 03:14:52', 85.04),
+(2, 2, '2024-11-08 04:14:52', 86.39),
+(2, 2, '2024-11-08 05:14:52', 88.44),
+(2, 2, '2024-11-08 06:14:52', 89.58),
+(2, 2, '2024-11-08 07:14:52', 91.19),
+(2, 2, '2024-11-08 08:14:52', 94.20),
+(2, 2, '2024-11-08 09:14:52', 95.62),
+(2, 2, '2024-11-08 10:14:52', 98.46),
+(2, 2, '2024-11-08 11:14:52', 99.33),
+(2, 2, '2024-11-08 12:14:52', 100.00),
+(2, 2, '2024-11-08 13:14:52', 100.00),
+(2, 2, '2024-11-08 14:14:52', 99.53),
+(2, 2, '2024-11-08 15:14:52', 100.00),
+(2, 2, '2024-11-08 16:14:52', 100.00),
+(2, 2, '2024-11-08 17:14:52', 100.00),
+(2, 2, '2024-11-08 18:14:52', 100.00),
+(2, 2, '2024-11-08 19:14:52', 100.00),
+(2, 2, '2024-11-08 20:14:52', 100.00),
+(2, 2, '2024-11-08 21:14:52', 100.00),
+(2, 2, '2024-11-08 22:14:52', 100.00),
+(2, 2, '2024-11-08 23:14:52', 100.00),
+(2, 2, '2024-11-09 00:14:52', 100.00),
+(2, 2, '2024-11-09 01:14:52', 100.00),
+(2, 2, '2024-11-09 02:14:52', 100.00),
+(2, 2, '2024-11-09 03:14:52', 100.00),
+(2, 2, '2024-11-09 04:14:52', 100.00),
+(2, 2, '2024-11-09 05:14:52', 100.00),
+(2, 2, '2024-11-09 06:14:52', 99.79),
+(2, 2, '2024-11-09 07:14:52', 100.00),
+(2, 2, '2024-11-09 08:14:52', 100.00),
+(2, 2, '2024-11-09 09:14:52', 100.00),
+(2, 2, '2024-11-09 10:14:52', 100.00),
+(2, 2, '2024-11-09 11:14:52', 100.00),
+(2, 2, '2024-11-09 12:14:52', 100.00),
+(2, 2, '2024-11-09 13:14:52', 99.77),
+(2, 2, '2024-11-09 14:14:52', 100.00),
+(2, 2, '2024-11-09 15:14:52', 100.00),
+(2, 2, '2024-11-09 16:14:52', 100.00),
+(2, 2, '2024-11-09 17:14:52', 100.00),
+(2, 2, '2024-11-09 18:14:52', 100.00),
+(2, 2, '2024-11-09 19:14:52', 100.00),
+(2, 2, '2024-11-09 20:14:52', 100.00),
+(2, 2, '2024-11-09 21:14:52', 100.00),
+(2, 2, '2024-11-09 22:14:52', 100.00),
+(2, 2, '2024-11-09 23:14:52', 100.00),
+(2, 2, '2024-11-10 00:14:52', 13.92),
+(2, 2, '2024-11-10 01:14:52', 17.01),
+(2, 2, '2024-11-10 02:14:52', 20.71),
+(2, 2, '2024-11-10 03:14:52', 22.68),
+(2, 2, '2024-11-10 04:14:52', 25.51),
+(2, 2, '2024-11-10 05:14:52', 28.52),
+(2, 2, '2024-11-10 06:14:52', 30.02),
+(2, 2, '2024-11-10 07:14:52', 32.41),
+(2, 2, '2024-11-10 08:14:52', 35.07),
+(2, 2, '2024-11-10 09:14:52', 36.16),
+(2, 2, '2024-11-10 10:14:52', 39.80),
+(2, 2, '2024-11-10 11:14:52', 41.76),
+(2, 2, '2024-11-10 12:14:52', 43.85),
+(2, 2, '2024-11-10 13:14:52', 44.90),
+(2, 2, '2024-11-10 14:14:52', 46.12),
+(2, 2, '2024-11-10 15:14:52', 45.93),
+(2, 2, '2024-11-10 16:14:52', 47.98),
+(2, 2, '2024-11-10 17:14:52', 52.49),
+(2, 2, '2024-11-10 18:14:52', 53.47),
+(2, 2, '2024-11-10 19:14:52', 58.44),
+(2, 2, '2024-11-10 20:14:52', 61.86),
+(2, 2, '2024-11-10 21:14:52', 63.38),
+(2, 2, '2024-11-10 22:14:52', 65.41),
+(2, 2, '2024-11-10 23:14:52', 67.28),
+(2, 2, '2024-11-11 00:14:52', 69.99),
+(2, 2, '2024-11-11 01:14:52', 73.56),
+(2, 2, '2024-11-11 02:14:52', 74.38),
+(2, 2, '2024-11-11 03:14:52', 75.70),
+(2, 2, '2024-11-11 04:14:52', 76.03),
+(2, 2, '2024-11-11 05:14:52', 77.42),
+(2, 2, '2024-11-11 06:14:52', 80.18),
+(2, 2, '2024-11-11 07:14:52', 82.39),
+(2, 2, '2024-11-11 08:14:52', 85.26),
+(2, 2, '2024-11-11 09:14:52', 86.33),
+(2, 2, '2024-11-11 10:14:52', 87.45),
+(2, 2, '2024-11-11 11:14:52', 89.66),
+(2, 2, '2024-11-11 12:14:52', 91.05),
+(2, 2, '2024-11-11 13:14:52', 94.35),
+(2, 2, '2024-11-11 14:14:52', 95.73),
+(2, 2, '2024-11-11 15:14:52', 97.23),
+(2, 2, '2024-11-11 16:14:52', 99.65),
+(2, 2, '2024-11-11 17:14:52', 100.00),
+(2, 2, '2024-11-11 18:14:52', 100.00),
+(2, 2, '2024-11-11 19:14:52', 100.00),
+(2, 2, '2024-11-11 20:14:52', 100.00),
+(2, 2, '2024-11-11 21:14:52', 100.00),
+(2, 2, '2024-11-11 22:14:52', 100.00),
+(2, 2, '2024-11-11 23:14:52', 100.00),
+(2, 2, '2024-11-12 00:14:52', 100.00),
+(2, 2, '2024-11-12 01:14:52', 100.00),
+(2, 2, '2024-11-12 02:14:52', 100.00),
+(2, 2, '2024-11-12 03:14:52', 100.00),
+(2, 2, '2024-11-12 04:14:52', 100.00),
+(2, 2, '2024-11-12 05:14:52', 99.22),
+(2, 2, '2024-11-12 06:14:52', 100.00),
+(2, 2, '2024-11-12 07:14:52', 100.00),
+(2, 2, '2024-11-12 08:14:52', 100.00),
+(2, 2, '2024-11-12 09:14:52', 100.00),
+(2, 2, '2024-11-12 10:14:52', 100.00),
+(2, 2, '2024-11-12 11:14:52', 100.00),
+(2, 2, '2024-11-12 12:14:52', 100.00),
+(2, 2, '2024-11-12 13:14:52', 100.00),
+(2, 2, '2024-11-12 14:14:52', 100.00),
+(2, 2, '2024-11-12 15:14:52', 100.00),
+(2, 2, '2024-11-12 16:14:52', 100.00),
+(2, 2, '2024-11-12 17:14:52', 100.00),
+(2, 2, '2024-11-12 18:14:52', 100.00),
+(2, 2, '2024-11-12 19:14:52', 100.00),
+(2, 2, '2024-11-12 20:14:52', 100.00),
+(2, 2, '2024-11-12 21:14:52', 100.00),
+(2, 2, '2024-11-12 22:14:52', 100.00),
+(2, 2, '2024-11-12 23:14:52', 100.00),
+(2, 2, '2024-11-13 00:14:52', 100.00),
+(2, 2, '2024-11-13 01:14:52', 100.00),
+(2, 2, '2024-11-13 02:14:52', 100.00),
+(2, 2, '2024-11-13 03:14:52', 99.88),
+(2, 2, '2024-11-13 04:14:52', 100.00),
+(2, 2, '2024-11-13 05:14:52', 100.00),
+(2, 2, '2024-11-13 06:14:52', 100.00),
+(2, 2, '2024-11-13 07:14:52', 100.00),
+(2, 2, '2024-11-13 08:14:52', 100.00),
+(2, 2, '2024-11-13 09:14:52', 100.00),
+(2, 2, '2024-11-13 10:14:52', 100.00),
+(2, 2, '2024-11-13 11:14:52', 100.00),
+(2, 2, '2024-11-13 12:14:52', 100.00),
+(2, 2, '2024-11-13 13:14:52', 98.43),
+(2, 2, '2024-11-13 14:14:52', 100.00),
+(2, 2, '2024-11-13 15:14:52', 100.00),
+(2, 2, '2024-11-13 16:14:52', 100.00),
+(2, 2, '2024-11-13 17:14:52', 100.00),
+(2, 2, '2024-11-13 18:14:52', 100.00),
+(2, 2, '2024-11-13 19:14:52', 100.00),
+(2, 2, '2024-11-13 20:14:52', 100.00),
+(2, 2, '2024-11-13 21:14:52', 100.00),
+(2, 2, '2024-11-13 22:14:52', 100.00),
+(2, 2, '2024-11-13 23:14:52', 99.83),
+(2, 2, '2024-11-14 00:14:52', 100.00),
+(2, 2, '2024-11-14 01:14:52', 100.00),
+(2, 2, '2024-11-14 02:14:52', 100.00),
+(2, 2, '2024-11-14 03:14:52', 100.00),
+(2, 2, '2024-11-14 04:14:52', 100.00),
+(2, 2, '2024-11-14 05:14:52', 100.00),
+(2, 2, '2024-11-14 06:14:52', 100.00),
+(2, 2, '2024-11-14 07:14:52', 100.00),
+(2, 2, '2024-11-14 08:14:52', 100.00),
+(2, 2, '2024-11-14 09:14:52', 100.00),
+(2, 2, '2024-11-14 10:14:52', 100.00),
+(2, 2, '2024-11-14 11:14:52', 100.00),
+(2, 2, '2024-11-14 12:14:52', 100.00),
+(2, 2, '2024-11-14 13:14:52', 100.00),
+(2, 2, '2024-11-14 14:14:52', 100.00),
+(2, 2, '2024-11-14 15:14:52', 100.00),
+(2, 2, '2024-11-14 16:14:52', 100.00),
+(2, 2, '2024-11-14 17:14:52', 100.00),
+(2, 2, '2024-11-14 18:14:52', 100.00),
+(2, 2, '2024-11-14 19:14:52', 100.00),
+(3, 1, '2024-11-07 19:14:52', 73.76),
+(3, 1, '2024-11-07 20:14:52', 74.94),
+(3, 1, '2024-11-07 21:14:52', 78.26),
+(3, 1, '2024-11-07 22:14:52', 78.50),
+(3, 1, '2024-11-07 23:14:52', 81.26),
+(3, 1, '2024-11-08 00:14:52', 81.85),
+(3, 1, '2024-11-08 01:14:52', 81.77),
+(3, 1, '2024-11-08 02:14:52', 85.46),
+(3, 1, '2024-11-08 03:14:52', 87.67),
+(3, 1, '2024-11-08 04:14:52', 89.58),
+(3, 1, '2024-11-08 05:14:52', 91.03),
+(3, 1, '2024-11-08 06:14:52', 93.43),
+(3, 1, '2024-11-08 07:14:52', 95.39),
+(3, 1, '2024-11-08 08:14:52', 98.50),
+(3, 1, '2024-11-08 09:14:52', 100.00),
+(3, 1, '2024-11-08 10:14:52', 100.00),
+(3, 1, '2024-11-08 11:14:52', 100.00),
+(3, 1, '2024-11-08 12:14:52', 100.00),
+(3, 1, '2024-11-08 13:14:52', 100.00),
+(3, 1, '2024-11-08 14:14:52', 100.00),
+(3, 1, '2024-11-08 15:14:52', 100.00),
+(3, 1, '2024-11-08 16:14:52', 100.00),
+(3, 1, '2024-11-08 17:14:52', 100.00),
+(3, 1, '2024-11-08 18:14:52', 100.00),
+(3, 1, '2024-11-08 19:14:52', 100.00),
+(3, 1, '2024-11-08 20:14:52', 100.00),
+(3, 1, '2024-11-08 21:14:52', 100.00),
+(3, 1, '2024-11-08 22:14:52', 100.00),
+(3, 1, '2024-11-08 23:14:52', 100.00),
+(3, 1, '2024-11-09 00:14:52', 100.00),
+(3, 1, '2024-11-09 01:14:52', 100.00),
+(3, 1, '2024-11-09 02:14:52', 100.00),
+(3, 1, '2024-11-09 03:14:52', 100.00),
+(3, 1, '2024-11-09 04:14:52', 100.00),
+(3, 1, '2024-11-09 05:14:52', 100.00),
+(3, 1, '2024-11-09 06:14:52', 100.00),
+(3, 1, '2024-11-09 07:14:52', 100.00),
+(3, 1, '2024-11-09 08:14:52', 100.00),
+(3, 1, '2024-11-09 09:14:52', 100.00),
+(3, 1, '2024-11-09 10:14:52', 100.00),
+(3, 1, '2024-11-09 11:14:52', 100.00),
+(3, 1, '2024-11-09 12:14:52', 99.63),
+(3, 1, '2024-11-09 13:14:52', 100.00),
+(3, 1, '2024-11-09 14:14:52', 100.00),
+(3, 1, '2024-11-09 15:14:52', 100.00),
+(3, 1, '2024-11-09 16:14:52', 100.00),
+(3, 1, '2024-11-09 17:14:52', 100.00),
+(3, 1, '2024-11-09 18:14:52', 100.00),
+(3, 1, '2024-11-09 19:14:52', 100.00),
+(3, 1, '2024-11-09 20:14:52', 100.00),
+(3, 1, '2024-11-09 21:14:52', 100.00),
+(3, 1, '2024-11-09 22:14:52', 100.00),
+(3, 1, '2024-11-09 23:14:52', 100.00),
+(3, 1, '2024-11-10 00:14:52', 10.70),
+(3, 1, '2024-11-10 01:14:52', 10.94),
+(3, 1, '2024-11-10 02:14:52', 12.82),
+(3, 1, '2024-11-10 03:14:52', 13.58),
+(3, 1, '2024-11-10 04:14:52', 15.73),
+(3, 1, '2024-11-10 05:14:52', 17.97),
+(3, 1, '2024-11-10 06:14:52', 20.20),
+(3, 1, '2024-11-10 07:14:52', 21.72),
+(3, 1, '2024-11-10 08:14:52', 26.02),
+(3, 1, '2024-11-10 09:14:52', 26.75),
+(3, 1, '2024-11-10 10:14:52', 27.42),
+(3, 1, '2024-11-10 11:14:52', 31.07),
+(3, 1, '2024-11-10 12:14:52', 32.37),
+(3, 1, '2024-11-10 13:14:52', 33.43),
+(3, 1, '2024-11-10 14:14:52', 37.73),
+(3, 1, '2024-11-10 15:14:52', 40.71),
+(3, 1, '2024-11-10 16:14:52', 42.12),
+(3, 1, '2024-11-10 17:14:52', 44.34),
+(3, 1, '2024-11-10 18:14:52', 48.28),
+(3, 1, '2024-11-10 19:14:52', 50.98),
+(3, 1, '2024-11-10 20:14:52', 54.26),
+(3, 1, '2024-11-10 21:14:52', 57.07),
+(3, 1, '2024-11-10 22:14:52', 60.00),
+(3, 1, '2024-11-10 23:14:52', 62.04),
+(3, 1, '2024-11-11 00:14:52', 18.01),
+(3, 1, '2024-11-11 01:14:52', 20.44),
+(3, 1, '2024-11-11 02:14:52', 22.65),
+(3, 1, '2024-11-11 03:14:52', 24.92),
+(3, 1, '2024-11-11 04:14:52', 25.64),
+(3, 1, '2024-11-11 05:14:52', 26.56),
+(3, 1, '2024-11-11 06:14:52', 29.62),
+(3, 1, '2024-11-11 07:14:52', 31.58),
+(3, 1, '2024-11-11 08:14:52', 34.26),
+(3, 1, '2024-11-11 09:14:52', 36.29),
+(3, 1, '2024-11-11 10:14:52', 38.32),
+(3, 1, '2024-11-11 11:14:52', 41.25),
+(3, 1, '2024-11-11 12:14:52', 42.74),
+(3, 1, '2024-11-11 13:14:52', 44.83),
+(3, 1, '2024-11-11 14:14:52', 46.37),
+(3, 1, '2024-11-11 15:14:52', 47.94),
+(3, 1, '2024-11-11 16:14:52', 49.63),
+(3, 1, '2024-11-11 17:14:52', 51.85),
+(3, 1, '2024-11-11 18:14:52', 53.37),
+(3, 1, '2024-11-11 19:14:52', 56.63),
+(3, 1, '2024-11-11 20:14:52', 57.73),
+(3, 1, '2024-11-11 21:14:52', 59.55),
+(3, 1, '2024-11-11 22:14:52', 61.11),
+(3, 1, '2024-11-11 23:14:52', 64.55),
+(3, 1, '2024-11-12 00:14:52', 66.75),
+(3, 1, '2024-11-12 01:14:52', 69.62),
+(3, 1, '2024-11-12 02:14:52', 71.90),
+(3, 1, '2024-11-12 03:14:52', 72.55),
+(3, 1, '2024-11-12 04:14:52', 75.14),
+(3, 1, '2024-11-12 05:14:52', 77.85),
+(3, 1, '2024-11-12 06:14:52', 79.90),
+(3, 1, '2024-11-12 07:14:52', 83.12),
+(3, 1, '2024-11-12 08:14:52', 84.44),
+(3, 1, '2024-11-12 09:14:52', 85.93),
+(3, 1, '2024-11-12 10:14:52', 85.44),
+(3, 1, '2024-11-12 11:14:52', 88.36),
+(3, 1, '2024-11-12 12:14:52', 90.68),
+(3, 1, '2024-11-12 13:14:52', 90.99),
+(3, 1, '2024-11-12 14:14:52', 91.24),
+(3, 1, '2024-11-12 15:14:52', 92.36),
+(3, 1, '2024-11-12 16:14:52', 95.16),
+(3, 1, '2024-11-12 17:14:52', 96.86),
+(3, 1, '2024-11-12 18:14:52', 98.05),
+(3, 1, '2024-11-12 19:14:52', 99.05),
+(3, 1, '2024-11-12 20:14:52', 99.99),
+(3, 1, '2024-11-12 21:14:52', 100.00),
+(3, 1, '2024-11-12 22:14:52', 100.00),
+(3, 1, '2024-11-12 23:14:52', 100.00),
+(3, 1, '2024-11-13 00:14:52', 19.68),
+(3, 1, '2024-11-13 01:14:52', 22.25),
+(3, 1, '2024-11-13 02:14:52', 22.71),
+(3, 1, '2024-11-13 03:14:52', 25.54),
+(3, 1, '2024-11-13 04:14:52', 27.75),
+(3, 1, '2024-11-13 05:14:52', 29.60),
+(3, 1, '2024-11-13 06:14:52', 30.94),
+(3, 1, '2024-11-13 07:14:52', 32.47),
+(3, 1, '2024-11-13 08:14:52', 35.06),
+(3, 1, '2024-11-13 09:14:52', 36.94),
+(3, 1, '2024-11-13 10:14:52', 38.44),
+(3, 1, '2024-11-13 11:14:52', 40.90),
+(3, 1, '2024-11-13 12:14:52', 43.41),
+(3, 1, '2024-11-13 13:14:52', 44.16),
+(3, 1, '2024-11-13 14:14:52', 46.73),
+(3, 1, '2024-11-13 15:14:52', 51.24),
+(3, 1, '2024-11-13 16:14:52', 53.71),
+(3, 1, '2024-11-13 17:14:52', 54.01),
+(3, 1, '2024-11-13 18:14:52', 56.18),
+(3, 1, '2024-11-13 19:14:52', 56.35),
+(3, 1, '2024-11-13 20:14:52', 61.52),
+(3, 1, '2024-11-13 21:14:52', 65.76),
+(3, 1, '2024-11-13 22:14:52', 67.09),
+(3, 1, '2024-11-13 23:14:52', 66.84),
+(3, 1, '2024-11-14 00:14:52', 67.97),
+(3, 1, '2024-11-14 01:14:52', 69.36),
+(3, 1, '2024-11-14 02:14:52', 71.33),
+(3, 1, '2024-11-14 03:14:52', 73.84),
+(3, 1, '2024-11-14 04:14:52', 75.64),
+(3, 1, '2024-11-14 05:14:52', 76.73),
+(3, 1, '2024-11-14 06:14:52', 79.71),
+(3, 1, '2024-11-14 07:14:52', 81.47),
+(3, 1, '2024-11-14 08:14:52', 83.57),
+(3, 1, '2024-11-14 09:14:52', 86.12),
+(3, 1, '2024-11-14 10:14:52', 88.16),
+(3, 1, '2024-11-14 11:14:52', 90.21),
+(3, 1, '2024-11-14 12:14:52', 93.24),
+(3, 1, '2024-11-14 13:14:52', 95.39),
+(3, 1, '2024-11-14 14:14:52', 98.25),
+(3, 1, '2024-11-14 15:14:52', 100.00),
+(3, 1, '2024-11-14 16:14:52', 100.00),
+(3, 1, '2024-11-14 17:14:52', 100.00),
+(3, 1, '2024-11-14 18:14:52', 100.00),
+(3, 1, '2024-11-14 19:14:52', 100.00),
+(3, 2, '2024-11-07 19:14:52', 65.06),
+(3, 2, '2024-11-07 20:14:52', 67.47),
+(3, 2, '2024-11-07 21:14:52', 70.18),
+(3, 2, '2024-11-07 22:14:52', 72.69),
+(3, 2, '2024-11-07 23:14:52', 75.54),
+(3, 2, '2024-11-08 00:14:52', 78.93),
+(3, 2, '2024-11-08 01:14:52', 81.57),
+(3, 2, '2024-11-08 02:14:52', 83.41),
+(3, 2, '2024-11-08 03:14:52', 85.55),
+(3, 2, '2024-11-08 04:14:52', 88.76),
+(3, 2, '2024-11-08 05:14:52', 89.94),
+(3, 2, '2024-11-08 06:14:52', 92.31),
+(3, 2, '2024-11-08 07:14:52', 93.92),
+(3, 2, '2024-11-08 08:14:52', 95.95),
+(3, 2, '2024-11-08 09:14:52', 99.23),
+(3, 2, '2024-11-08 10:14:52', 100.00),
+(3, 2, '2024-11-08 11:14:52', 100.00),
+(3, 2, '2024-11-08 12:14:52', 100.00),
+(3, 2, '2024-11-08 13:14:52', 100.00),
+(3, 2, '2024-11-08 14:14:52', 100.00),
+(3, 2, '2024-11-08 15:14:52', 100.00),
+(3, 2, '2024-11-08 16:14:52', 100.00),
+(3, 2, '2024-11-08 17:14:52', 100.00),
+(3, 2, '2024-11-08 18:14:52', 100.00),
+(3, 2, '2024-11-08 19:14:52', 100.00),
+(3, 2, '2024-11-08 20:14:52', 100.00),
+(3, 2, '2024-11-08 21:14:52', 100.00),
+(3, 2, '2024-11-08 22:14:52', 100.00),
+(3, 2, '2024-11-08 23:14:52', 100.00),
+(3, 2, '2024-11-09 00:14:52', 100.00),
+(3, 2, '2024-11-09 01:14:52', 100.00),
+(3, 2, '2024-11-09 02:14:52', 100.00),
+(3, 2, '2024-11-09 03:14:52', 100.00),
+(3, 2, '2024-11-09 04:14:52', 100.00),
+(3, 2, '2024-11-09 05:14:52', 100.00),
+(3, 2, '2024-11-09 06:14:52', 100.00),
+(3, 2, '2024-11-09 07:14:52', 100.00),
+(3, 2, '2024-11-09 08:14:52', 100.00),
+(3, 2, '2024-11-09 09:14:52', 100.00),
+(3, 2, '2024-11-09 10:14:52', 100.00),
+(3, 2, '2024-11-09 11:14:52', 100.00),
+(3, 2, '2024-11-09 12:14:52', 100.00),
+(3, 2, '2024-11-09 13:14:52', 99.96),
+(3, 2, '2024-11-09 14:14:52', 100.00),
+(3, 2, '2024-11-09 15:14:52', 100.00),
+(3, 2, '2024-11-09 16:14:52', 100.00),
+(3, 2, '2024-11-09 17:14:52', 100.00),
+(3, 2, '2024-11-09 18:14:52', 100.00),
+(3, 2, '2024-11-09 19:14:52', 100.00),
+(3, 2, '2024-11-09 20:14:52', 100.00),
+(3, 2, '2024-11-09 21:14:52', 100.00),
+(3, 2, '2024-11-09 22:14:52', 100.00),
+(3, 2, '2024-11-09 23:14:52', 100.00),
+(3, 2, '2024-11-10 00:14:52', 100.00),
+(3, 2, '2024-11-10 01:14:52', 100.00),
+(3, 2, '2024-11-10 02:14:52', 100.00),
+(3, 2, '2024-11-10 03:14:52', 100.00),
+(3, 2, '2024-11-10 04:14:52', 100.00),
+(3, 2, '2024-11-10 05:14:52', 100.00),
+(3, 2, '2024-11-10 06:14:52', 100.00),
+(3, 2, '2024-11-10 07:14:52', 100.00),
+(3, 2, '2024-11-10 08:14:52', 100.00),
+(3, 2, '2024-11-10 09:14:52', 100.00),
+(3, 2, '2024-11-10 10:14:52', 100.00),
+(3, 2, '2024-11-10 11:14:52', 100.00),
+(3, 2, '2024-11-10 12:14:52', 100.00),
+(3, 2, '2024-11-10 13:14:52', 100.00),
+(3, 2, '2024-11-10 14:14:52', 100.00),
+(3, 2, '2024-11-10 15:14:52', 100.00),
+(3, 2, '2024-11-10 16:14:52', 100.00),
+(3, 2, '2024-11-10 17:14:52', 100.00),
+(3, 2, '2024-11-10 18:14:52', 100.00),
+(3, 2, '2024-11-10 19:14:52', 100.00),
+(3, 2, '2024-11-10 20:14:52', 100.00),
+(3, 2, '2024-11-10 21:14:52', 100.00),
+(3, 2, '2024-11-10 22:14:52', 100.00),
+(3, 2, '2024-11-10 23:14:52', 100.00),
+(3, 2, '2024-11-11 00:14:52', 100.00),
+(3, 2, '2024-11-11 01:14:52', 100.00),
+(3, 2, '2024-11-11 02:14:52', 100.00),
+(3, 2, '2024-11-11 03:14:52', 100.00),
+(3, 2, '2024-11-11 04:14:52', 100.00),
+(3, 2, '2024-11-11 05:14:52', 100.00),
+(3, 2, '2024-11-11 06:14:52', 100.00),
+(3, 2, '2024-11-11 07:14:52', 100.00),
+(3, 2, '2024-11-11 08:14:52', 100.00),
+(3, 2, '2024-11-11 09:14:52', 100.00),
+(3, 2, '2024-11-11 10:14:52', 100.00),
+(3, 2, '2024-11-11 11:14:52', 100.00),
+(3, 2, '2024-11-11 12:14:52', 100.00),
+(3, 2, '2024-11-11 13:14:52', 100.00),
+(3, 2, '2024-11-11 14:14:52', 100.00),
+(3, 2, '2024-11-11 15:14:52', 100.00),
+(3, 2, '2024-11-11 16:14:52', 100.00),
+(3, 2, '2024-11-11 17:14:52', 100.00),
+(3, 2, '2024-11-11 18:14:52', 100.00),
+(3, 2, '2024-11-11 19:14:52', 100.00),
+(3, 2, '2024-11-11 20:14:52', 100.00),
+(3, 2, '2024-11-11 21:14:52', 100.00),
+(3, 2, '2024-11-11 22:14:52', 100.00),
+(3, 2, '2024-11-11 23:14:52', 100.00),
+(3, 2, '2024-11-12 00:14:52', 23.40),
+(3, 2, '2024-11-12 01:14:52', 25.38),
+(3, 2, '2024-11-12 02:14:52', 27.90),
+(3, 2, '2024-11-12 03:14:52', 31.69),
+(3, 2, '2024-11-12 04:14:52', 32.81),
+(3, 2, '2024-11-12 05:14:52', 34.85),
+(3, 2, '2024-11-12 06:14:52', 36.58),
+(3, 2, '2024-11-12 07:14:52', 38.49),
+(3, 2, '2024-11-12 08:14:52', 40.31),
+(3, 2, '2024-11-12 09:14:52', 41.58),
+(3, 2, '2024-11-12 10:14:52', 43.78),
+(3, 2, '2024-11-12 11:14:52', 44.71),
+(3, 2, '2024-11-12 12:14:52', 47.70),
+(3, 2, '2024-11-12 13:14:52', 50.33),
+(3, 2, '2024-11-12 14:14:52', 51.83),
+(3, 2, '2024-11-12 15:14:52', 53.39),
+(3, 2, '2024-11-12 16:14:52', 55.66),
+(3, 2, '2024-11-12 17:14:52', 56.86),
+(3, 2, '2024-11-12 18:14:52', 60.68),
+(3, 2, '2024-11-12 19:14:52', 63.03),
+(3, 2, '2024-11-12 20:14:52', 65.43),
+(3, 2, '2024-11-12 21:14:52', 68.11),
+(3, 2, '2024-11-12 22:14:52', 69.53),
+(3, 2, '2024-11-12 23:14:52', 72.62),
+(3, 2, '2024-11-13 00:14:52', 13.65),
+(3, 2, '2024-11-13 01:14:52', 17.63),
+(3, 2, '2024-11-13 02:14:52', 20.98),
+(3, 2, '2024-11-13 03:14:52', 23.44),
+(3, 2, '2024-11-13 04:14:52', 24.86),
+(3, 2, '2024-11-13 05:14:52', 26.84),
+(3, 2, '2024-11-13 06:14:52', 28.62),
+(3, 2, '2024-11-13 07:14:52', 29.40),
+(3, 2, '2024-11-13 08:14:52', 32.05),
+(3, 2, '2024-11-13 09:14:52', 35.62),
+(3, 2, '2024-11-13 10:14:52', 37.32),
+(3, 2, '2024-11-13 11:14:52', 41.49),
+(3, 2, '2024-11-13 12:14:52', 41.93),
+(3, 2, '2024-11-13 13:14:52', 44.98),
+(3, 2, '2024-11-13 14:14:52', 48.65),
+(3, 2, '2024-11-13 15:14:52', 50.45),
+(3, 2, '2024-11-13 16:14:52', 52.26),
+(3, 2, '2024-11-13 17:14:52', 55.31),
+(3, 2, '2024-11-13 18:14:52', 57.81),
+(3, 2, '2024-11-13 19:14:52', 57.82),
+(3, 2, '2024-11-13 20:14:52', 58.97),
+(3, 2, '2024-11-13 21:14:52', 60.96),
+(3, 2, '2024-11-13 22:14:52', 61.59),
+(3, 2, '2024-11-13 23:14:52', 63.12),
+(3, 2, '2024-11-14 00:14:52', 65.60),
+(3, 2, '2024-11-14 01:14:52', 67.18),
+(3, 2, '2024-11-14 02:14:52', 70.31),
+(3, 2, '2024-11-14 03:14:52', 72.03),
+(3, 2, '2024-11-14 04:14:52', 75.42),
+(3, 2, '2024-11-14 05:14:52', 78.18);
+INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES
+(3, 2, '2024-11-14 06:14:52', 80.20),
+(3, 2, '2024-11-14 07:14:52', 83.78),
+(3, 2, '2024-11-14 08:14:52', 86.74),
+(3, 2, '2024-11-14 09:14:52', 91.68),
+(3, 2, '2024-11-14 10:14:52', 93.27),
+(3, 2, '2024-11-14 11:14:52', 95.35),
+(3, 2, '2024-11-14 12:14:52', 98.92),
+(3, 2, '2024-11-14 13:14:52', 99.38),
+(3, 2, '2024-11-14 14:14:52', 100.00),
+(3, 2, '2024-11-14 15:14:52', 100.00),
+(3, 2, '2024-11-14 16:14:52', 100.00),
+(3, 2, '2024-11-14 17:14:52', 100.00),
+(3, 2, '2024-11-14 18:14:52', 100.00),
+(3, 2, '2024-11-14 19:14:52', 99.72);
\ No newline at end of file
@@ -11,6 +11,7 @@ TIME_INTERVALS_PER_DAY = 24
 SEED = 42  # For reproducibility
 BIN_HEIGHT = 65  # The height of the bin (max fill level is 65)
 OUTPUT_FILE = 'bin_fill_levels_data.sql'
+BATCH_SIZE = 1000  # Rows per multi-row INSERT statement
 
 # Function to generate synthetic data with bin reset logic (twice a week)
 def generate_synthetic_data(bin_ids, waste_types, past_days, future_days, time_intervals_per_day, seed=None):
@@ -76,14 +77,20 @@ def generate_synthetic_data(bin_ids, waste_types, past_days, future_days, time_i
     return pd.DataFrame(data)
 
 # Function to generate SQL insert queries
-def generate_sql_insert_queries(df):
+def generate_sql_insert_queries(df, batch_size=BATCH_SIZE):
     """
-    Generates optimized SQL insert queries for the given DataFrame.
+    Generates multi-row SQL insert statements for the given DataFrame,
+    with up to ``batch_size`` rows per statement.
     """
+    values = (
+        "(" + df['bin_id'].astype(str) + ", " + df['waste_type'].astype(str) + ", '"
+        + df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S') + "', "
+        + df['fill_level'].map('{:.2f}'.format) + ")"
+    ).tolist()
     queries = [
-        f"INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES "
-        f"({row['bin_id']}, {row['waste_type']}, '{row['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}', {row['fill_level']:.2f});"
-        for _, row in df.iterrows()
+        "INSERT INTO bin_fill_levels (bin_id, waste_type, timestamp, fill_level) VALUES\n"
+        + ",\n".join(values[start:start + batch_size]) + ";"
+        for start in range(0, len(values), batch_size)
     ]
     return queries
 
@@ -0,0 +1,78 @@
+"""The bin monitor: checks fill levels, sends alerts and keeps the forecast caches fresh.
+
+``python monitor.py`` runs it in the foreground without the web app;
+``start_background_monitoring`` runs it on a thread inside a web worker.
+"""
+from app.engine import db, forecast_jobs
+from app.engine.leader import FileLeaderLock, Leadership, MySQLLeaderLock
+from app.engine.scheduler import BinScheduler
+from app.routes.dash_forecast import bin_forecasts, refresh_bin_forecasts
+from app.routes.forecast import forecasts, refresh_forecasts
+import threading
+import asyncio
+import logging
+import os
+from check_bin_fill_levels import check_bin_fill_levels
+# Seconds between leadership checks of the background monitor
+LEADER_RETRY_INTERVAL = float(os.getenv('MONITOR_LEADER_RETRY_INTERVAL', 5))
+# Set to 0 when a separate training process (train.py) keeps the forecasts fresh
+MONITOR_REFRESH_FORECASTS = os.getenv('MONITOR_REFRESH_FORECASTS', '1') == '1'
+
+logger = logging.getLogger(__name__)
+
+monitoring_thread = None
+
+async def monitor_bins(leadership):
+    scheduler = BinScheduler(
+        min_interval=float(os.getenv('MONITOR_MIN_INTERVAL', 10)),
+        max_interval=float(os.getenv('MONITOR_MAX_INTERVAL', 600))
+    )
+    try:
+        while True:
+            await asyncio.sleep(await _monitor_tick(leadership, scheduler))
+    finally:
+        # Hand over to another process right away instead of leaving it to wait for our lock to drop
+        leadership.resign()
+
+async def _monitor_tick(leadership, scheduler):
+    """Run one round of the monitor and return how many seconds to sleep before the next."""
+    try:
+        # Only the process holding the leader lock monitors; the others keep trying to take over
+        if not leadership.ensure():
+            return LEADER_RETRY_INTERVAL
+        # Only the leader warms forecasts, so a cold start costs one refresh, not one per worker
+        if MONITOR_REFRESH_FORECASTS:
+            warm_forecasts()
+        await check_bin_fill_levels(scheduler)
+    except Exception:
+        # A failed tick (e.g. the database is down) must not kill the monitor thread
+        logger.exception("Monitor tick failed")
+        return LEADER_RETRY_INTERVAL
+    # Sleep until the next bin is due instead of polling every bin on a fixed tick
+    return min(max(scheduler.seconds_until_next(), 1), LEADER_RETRY_INTERVAL * 6)
+
+def warm_forecasts():
+    """Queue a refresh of every forecast cache that is missing or stale; never blocks."""
+    if forecasts.is_stale():
+        forecast_jobs.submit('forecast', refresh_forecasts)
+    if bin_forecasts.is_stale():
+        forecast_jobs.submit('dash-forecast', refresh_bin_forecasts)
+
+def create_leadership():
+    if os.getenv('MONITOR_LEADER_LOCK', 'file') == 'mysql':
+        lock = MySQLLeaderLock(db)
+    else:
+        lock = FileLeaderLock(os.getenv('MONITOR_LOCK_FILE'))
+    return Leadership(lock)
+
+def start_background_monitoring():
+    """Start the monitor thread; across processes only the lock holder actually checks bins."""
+    global monitoring_thread
+    if monitoring_thread is not None:
+        return
+    leadership = create_leadership()
+    monitoring_thread = threading.Thread(target=lambda: asyncio.run(monitor_bins(leadership)), daemon=True)
+    monitoring_thread.start()
+
+if __name__ == '__main__':
+    asyncio.run(monitor_bins(create_leadership()))
@@ -0,0 +1,65 @@
+import errno
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from xgboost import XGBRegressor
+
+from app.engine.model_registry import ModelRegistry
+
+
+def small_model(**params):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({'hour': rng.integers(0, 24, 200), 'lag_1': rng.uniform(0, 60, 200)})
+    model = XGBRegressor(n_estimators=10, max_depth=3, learning_rate=0.01, **params)
+    return model.fit(X, X['lag_1'] * 0.9)
+
+
+def test_load_restores_hyperparameters(tmp_path):
+    ModelRegistry(str(tmp_path)).save('bin_1', small_model())
+
+    # A fresh registry, as after a process restart
+    model, metadata = ModelRegistry(str(tmp_path)).load('bin_1')
+    params = model.get_params()
+    assert (params['n_estimators'], params['max_depth'], params['learning_rate']) == (10, 3, 0.01)
+    assert metadata['version'] == 1
+
+
+def test_worker_thread_count_is_not_restored(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    registry.save('bin_1', small_model(n_jobs=1))
+    registry.save('bin_2', small_model())
+    # Versions saved before n_jobs was left out of the metadata
+    metadata_path = tmp_path / 'bin_2' / 'v1' / 'metadata.json'
+    metadata = json.loads(metadata_path.read_text())
+    metadata['hyperparameters']['n_jobs'] = 1
+    metadata_path.write_text(json.dumps(metadata))
+
+    reloaded = ModelRegistry(str(tmp_path))
+    model, metadata = reloaded.load('bin_1')
+    assert 'n_jobs' not in metadata['hyperparameters']
+    assert model.get_params()['n_jobs'] is None
+    assert reloaded.load('bin_2')[0].get_params()['n_jobs'] is None
+
+
+def test_save_numbers_versions_and_prunes(tmp_path):
+    registry = ModelRegistry(str(tmp_path), keep_versions=2)
+    model = small_model()
+    assert [registry.save('bin_1', model) for _ in range(4)] == [1, 2, 3, 4]
+    assert sorted(os.listdir(tmp_path / 'bin_1')) == ['LATEST', 'v3', 'v4']
+
+
+def test_save_raises_rename_errors_other_than_collisions(tmp_path, monkeypatch):
+    registry = ModelRegistry(str(tmp_path))
+    model = small_model()
+
+    def read_only(source, target):
+        raise OSError(errno.EROFS, 'Read-only file system')
+
+    monkeypatch.setattr(os, 'rename', read_only)
+    with pytest.raises(OSError):
+        registry.save('bin_1', model)
+    monkeypatch.undo()
+    assert not [name for name in os.listdir(tmp_path / 'bin_1') if name.startswith('.staging-')]
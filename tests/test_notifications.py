@@ -0,0 +1,152 @@
+"""SMSDispatcher and PhilSMSClient.deliver against a local stub of the SMS gateway."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.engine.PhilSMSClient import PhilSMSClient, SMSDeliveryError
+from app.engine.notifications import SMSDispatcher
+
+SUCCESS = (200, {'status': 'success', 'data': {'uid': 'abc', 'cost': 1}})
+
+
+class StubGateway:
+    """Answers each POST with the next scripted ``(status, body)``, repeating the last one."""
+
+    def __init__(self, responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                stub.requests.append(json.loads(body))
+                time.sleep(stub.delay)
+                status, payload = stub.responses[min(len(stub.requests), len(stub.responses)) - 1]
+                data = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client already gave up on a delayed reply
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/api/v3/sms/send'
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def gateway():
+    gateways = []
+
+    def start(responses, delay=0.0):
+        stub = StubGateway(responses, delay)
+        gateways.append(stub)
+        return stub
+
+    yield start
+    for stub in gateways:
+        stub.close()
+
+
+def client_for(stub, timeout=5):
+    return PhilSMSClient(token='token', sender_id='EBASURA', url=stub.url, timeout=timeout)
+
+
+def dispatch(stub, count=1, max_retries=3, timeout=5):
+    dispatcher = SMSDispatcher(client_for(stub, timeout), workers=1, max_retries=max_retries, backoff=0.01,
+                               rate_per_minute=60000)
+    for index in range(count):
+        assert dispatcher.submit('09170000000', f'message {index}')
+    dispatcher.stop(timeout=10)
+
+
+def test_deliver_returns_gateway_data(gateway):
+    stub = gateway([SUCCESS])
+    assert client_for(stub).deliver('09170000000', 'hello') == {'uid': 'abc', 'cost': 1}
+    assert stub.requests == [{'sender_id': 'EBASURA', 'recipient': '09170000000', 'message': 'hello'}]
+
+
+@pytest.mark.parametrize('status, retriable', [(503, True), (429, True), (400, False), (401, False)])
+def test_deliver_marks_http_errors(gateway, status, retriable):
+    stub = gateway([(status, {'status': 'error', 'message': 'nope'})])
+    with pytest.raises(SMSDeliveryError) as error:
+        client_for(stub).deliver('09170000000', 'hello')
+    assert error.value.retriable is retriable
+
+
+def test_deliver_rejects_unsuccessful_gateway_status(gateway):
+    stub = gateway([(200, {'status': 'error', 'message': 'invalid recipient'})])
+    with pytest.raises(SMSDeliveryError) as error:
+        client_for(stub).deliver('09170000000', 'hello')
+    assert not error.value.retriable
+
+
+def test_dispatcher_retries_503(gateway):
+    stub = gateway([(503, {'status': 'error'}), (503, {'status': 'error'}), SUCCESS])
+    dispatch(stub)
+    assert len(stub.requests) == 3
+
+
+def test_dispatcher_gives_up_after_max_retries(gateway):
+    stub = gateway([(503, {'status': 'error'})])
+    dispatch(stub, max_retries=2)
+    assert len(stub.requests) == 3
+
+
+def test_dispatcher_does_not_retry_4xx(gateway):
+    stub = gateway([(400, {'status': 'error', 'message': 'bad request'}), SUCCESS])
+    dispatch(stub)
+    assert len(stub.requests) == 1
+
+
+def test_dispatcher_does_not_retry_gateway_failure(gateway):
+    stub = gateway([(200, {'status': 'error', 'message': 'insufficient balance'}), SUCCESS])
+    dispatch(stub)
+    assert len(stub.requests) == 1
+
+
+def test_deliver_treats_read_timeout_as_final(gateway):
+    stub = gateway([SUCCESS], delay=0.5)
+    with pytest.raises(SMSDeliveryError) as error:
+        client_for(stub, timeout=0.1).deliver('09170000000', 'hello')
+    assert not error.value.retriable
+
+
+def test_deliver_retries_refused_connections():
+    with pytest.raises(SMSDeliveryError) as error:
+        PhilSMSClient(token='token', sender_id='EBASURA', url='http://127.0.0.1:9/api/v3/sms/send',
+                      timeout=5).deliver('09170000000', 'hello')
+    assert error.value.retriable
+
+
+def test_dispatcher_does_not_resend_after_read_timeout(gateway):
+    stub = gateway([SUCCESS], delay=0.5)
+    dispatch(stub, timeout=0.1)
+    assert len(stub.requests) == 1
+
+
+def test_submit_does_not_wait_for_the_gateway(gateway):
+    stub = gateway([SUCCESS], delay=0.5)
+    dispatcher = SMSDispatcher(client_for(stub), workers=1, rate_per_minute=60000)
+    started = time.perf_counter()
+    for index in range(3):
+        assert dispatcher.submit('09170000000', f'message {index}')
+    assert time.perf_counter() - started < 0.1
+    dispatcher.stop(timeout=10)
+    assert len(stub.requests) == 3
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from app.engine.model_registry import ModelRegistry
+from app.engine.training import continue_training, halving_candidates
+
+
+def categorical_series(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        'hour': rng.integers(0, 24, rows).astype('int8'),
+        'lag_1': rng.uniform(0, 60, rows).astype('float32'),
+        'bin_id': pd.Categorical(rng.integers(1, 4, rows), categories=[1, 2, 3]),
+    })
+    y = X['lag_1'] * 0.9 + X['bin_id'].cat.codes * 5
+    return X, y
+
+
+def test_continue_training_a_reloaded_categorical_model(tmp_path):
+    from xgboost import XGBRegressor
+
+    X, y = categorical_series()
+    model = XGBRegressor(n_estimators=50, max_depth=3, learning_rate=0.01, enable_categorical=True,
+                         tree_method='hist').fit(X, y)
+    ModelRegistry(str(tmp_path)).save('global', model)
+
+    # Reload in a fresh registry, as after a process restart
+    registry = ModelRegistry(str(tmp_path))
+    loaded, _ = registry.load('global')
+    X_new, y_new = categorical_series(rows=60, seed=1)
+    updated = continue_training(loaded, X_new, y_new, extra_trees=20, n_jobs=1)
+
+    assert updated.get_booster().num_boosted_rounds() == 70
+    # New trees follow the tuned parameters, not XGBoost's defaults (depth 6, eta 0.3)
+    depths = [len(line) - len(line.lstrip('\t'))
+              for tree in updated.get_booster().get_dump()[50:] for line in tree.splitlines()]
+    assert max(depths) <= 3
+
+    registry.save('global', updated)
+    reloaded, metadata = ModelRegistry(str(tmp_path)).load('global')
+    hyperparameters = metadata['hyperparameters']
+    assert hyperparameters['n_estimators'] == 50
+    assert (hyperparameters['max_depth'], hyperparameters['learning_rate']) == (3, 0.01)
+    assert hyperparameters['enable_categorical'] is True
+    assert len(halving_candidates(hyperparameters)) < len(halving_candidates(None))
+    np.testing.assert_allclose(reloaded.predict(X_new), updated.predict(X_new), rtol=1e-6)
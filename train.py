@@ -0,0 +1,15 @@
+"""Recompute both forecast caches once, e.g. from cron or a dedicated training container.
+
+Run the monitor with ``MONITOR_REFRESH_FORECASTS=0`` when this job owns
+forecast refreshes, so web and monitor processes never load the
+forecasting stack.
+"""
+import logging
+
+from app.routes.dash_forecast import refresh_bin_forecasts
+from app.routes.forecast import refresh_forecasts
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    logging.info("API forecast: %s", refresh_forecasts())
+    logging.info("Dashboard forecast: %s", refresh_bin_forecasts())
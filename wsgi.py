@@ -1,3 +1,6 @@
-from main import app
+from main import app, start_background_monitoring
+
+# Every worker starts a monitor thread; the leader lock lets exactly one of them run checks and warm forecasts
+start_background_monitoring()
 
 application = app